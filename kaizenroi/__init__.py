@@ -0,0 +1 @@
+"""KaizenROI analytics packages."""
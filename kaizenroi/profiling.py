@@ -0,0 +1,125 @@
+"""Named timing spans for Streamlit reruns, shown in a debug panel and logged as JSON lines."""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+
+# Query parameter that turns profiling on for a session, e.g. ?profile=1
+PROFILE_QUERY_FLAG = "profile"
+
+# Every profiled rerun is appended to this file as one JSON object per line
+PROFILE_LOG_PATH = os.environ.get("KAIZENROI_PROFILE_LOG", "kaizenroi_profile.jsonl")
+
+# Shared no-op context returned by span() when profiling is off
+_NULL_SPAN = nullcontext()
+
+# Profiler of the fragment rerunning on its own, if any; every span opened meanwhile is recorded there
+_fragment_profiler = ContextVar("fragment_profiler", default=None)
+
+def profiling_requested(query_params):
+    """True when the page URL carries the profile flag or KAIZENROI_PROFILE is set"""
+    if os.environ.get("KAIZENROI_PROFILE", "") not in ("", "0"):
+        return True
+    return query_params.get(PROFILE_QUERY_FLAG, "") not in ("", "0", "false")
+
+class Profiler:
+    """Collects nested timing spans for one rerun; a disabled profiler hands out a shared no-op span"""
+
+    def __init__(self, app, enabled=False, log_path=PROFILE_LOG_PATH):
+        self.app = app
+        self.enabled = enabled
+        self.log_path = log_path
+        self.spans = []
+        self.finished = False
+        self._depth = 0
+        self._started = time.perf_counter()
+        self._started_at = datetime.now().isoformat(timespec="milliseconds")
+
+    def _target(self):
+        """The profiler spans are recorded in: a fragment rerunning alone, else this one until it finishes"""
+        fragment_profiler = _fragment_profiler.get()
+        if fragment_profiler is not None:
+            return fragment_profiler
+        return None if self.finished else self
+
+    def span(self, name):
+        """Context manager timing the block under this name"""
+        if not self.enabled:
+            return _NULL_SPAN
+        target = self._target()
+        return _NULL_SPAN if target is None else target._span(name)
+
+    def fragment_span(self, name, st=None):
+        """Span for an st.fragment body: nested in the full rerun (or in an enclosing fragment), or, when the
+        fragment reruns alone after this profiler has finished, logged as a rerun of its own and, given the
+        streamlit module, shown in a panel at the end of the fragment"""
+        if not self.enabled:
+            return _NULL_SPAN
+        target = self._target()
+        if target is not None:
+            return target._span(name)
+        return self._fragment_rerun(name, st)
+
+    @contextmanager
+    def _fragment_rerun(self, name, st):
+        fragment_profiler = Profiler(f"{self.app}:{name}", enabled=True, log_path=self.log_path)
+        token = _fragment_profiler.set(fragment_profiler)
+        try:
+            with fragment_profiler._span(name):
+                yield
+        finally:
+            _fragment_profiler.reset(token)
+            # A fragment may only write inside its own body, so its panel goes there rather than the sidebar
+            fragment_profiler.finish(st, container=st)
+
+    @contextmanager
+    def _span(self, name):
+        record = {"name": name, "depth": self._depth, "start_ms": (time.perf_counter() - self._started) * 1000, "ms": None}
+        self.spans.append(record)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["ms"] = (time.perf_counter() - start) * 1000
+            self._depth -= 1
+
+    def report(self):
+        """The rerun as a JSON-ready dict; spans still open (e.g. cut short by st.rerun) have ms None"""
+        return {
+            "app": self.app,
+            "started": self._started_at,
+            "total_ms": (time.perf_counter() - self._started) * 1000,
+            "spans": self.spans,
+        }
+
+    def finish(self, st=None, container=None):
+        """Write the rerun to the log and, given the streamlit module, show it in a collapsed panel in the
+        sidebar (or in container)"""
+
+        if not self.enabled:
+            return
+        self.finished = True
+        report = self.report()
+
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(report) + "\n")
+            except OSError:
+                pass  # Profiling must never break the app
+
+        if st is not None:
+            title = "Rerun timings" if container is None else "Fragment rerun timings"
+            with (container or st.sidebar).expander(f"⏱ {title} ({report['total_ms']:.0f} ms)", expanded=False):
+                st.table([
+                    {"Span": "\u2003" * span["depth"] + span["name"],
+                     "Start (ms)": f"{span['start_ms']:.1f}",
+                     "Duration (ms)": "-" if span["ms"] is None else f"{span['ms']:.1f}"}
+                    for span in report["spans"]
+                ])
+                if self.log_path:
+                    st.caption(f"Logged to {self.log_path}")
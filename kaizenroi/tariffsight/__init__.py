@@ -0,0 +1,146 @@
+"""TariffSight cost model, importable without Streamlit or Plotly.
+
+The Streamlit app (the ``TariffSight`` script) and the ``tariffsight``
+console command are both thin layers over this package.
+"""
+
+import importlib
+
+# Public names by the submodule that defines them. Submodules are imported on first use, so importing the
+# package (or the tariffsight command) does not load pandas or modules a caller never touches.
+_SUBMODULE_EXPORTS = {
+    "cache": ("ResultCache", "normalize_cache_key"),
+    "catalog": ("catalog_template_csv", "export_catalog_file", "iter_catalog_chunks", "price_catalog_file"),
+    "currency": (
+        "CURRENCY_RATES_PATH", "CURRENCY_SYMBOLS", "CurrencyRates", "convert_catalog_currency", "format_money",
+        "load_currency_rates",
+    ),
+    "defaults": (
+        "BULK_CHUNK_ROWS", "DEMAND_MODELS", "EXPORT_FORMATS", "MONEY_SCALES", "ROLLUP_DIMENSIONS", "ROUNDING_MODES",
+        "SERVICE_HOST", "SERVICE_PORT", "SHOCK_DIMENSIONS", "STORE_EXTENSION",
+    ),
+    "duties": ("DEFAULT_DUTY_RULES", "DUTY_RULES_PATH", "DutySchedule", "load_duty_schedule"),
+    "export": ("ExportWriter", "export_bytes", "export_frame", "export_frames"),
+    "history": ("HISTORY_DB_PATH", "CalculationHistory"),
+    "hs_index": ("TARIFF_SCHEDULE_PATH", "TariffIndex", "fill_catalog_tariffs", "load_tariff_index"),
+    "model": (
+        "CATALOG_COLUMNS", "CATALOG_TEXT_COLUMNS", "COST_COMPONENTS", "calculate_landed_cost",
+        "calculate_landed_cost_batch", "generate_price_scenarios", "generate_sensitivity_grid",
+        "generate_tariff_scenarios", "price_catalog", "solve_catalog_targets", "solve_pricing_targets",
+    ),
+    "money": ("ExactMoney", "divide_rounded"),
+    "pricing": ("PRICING_COLUMNS", "demand_at_price", "optimize_catalog_prices", "optimize_price"),
+    "rollup": ("ROLLUP_UNKNOWN", "PortfolioRollup"),
+    "sensitivity": ("SENSITIVITY_INPUTS", "SensitivityTornado", "catalog_sensitivity", "landed_cost_sensitivity"),
+    "service": ("PricingService", "load_test", "run_service"),
+    "shipment": (
+        "SHIPMENT_CANDIDATES", "SHIPMENT_COLUMNS", "optimize_catalog_shipments", "optimize_shipment_size",
+        "shipment_unit_cost",
+    ),
+    "shock": ("ShockBaseline",),
+    "simulation": ("DISTRIBUTIONS", "SIMULATION_CHUNK_DRAWS", "simulate_landed_cost", "spread_distribution"),
+    "store": ("CATALOG_STORE_PATH", "CatalogStore", "open_catalog_store"),
+    "sweep": ("SWEEP_COLUMNS", "sweep_catalog", "sweep_scenario_skus"),
+    "timeline": (
+        "TARIFF_TIMELINE_PATH", "TariffTimeline", "apply_tariff_timeline", "load_tariff_timeline", "reprice_history",
+    ),
+}
+
+_EXPORTS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = [
+    "BULK_CHUNK_ROWS",
+    "CATALOG_COLUMNS",
+    "CATALOG_STORE_PATH",
+    "CATALOG_TEXT_COLUMNS",
+    "COST_COMPONENTS",
+    "CURRENCY_RATES_PATH",
+    "CURRENCY_SYMBOLS",
+    "DEFAULT_DUTY_RULES",
+    "DEMAND_MODELS",
+    "DISTRIBUTIONS",
+    "DUTY_RULES_PATH",
+    "EXPORT_FORMATS",
+    "HISTORY_DB_PATH",
+    "MONEY_SCALES",
+    "PRICING_COLUMNS",
+    "ROLLUP_DIMENSIONS",
+    "ROLLUP_UNKNOWN",
+    "ROUNDING_MODES",
+    "SENSITIVITY_INPUTS",
+    "SERVICE_HOST",
+    "SERVICE_PORT",
+    "SHIPMENT_CANDIDATES",
+    "SHIPMENT_COLUMNS",
+    "SHOCK_DIMENSIONS",
+    "SIMULATION_CHUNK_DRAWS",
+    "STORE_EXTENSION",
+    "SWEEP_COLUMNS",
+    "TARIFF_SCHEDULE_PATH",
+    "TARIFF_TIMELINE_PATH",
+    "CalculationHistory",
+    "CatalogStore",
+    "CurrencyRates",
+    "DutySchedule",
+    "ExactMoney",
+    "ExportWriter",
+    "PortfolioRollup",
+    "PricingService",
+    "ResultCache",
+    "SensitivityTornado",
+    "ShockBaseline",
+    "TariffIndex",
+    "TariffTimeline",
+    "apply_tariff_timeline",
+    "calculate_landed_cost",
+    "calculate_landed_cost_batch",
+    "catalog_sensitivity",
+    "catalog_template_csv",
+    "convert_catalog_currency",
+    "demand_at_price",
+    "divide_rounded",
+    "export_bytes",
+    "export_catalog_file",
+    "export_frame",
+    "export_frames",
+    "fill_catalog_tariffs",
+    "format_money",
+    "generate_price_scenarios",
+    "generate_sensitivity_grid",
+    "generate_tariff_scenarios",
+    "iter_catalog_chunks",
+    "landed_cost_sensitivity",
+    "load_currency_rates",
+    "load_duty_schedule",
+    "load_test",
+    "load_tariff_index",
+    "load_tariff_timeline",
+    "normalize_cache_key",
+    "open_catalog_store",
+    "optimize_catalog_prices",
+    "optimize_catalog_shipments",
+    "optimize_price",
+    "optimize_shipment_size",
+    "price_catalog",
+    "price_catalog_file",
+    "reprice_history",
+    "run_service",
+    "shipment_unit_cost",
+    "simulate_landed_cost",
+    "solve_catalog_targets",
+    "solve_pricing_targets",
+    "spread_distribution",
+    "sweep_catalog",
+    "sweep_scenario_skus",
+]
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,143 @@
+"""Benchmarks for the pricing kernels, with a JSON baseline and regression check."""
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from .defaults import BENCH_BASELINE_PATH
+from .model import (
+    calculate_landed_cost,
+    calculate_landed_cost_batch,
+    generate_price_scenarios,
+    generate_sensitivity_grid,
+    generate_tariff_scenarios,
+    solve_pricing_targets,
+)
+
+# Runs faster than this, or peaks smaller than this, are dominated by noise and never count as regressions
+BENCH_MIN_SECONDS = 0.001
+BENCH_MIN_BYTES = 1 << 20
+
+def _catalog_arrays(n):
+    rng = np.random.default_rng(0)
+    cost = rng.uniform(5, 200, n)
+    return {
+        "msrp": cost * rng.uniform(1.2, 3.0, n),
+        "cost_to_produce": cost,
+        "tariff_rate": rng.uniform(0, 150, n),
+        "shipping_cost": rng.uniform(0, 5000, n),
+        "customs_fee": rng.uniform(0, 500, n),
+        "units_per_shipment": rng.integers(1, 5000, n).astype(np.float64),
+    }
+
+def _scalar_case(n):
+    # Cycle through a fixed pool of inputs so 10**7 calls do not need 10**7 Python tuples
+    inputs = _catalog_arrays(min(n, 1000))
+    rows = list(zip(*(inputs[name].tolist() for name in ("msrp", "cost_to_produce", "tariff_rate"))))
+
+    def run():
+        for i in range(n):
+            calculate_landed_cost(*rows[i % len(rows)], shipping_cost=1000, customs_fee=250, units_per_shipment=1000)
+    return run
+
+def _batch_case(n):
+    inputs = _catalog_arrays(n)
+    return lambda: calculate_landed_cost_batch(**inputs)
+
+def _solver_case(n):
+    inputs = _catalog_arrays(n)
+    return lambda: solve_pricing_targets(**inputs)
+
+def _tariff_sweep_case(n):
+    return lambda: generate_tariff_scenarios(100, 50, 0, 500, n, 1000, 0, 250, 150, 0, 1000)
+
+def _price_sweep_case(n):
+    return lambda: generate_price_scenarios(25, 50, 0.5, 5.0, n, 1000, 0, 250, 150, 0, 1000)
+
+def _grid_case(n):
+    side = max(2, int(round(n ** 0.5)))
+    return lambda: generate_sensitivity_grid(50, 0, 500, side, 10, 400, side, 1000, 0, 250, 150, 0, 1000)
+
+# Kernel name -> builder taking the input size and returning a zero-argument callable to time
+BENCH_KERNELS = {
+    "landed_cost_scalar": _scalar_case,
+    "landed_cost_batch": _batch_case,
+    "pricing_solver": _solver_case,
+    "tariff_scenarios": _tariff_sweep_case,
+    "price_scenarios": _price_sweep_case,
+    "sensitivity_grid": _grid_case,
+}
+
+def run_case(kernel, n, repeat=3):
+    """Best wall time over repeat runs, plus peak traced memory of one extra run"""
+
+    fn = BENCH_KERNELS[kernel](n)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    # Traced separately: tracemalloc slows allocation-heavy code down too much to time under it
+    tracemalloc.start()
+    try:
+        fn()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"kernel": kernel, "size": n, "seconds": best, "throughput": n / best if best > 0 else float("inf"),
+            "peak_bytes": peak_bytes}
+
+def run_benchmarks(kernels=None, min_exponent=1, max_exponent=7, repeat=3, on_result=None):
+    """Run every kernel at 10**min_exponent .. 10**max_exponent inputs; returns a JSON-ready report"""
+
+    unknown = sorted(set(kernels or ()) - set(BENCH_KERNELS))
+    if unknown:
+        raise ValueError(f"Unknown kernels: {', '.join(unknown)}; choose from {', '.join(BENCH_KERNELS)}")
+
+    results = {}
+    for kernel in kernels or BENCH_KERNELS:
+        for exponent in range(min_exponent, max_exponent + 1):
+            result = run_case(kernel, 10 ** exponent, repeat)
+            results[f"{kernel}/{10 ** exponent}"] = result
+            if on_result is not None:
+                on_result(result)
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+def compare_to_baseline(report, baseline, threshold=0.2, min_seconds=BENCH_MIN_SECONDS, min_bytes=BENCH_MIN_BYTES):
+    """Cases that got slower, or used more memory, than the baseline by more than threshold (a fraction)"""
+
+    regressions = []
+    for key, current in report["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        if current["seconds"] > min_seconds and current["seconds"] > previous["seconds"] * (1 + threshold):
+            regressions.append((key, "seconds", previous["seconds"], current["seconds"]))
+        if current["peak_bytes"] > min_bytes and current["peak_bytes"] > previous["peak_bytes"] * (1 + threshold):
+            regressions.append((key, "peak_bytes", previous["peak_bytes"], current["peak_bytes"]))
+    return regressions
+
+def load_baseline(path=BENCH_BASELINE_PATH):
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+def save_baseline(report, path=BENCH_BASELINE_PATH):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+        fh.write("\n")
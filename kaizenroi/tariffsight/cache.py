@@ -0,0 +1,111 @@
+"""Size-bounded LRU result cache with a time-to-live."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Result cache limits: entries expire after CACHE_TTL_SECONDS, least recently used entries are evicted first
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_TTL_SECONDS = 3600
+
+def _estimate_nbytes(value):
+    """Approximate memory held by a cached value"""
+    
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(index=True)))
+    if isinstance(value, dict):
+        return sum(_estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_nbytes(v) for v in value)
+    if hasattr(value, "to_plotly_json"):
+        # A Plotly figure is a thin object over its trace arrays; its JSON length is measured once, on insert
+        return len(value.to_json())
+    return sys.getsizeof(value)
+
+class ResultCache:
+    """Thread-safe LRU cache with a time-to-live, shared by every session on the server"""
+    
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES, ttl_seconds=CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, nbytes, value)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, calling compute() and storing its result on a miss"""
+        
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+        
+        # Compute outside the lock so other sessions are not blocked
+        value = compute()
+        nbytes = _estimate_nbytes(value)
+        if nbytes > self.max_bytes:
+            return value
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, nbytes, value)
+            self._nbytes += nbytes
+            while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return value
+    
+    def _remove(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._nbytes -= nbytes
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+    
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+def normalize_cache_key(name, args):
+    """Hashable cache key for a call, with numbers normalized so 25 and 25.0 share an entry"""
+    
+    normalized = []
+    for value in args:
+        if isinstance(value, (bool, np.bool_)):
+            normalized.append(bool(value))
+        elif isinstance(value, (int, float, np.integer, np.floating)):
+            normalized.append(float(value))
+        else:
+            normalized.append(value)
+    return (name, tuple(normalized))
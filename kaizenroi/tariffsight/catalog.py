@@ -0,0 +1,137 @@
+"""Chunked pricing of catalog files too large to load at once."""
+
+import pandas as pd
+
+from .currency import convert_catalog_currency
+from .defaults import BULK_CHUNK_ROWS, STORE_EXTENSION
+from .export import ExportWriter
+from .hs_index import fill_catalog_tariffs
+from .model import CATALOG_TEXT_COLUMNS, price_catalog
+from .timeline import apply_tariff_timeline
+
+def iter_catalog_chunks(source, file_name, chunk_rows=BULK_CHUNK_ROWS):
+    """Yield (chunk DataFrame, fraction of the file read) from a CSV, Parquet or catalog store file"""
+    
+    if file_name.lower().endswith(STORE_EXTENSION):
+        import pyarrow as pa
+        
+        # Record batches are read one at a time, so an uploaded store never needs to be loaded whole
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            for start in range(0, batch.num_rows, chunk_rows):
+                fraction = (i + min(start + chunk_rows, batch.num_rows) / max(batch.num_rows, 1)) / reader.num_record_batches
+                yield batch.slice(start, chunk_rows).to_pandas(), fraction
+    elif file_name.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(source)
+        total_rows = max(parquet_file.metadata.num_rows, 1)
+        rows_read = 0
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+            rows_read += batch.num_rows
+            yield batch.to_pandas(), rows_read / total_rows
+    else:
+        # Use the read position in the file as the progress measure for CSV
+        source.seek(0, 2)
+        total_bytes = max(source.tell(), 1)
+        source.seek(0)
+        for chunk in pd.read_csv(source, chunksize=chunk_rows, dtype=dict.fromkeys(CATALOG_TEXT_COLUMNS, str)):
+            yield chunk, min(source.tell() / total_bytes, 1.0)
+
+def price_catalog_file(source, file_name, output, chunk_rows=BULK_CHUNK_ROWS, on_progress=None, tariff_index=None,
+                       tariff_timeline=None, currency_rates=None, currency=None, duty_schedule=None, rollup=None,
+                       output_format="csv", money=None, sensitivity=None):
+    """Price a catalog file chunk by chunk, streaming the enriched rows to a path or open stream.
+    
+    output_format is csv, parquet or xlsx (see ExportWriter); CSV also accepts an open text stream.
+    
+    With a tariff_timeline, rows with a sku and an arrival_date and no tariff_rate get the rate in effect on
+    that date. With a tariff_index, rows still without a rate get it from the HS code schedule.
+    With currency_rates and a currency, costs and prices in cost_currency / price_currency columns are
+    converted into that currency first. With a duty_schedule, duties come from its stacked rules
+    instead of the single tariff_rate. A PortfolioRollup passed as rollup, and a SensitivityTornado passed as
+    sensitivity, are fed every priced chunk.
+    With money (an ExactMoney), rows are priced in integer minor units and the profit and tariff totals are exact.
+    """
+    
+    summary = {"rows": 0, "unprofitable": 0, "total_profit": 0.0, "total_tariff": 0.0, "margin_sum": 0.0,
+               "margin_rows": 0, "timeline_rates": 0, "schedule_rates": 0, "missing_rates": 0}
+    preview = None
+    exact_totals = {"total_profit": 0, "total_tariff": 0}
+    
+    with ExportWriter(output, output_format) as writer:
+        for chunk, fraction in iter_catalog_chunks(source, file_name, chunk_rows):
+            if currency_rates is not None and currency:
+                chunk = convert_catalog_currency(chunk, currency_rates, currency)
+            if tariff_timeline is not None and {"sku", "arrival_date"} <= set(chunk.columns):
+                had_rate = chunk["tariff_rate"].notna().sum() if "tariff_rate" in chunk.columns else 0
+                chunk = apply_tariff_timeline(chunk, tariff_timeline)
+                summary["timeline_rates"] += int(chunk["tariff_rate"].notna().sum() - had_rate)
+            if tariff_index is not None and "hs_code" in chunk.columns:
+                chunk = fill_catalog_tariffs(chunk, tariff_index)
+                summary["schedule_rates"] += int((chunk["tariff_match_digits"] > 0).sum())
+            priced = price_catalog(chunk, duty_schedule, money)
+            if rollup is not None:
+                rollup.add(priced)
+            if sensitivity is not None:
+                sensitivity.add(priced)
+            if "tariff_rate" in priced.columns:
+                summary["missing_rates"] += int(priced["tariff_rate"].isna().sum())
+            writer.write(priced)
+            
+            # Keep running totals only, so memory does not grow with the catalog
+            summary["rows"] += len(priced)
+            summary["unprofitable"] += int((priced["profit"] < 0).sum())
+            if money is None:
+                summary["total_profit"] += float(priced["profit"].sum())
+                summary["total_tariff"] += float(priced["tariff_amount"].sum())
+            else:
+                exact_totals["total_profit"] += money.total(priced["profit"])
+                exact_totals["total_tariff"] += money.total(priced["tariff_amount"])
+            # Rows without a margin (a missing input) are left out of the average, not counted as 0%
+            summary["margin_sum"] += float(priced["margin_percentage"].sum())
+            summary["margin_rows"] += int(priced["margin_percentage"].count())
+            if preview is None:
+                preview = priced.head(100)
+            
+            if on_progress is not None:
+                on_progress(fraction)
+    
+    if summary["rows"] == 0:
+        raise ValueError("Catalog contains no rows")
+    
+    if money is not None:
+        summary.update({key: total / money.scale for key, total in exact_totals.items()})
+    summary["average_margin"] = (summary["margin_sum"] / summary["margin_rows"] if summary["margin_rows"]
+                                 else float("nan"))
+    summary["preview"] = preview
+    return summary
+
+def export_catalog_file(source, file_name, output, output_format=None, chunk_rows=BULK_CHUNK_ROWS, on_progress=None):
+    """Re-write a catalog file (e.g. a priced CSV) as CSV, Parquet or Excel a chunk at a time; returns the row count"""
+    
+    with ExportWriter(output, output_format) as writer:
+        for chunk, fraction in iter_catalog_chunks(source, file_name, chunk_rows):
+            writer.write(chunk)
+            if on_progress is not None:
+                on_progress(fraction)
+    return writer.rows
+
+def catalog_template_csv():
+    """Return a one-row example catalog with every supported column"""
+    
+    template = pd.DataFrame([{
+        "sku": "SKU-001",
+        "product": "Example Product",
+        "msrp": 100.0,
+        "cost_to_produce": 50.0,
+        "tariff_rate": 25.0,
+        "shipping_cost": 1000.0,
+        "storage_cost": 0.0,
+        "customs_fee": 250.0,
+        "broker_fee": 150.0,
+        "other_costs": 0.0,
+        "units_per_shipment": 1000,
+    }])
+    return template.to_csv(index=False)
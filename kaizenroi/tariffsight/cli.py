@@ -0,0 +1,488 @@
+"""Command line interface for scenario sweeps and catalog pricing without the Streamlit UI."""
+
+import argparse
+import json
+import os
+import sys
+
+from .defaults import (
+    BENCH_BASELINE_PATH,
+    BULK_CHUNK_ROWS,
+    DEMAND_MODELS,
+    EXPORT_FORMATS,
+    MONEY_SCALES,
+    ROLLUP_DIMENSIONS,
+    ROUNDING_MODES,
+    SERVICE_BATCH_WINDOW,
+    SERVICE_HOST,
+    SERVICE_MAX_BATCH,
+    SERVICE_PORT,
+    SHOCK_DIMENSIONS,
+    STORE_EXTENSION,
+)
+
+# Each command imports the modules it needs in its handler, so the parser (and --help) loads no numpy, pandas
+# or asyncio
+
+# Per-shipment cost options shared by the sweep commands, with the model defaults
+FEE_OPTIONS = {
+    "shipping_cost": 0.0,
+    "storage_cost": 0.0,
+    "customs_fee": 0.0,
+    "broker_fee": 0.0,
+    "other_costs": 0.0,
+    "units_per_shipment": 1.0,
+}
+
+# --rounding choices: ROUND_HALF_EVEN is given as half-even
+ROUNDING_CHOICES = {mode[len("ROUND_"):].lower().replace("_", "-"): mode for mode in ROUNDING_MODES}
+
+def _add_fee_options(parser):
+    group = parser.add_argument_group("per-shipment costs")
+    for dest in FEE_OPTIONS:
+        group.add_argument(f"--{dest.replace('_', '-')}", dest=dest, type=float)
+
+def _add_output_options(parser):
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=["json", *EXPORT_FORMATS],
+                        help="output format (default: from the output file extension, else csv)")
+
+def _apply_params(args, defaults):
+    """Fill options not given on the command line from --params, then from defaults"""
+
+    params = {}
+    if args.params:
+        with open(args.params, "r", encoding="utf-8") as fh:
+            params = json.load(fh)
+        if not isinstance(params, dict):
+            raise ValueError(f"{args.params} must contain a JSON object")
+
+    for dest, default in defaults.items():
+        if getattr(args, dest) is None:
+            value = params.get(dest, default)
+            if value is None:
+                raise ValueError(f"--{dest.replace('_', '-')} is required (on the command line or in --params)")
+            setattr(args, dest, value)
+
+def _output_target(output, fmt=None):
+    """(target, format) for an -o value: stdout for "-" (text formats only), else the path"""
+
+    from .export import export_format
+
+    if output == "-":
+        fmt = fmt or "csv"
+        if fmt not in ("csv", "json"):
+            raise ValueError(f"{fmt} output needs --output FILE")
+        return sys.stdout, fmt
+    if fmt is None:
+        fmt = "json" if output.lower().endswith(".json") else export_format(output)
+    return output, fmt
+
+def _write_frame(df, output, fmt):
+    from .export import export_frame
+
+    target, fmt = _output_target(output, fmt)
+    if fmt == "json":
+        df.to_json(target, orient="records", indent=2)
+        if target is sys.stdout:
+            sys.stdout.write("\n")
+    else:
+        export_frame(df, target, fmt)
+
+def _run_tariff_sweep(args):
+    from .model import generate_tariff_scenarios
+
+    _apply_params(args, dict({"msrp": None, "cost": None, "min_tariff": 0.0, "max_tariff": 100.0, "steps": 10}, **FEE_OPTIONS))
+    scenarios_df = generate_tariff_scenarios(
+        args.msrp, args.cost, args.min_tariff, args.max_tariff, int(args.steps),
+        args.shipping_cost, args.storage_cost, args.customs_fee,
+        args.broker_fee, args.other_costs, args.units_per_shipment
+    )
+    _write_frame(scenarios_df, args.output, args.format)
+
+def _run_price_sweep(args):
+    from .model import generate_price_scenarios
+
+    _apply_params(args, dict({"tariff": None, "cost": None, "min_factor": 0.8, "max_factor": 2.0, "steps": 10}, **FEE_OPTIONS))
+    scenarios_df = generate_price_scenarios(
+        args.tariff, args.cost, args.min_factor, args.max_factor, int(args.steps),
+        args.shipping_cost, args.storage_cost, args.customs_fee,
+        args.broker_fee, args.other_costs, args.units_per_shipment
+    )
+    _write_frame(scenarios_df, args.output, args.format)
+
+def _run_price_catalog(args):
+    from .catalog import price_catalog_file
+    from .currency import load_currency_rates
+    from .duties import load_duty_schedule
+    from .hs_index import load_tariff_index
+    from .money import ExactMoney
+    from .rollup import PortfolioRollup
+    from .timeline import load_tariff_timeline
+
+    tariff_index = load_tariff_index(args.tariff_schedule) if args.tariff_schedule else None
+    tariff_timeline = load_tariff_timeline(args.tariff_timeline) if args.tariff_timeline else None
+    currency_rates = load_currency_rates(args.currency_rates) if args.currency_rates else None
+    duty_schedule = load_duty_schedule(args.duty_rules) if args.duty_rules else None
+    if args.rollup_by and not args.rollup_output:
+        raise ValueError("--rollup-by needs --rollup-output FILE")
+    rollup = PortfolioRollup() if args.rollup_by else None
+    money = ExactMoney(args.exact_money, ROUNDING_CHOICES[args.rounding]) if args.exact_money else None
+    output, output_format = _output_target(args.output)
+    if output_format == "json":
+        raise ValueError("Catalogs are written as csv, parquet or xlsx")
+    with open(args.catalog, "rb") as source:
+        summary = price_catalog_file(source, args.catalog, output, args.chunk_rows, tariff_index=tariff_index,
+                                     tariff_timeline=tariff_timeline, currency_rates=currency_rates,
+                                     currency=args.currency, duty_schedule=duty_schedule, rollup=rollup,
+                                     output_format=output_format, money=money)
+
+    print(f"Priced {summary['rows']:,} rows: {summary['unprofitable']:,} unprofitable, "
+          f"average margin {summary['average_margin']:.1f}%", file=sys.stderr)
+    if tariff_timeline is not None:
+        print(f"{summary['timeline_rates']:,} tariff rates filled from the timeline", file=sys.stderr)
+    if tariff_index is not None:
+        print(f"{summary['schedule_rates']:,} tariff rates filled from the schedule", file=sys.stderr)
+    if tariff_index is not None or tariff_timeline is not None:
+        print(f"{summary['missing_rates']:,} rows still without a rate", file=sys.stderr)
+    if rollup is not None:
+        _write_frame(rollup.totals(args.rollup_by), args.rollup_output, None)
+
+def _run_optimize_shipments(args):
+    from .catalog import iter_catalog_chunks
+    from .export import ExportWriter
+    from .shipment import optimize_catalog_shipments
+
+    rows = savings = 0
+    output, output_format = _output_target(args.output)
+    if output_format == "json":
+        raise ValueError("Catalogs are written as csv, parquet or xlsx")
+    with open(args.catalog, "rb") as source, ExportWriter(output, output_format) as writer:
+        for chunk, _ in iter_catalog_chunks(source, args.catalog, args.chunk_rows):
+            optimized = optimize_catalog_shipments(chunk, args.max_periods)
+            writer.write(optimized)
+            rows += len(optimized)
+            if "savings_per_unit" in optimized.columns:
+                savings += int((optimized["savings_per_unit"] > 0.005).sum())
+
+    print(f"Optimized shipment sizes for {rows:,} SKUs; {savings:,} would save more than a cent per unit",
+          file=sys.stderr)
+
+def _run_optimize_prices(args):
+    import numpy as np
+
+    from .catalog import iter_catalog_chunks
+    from .duties import load_duty_schedule
+    from .export import ExportWriter
+    from .pricing import optimize_catalog_prices
+
+    rows = raised = lowered = 0
+    gain = 0.0
+    duty_schedule = load_duty_schedule(args.duty_rules) if args.duty_rules else None
+    output, output_format = _output_target(args.output)
+    if output_format == "json":
+        raise ValueError("Catalogs are written as csv, parquet or xlsx")
+    with open(args.catalog, "rb") as source, ExportWriter(output, output_format) as writer:
+        for chunk, _ in iter_catalog_chunks(source, args.catalog, args.chunk_rows):
+            optimized = optimize_catalog_prices(chunk, args.elasticity, args.charm, args.demand_model, duty_schedule)
+            writer.write(optimized)
+            rows += len(optimized)
+            raised += int((optimized["price_change_pct"] > 0).sum())
+            lowered += int((optimized["price_change_pct"] < 0).sum())
+            gain += float(np.nansum(optimized["profit_gain"]))
+
+    print(f"Optimized prices for {rows:,} SKUs: {raised:,} up, {lowered:,} down, "
+          f"expected profit {gain:+,.2f} per period", file=sys.stderr)
+
+def _run_sensitivity(args):
+    from .catalog import iter_catalog_chunks
+    from .export import ExportWriter
+    from .sensitivity import SensitivityTornado, catalog_sensitivity
+
+    tornado = SensitivityTornado(args.swing)
+    with open(args.catalog, "rb") as source:
+        if args.sku_output:
+            output, output_format = _output_target(args.sku_output)
+            if output_format == "json":
+                raise ValueError("Catalogs are written as csv, parquet or xlsx")
+            with ExportWriter(output, output_format) as writer:
+                for chunk, _ in iter_catalog_chunks(source, args.catalog, args.chunk_rows):
+                    tornado.add(chunk)
+                    writer.write(catalog_sensitivity(chunk, args.swing))
+        else:
+            for chunk, _ in iter_catalog_chunks(source, args.catalog, args.chunk_rows):
+                tornado.add(chunk)
+    _write_frame(tornado.table(), args.output, args.format)
+
+    overall = tornado.overall()
+    print(f"Sensitivity of {overall['skus']:,} SKUs to a {args.swing:g}% swing: base profit {overall['total_profit']:,.2f}, "
+          f"weighted margin {overall['weighted_margin']:.1f}%", file=sys.stderr)
+
+def _run_shock(args):
+    from .shock import ShockBaseline
+
+    where = {}
+    for condition in args.where:
+        column, sep, values = condition.partition("=")
+        if not sep or column not in SHOCK_DIMENSIONS:
+            raise ValueError(f"--where must be COLUMN=VALUE with COLUMN one of {', '.join(SHOCK_DIMENSIONS)}")
+        where[column] = values.split(",")
+
+    baseline = ShockBaseline.from_csv(args.priced)
+    deltas, summary = baseline.shock(where, rate=args.rate, change=args.change)
+    _write_frame(deltas.reset_index(), args.output, args.format)
+
+    print(f"Repriced {summary['affected_rows']:,} of {baseline.rows:,} rows: profit {summary['total_profit_delta']:+,.2f}, "
+          f"average margin {summary['average_margin_delta']:+.1f} points, "
+          f"{summary['newly_unprofitable']:,} newly unprofitable", file=sys.stderr)
+
+def _run_sweep_catalog(args):
+    import numpy as np
+    import pandas as pd
+
+    from .catalog import iter_catalog_chunks
+    from .sweep import sweep_catalog, sweep_scenario_skus
+
+    if (args.sku_output is None) != (args.sku_scenario is None):
+        raise ValueError("--sku-output and --sku-scenario TARIFF FACTOR go together")
+    with open(args.catalog, "rb") as source:
+        catalog_df = pd.concat([chunk for chunk, _ in iter_catalog_chunks(source, args.catalog, args.chunk_rows)],
+                               ignore_index=True)
+    scenarios_df = sweep_catalog(
+        catalog_df,
+        np.linspace(args.min_tariff, args.max_tariff, args.tariff_steps),
+        np.linspace(args.min_factor, args.max_factor, args.factor_steps),
+        args.workers
+    )
+    _write_frame(scenarios_df, args.output, args.format)
+
+    print(f"Swept {len(catalog_df):,} SKUs through {len(scenarios_df):,} scenarios on {args.workers} "
+          f"worker{'s' if args.workers != 1 else ''}", file=sys.stderr)
+
+    if args.sku_output:
+        tariff_rate, price_factor = args.sku_scenario
+        skus = sweep_scenario_skus(catalog_df, tariff_rate, price_factor)
+        _write_frame(skus, args.sku_output, None)
+        print(f"Wrote {len(skus):,} SKUs at a {tariff_rate:g}% tariff and {price_factor:g}x price to {args.sku_output}",
+              file=sys.stderr)
+
+def _run_store(args):
+    from .catalog import iter_catalog_chunks
+    from .store import CatalogStore
+
+    if not args.output.lower().endswith(STORE_EXTENSION):
+        raise ValueError(f"Catalog stores are written to {STORE_EXTENSION} files")
+    with open(args.catalog, "rb") as source:
+        store = CatalogStore.build((chunk for chunk, _ in iter_catalog_chunks(source, args.catalog, args.chunk_rows)),
+                                   args.output)
+    print(f"Stored {store.rows:,} rows x {len(store.columns)} columns in {args.output}", file=sys.stderr)
+
+def _run_serve(args):
+    from .service import run_service
+
+    def report_start(service):
+        print(f"Pricing service on http://{service.host}:{service.port} (POST /price, POST /price/batch, GET /stats); "
+              f"Ctrl+C to stop", file=sys.stderr, flush=True)
+
+    try:
+        run_service(args.host, args.port, args.batch_window_ms / 1000, args.max_batch, on_start=report_start)
+    except KeyboardInterrupt:
+        pass
+
+def _run_load_test(args):
+    import asyncio
+
+    from .service import load_test
+
+    if args.requests < 1 or args.concurrency < 1 or args.batch_size < 1:
+        raise ValueError("--requests, --concurrency and --batch-size must be at least 1")
+    report = asyncio.run(load_test(args.host, args.port, args.requests, args.concurrency, args.batch_size))
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    latency = report["latency_ms"]
+    print(f"{report['requests']:,} requests ({report['items']:,} items) in {report['seconds']:.2f} s: "
+          f"{report['requests_per_second']:,.0f} requests/s, {report['items_per_second']:,.0f} items/s, "
+          f"p50 {latency['p50']:.2f} ms, p99 {latency['p99']:.2f} ms, {report['errors']:,} errors", file=sys.stderr)
+    return 1 if report["errors"] else 0
+
+def _run_bench(args):
+    from .bench import compare_to_baseline, load_baseline, run_benchmarks, save_baseline
+
+    def report_case(result):
+        print(f"{result['kernel']:<20} {result['size']:>10,}  {result['seconds'] * 1000:>10.2f} ms  "
+              f"{result['throughput']:>14,.0f}/s  {result['peak_bytes'] / 2**20:>9.1f} MiB", flush=True)
+
+    report = run_benchmarks(args.kernels, args.min_exponent, args.max_exponent, args.repeat, on_result=report_case)
+    if args.output:
+        save_baseline(report, args.output)
+
+    if args.save:
+        save_baseline(report, args.baseline)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save to create one", file=sys.stderr)
+        return 0
+
+    regressions = compare_to_baseline(report, load_baseline(args.baseline), args.threshold)
+    for key, metric, previous, current in regressions:
+        print(f"REGRESSION {key} {metric}: {previous:,.6g} -> {current:,.6g} ({current / previous - 1:+.0%})", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}", file=sys.stderr)
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="tariffsight", description="TariffSight import cost analysis without the web UI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    tariff = subparsers.add_parser("tariff-sweep", help="profitability across tariff rates at a fixed MSRP")
+    tariff.add_argument("--params", help="JSON file with default values for any option")
+    tariff.add_argument("--msrp", type=float)
+    tariff.add_argument("--cost", type=float, help="manufacturing cost per unit")
+    tariff.add_argument("--min-tariff", type=float)
+    tariff.add_argument("--max-tariff", type=float)
+    tariff.add_argument("--steps", type=int)
+    _add_fee_options(tariff)
+    _add_output_options(tariff)
+    tariff.set_defaults(handler=_run_tariff_sweep)
+
+    price = subparsers.add_parser("price-sweep", help="profitability across price points at a fixed tariff rate")
+    price.add_argument("--params", help="JSON file with default values for any option")
+    price.add_argument("--tariff", type=float, help="tariff rate in percent")
+    price.add_argument("--cost", type=float, help="manufacturing cost per unit")
+    price.add_argument("--min-factor", type=float, help="lowest price as a factor of landed cost")
+    price.add_argument("--max-factor", type=float, help="highest price as a factor of landed cost")
+    price.add_argument("--steps", type=int)
+    _add_fee_options(price)
+    _add_output_options(price)
+    price.set_defaults(handler=_run_price_sweep)
+
+    catalog = subparsers.add_parser("price", help="price every SKU in a CSV or Parquet catalog")
+    catalog.add_argument("catalog", help="catalog file (.csv, .parquet or .arrow store)")
+    catalog.add_argument("-o", "--output", default="-", help="output file, .csv, .parquet or .xlsx (default: CSV on stdout)")
+    catalog.add_argument("--chunk-rows", type=int, default=BULK_CHUNK_ROWS, help="rows priced per chunk")
+    catalog.add_argument("--tariff-schedule", help="HS code schedule CSV (hs_code,tariff_rate) used to fill missing tariff rates")
+    catalog.add_argument("--tariff-timeline", help="effective-dated rate CSV (sku,effective_from,effective_to,tariff_rate) "
+                         "applied by each row's arrival_date")
+    catalog.add_argument("--currency-rates", help="exchange rate CSV (from_currency,to_currency,rate) used to convert "
+                         "cost_currency / price_currency columns")
+    catalog.add_argument("--currency", default="USD", help="currency to report in when converting (default: USD)")
+    catalog.add_argument("--duty-rules", help="JSON list of stacked duty rules used instead of the single tariff_rate")
+    catalog.add_argument("--exact-money", choices=list(MONEY_SCALES), help="price in integer cents or milli-cents "
+                         "instead of floating point")
+    catalog.add_argument("--rounding", choices=list(ROUNDING_CHOICES), default="half-even",
+                         help="rounding rule for --exact-money (default: half-even)")
+    catalog.add_argument("--rollup-by", choices=ROLLUP_DIMENSIONS, help="also total duty, weighted margin and "
+                         "unprofitable SKUs per group of this column")
+    catalog.add_argument("--rollup-output", help="file the rollup is written to (.csv, .json or .parquet)")
+    catalog.set_defaults(handler=_run_price_catalog)
+
+    shipments = subparsers.add_parser("optimize-shipments", help="recommend the shipment size with the lowest landed cost per SKU")
+    shipments.add_argument("catalog", help="catalog file (.csv, .parquet or .arrow store) with a demand_per_period "
+                           "column; holding_cost and container_capacity columns are optional")
+    shipments.add_argument("-o", "--output", default="-", help="output file, .csv, .parquet or .xlsx (default: CSV on stdout)")
+    shipments.add_argument("--chunk-rows", type=int, default=BULK_CHUNK_ROWS, help="rows optimized per chunk")
+    shipments.add_argument("--max-periods", type=float, default=12,
+                           help="largest shipment allowed, in periods of demand (default: 12)")
+    shipments.set_defaults(handler=_run_optimize_shipments)
+
+    prices = subparsers.add_parser("optimize-prices", help="profit-maximizing price per SKU under elastic demand")
+    prices.add_argument("catalog", help="catalog or priced catalog file (.csv, .parquet or .arrow store) with msrp and "
+                        "elasticity columns; demand_per_period, price_floor and price_ceiling columns are optional")
+    prices.add_argument("-o", "--output", default="-", help="output file, .csv, .parquet or .xlsx (default: CSV on stdout)")
+    prices.add_argument("--chunk-rows", type=int, default=BULK_CHUNK_ROWS, help="rows optimized per chunk")
+    prices.add_argument("--elasticity", type=float, help="price elasticity for every SKU instead of the elasticity column")
+    prices.add_argument("--demand-model", choices=DEMAND_MODELS, default="constant",
+                        help="demand curve through the current price and demand (default: constant elasticity)")
+    prices.add_argument("--charm", type=float, help="round prices to end in these cents, e.g. 0.99")
+    prices.add_argument("--duty-rules", help="JSON list of stacked duty rules, for catalogs without a landed_cost column")
+    prices.set_defaults(handler=_run_optimize_prices)
+
+    sensitivity = subparsers.add_parser("sensitivity", help="portfolio tornado: profit with each cost input moved down and up")
+    sensitivity.add_argument("catalog", help="catalog or priced catalog file (.csv, .parquet or .arrow store)")
+    sensitivity.add_argument("--swing", type=float, default=10.0, help="percent each input is moved down and up (default: 10)")
+    sensitivity.add_argument("--sku-output", help="also write every SKU with its profit swing per input and top_driver "
+                             "(.csv, .parquet or .xlsx)")
+    sensitivity.add_argument("--chunk-rows", type=int, default=BULK_CHUNK_ROWS, help="rows read per chunk")
+    _add_output_options(sensitivity)
+    sensitivity.set_defaults(handler=_run_sensitivity)
+
+    shock = subparsers.add_parser("shock", help="reprice only the rows of a priced catalog hit by a tariff change")
+    shock.add_argument("priced", help="priced catalog CSV written by tariffsight price")
+    shock.add_argument("--where", action="append", required=True, metavar="COLUMN=VALUE",
+                       help="rows to shock, e.g. country_of_origin=CN or hs_chapter=84,85 (repeat to narrow)")
+    change = shock.add_mutually_exclusive_group(required=True)
+    change.add_argument("--rate", type=float, help="new tariff rate in percent")
+    change.add_argument("--change", type=float, help="change to the current rate in percentage points")
+    _add_output_options(shock)
+    shock.set_defaults(handler=_run_shock)
+
+    sweep = subparsers.add_parser("sweep-catalog", help="portfolio profit for every SKU across a tariff x price grid")
+    sweep.add_argument("catalog", help="catalog file (.csv, .parquet or .arrow store)")
+    sweep.add_argument("--min-tariff", type=float, default=0.0, help="lowest tariff rate in percent (default: 0)")
+    sweep.add_argument("--max-tariff", type=float, default=100.0, help="highest tariff rate in percent (default: 100)")
+    sweep.add_argument("--tariff-steps", type=int, default=200)
+    sweep.add_argument("--min-factor", type=float, default=0.8, help="lowest price as a factor of each SKU's msrp")
+    sweep.add_argument("--max-factor", type=float, default=1.2, help="highest price as a factor of each SKU's msrp")
+    sweep.add_argument("--factor-steps", type=int, default=200)
+    sweep.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                       help="worker processes (default: one per CPU); results are identical for any number")
+    sweep.add_argument("--chunk-rows", type=int, default=BULK_CHUNK_ROWS, help="rows read per chunk")
+    sweep.add_argument("--sku-scenario", nargs=2, type=float, metavar=("TARIFF", "FACTOR"),
+                       help="one scenario to also price SKU by SKU (any tariff rate and price factor)")
+    sweep.add_argument("--sku-output", help="file for the per-SKU rows of --sku-scenario")
+    _add_output_options(sweep)
+    sweep.set_defaults(handler=_run_sweep_catalog)
+
+    store = subparsers.add_parser("store", help="convert a catalog to a memory-mapped catalog store")
+    store.add_argument("catalog", help="catalog file (.csv or .parquet)")
+    store.add_argument("-o", "--output", default="catalog_store.arrow",
+                       help=f"store file to write, {STORE_EXTENSION} (default: catalog_store.arrow)")
+    store.add_argument("--chunk-rows", type=int, default=BULK_CHUNK_ROWS, help="rows read and stored per record batch")
+    store.set_defaults(handler=_run_store)
+
+    serve = subparsers.add_parser("serve", help="local HTTP/JSON pricing service for ERP and order systems")
+    serve.add_argument("--host", default=SERVICE_HOST, help=f"address to listen on (default: {SERVICE_HOST}, local only)")
+    serve.add_argument("--port", type=int, default=SERVICE_PORT, help=f"port to listen on (default: {SERVICE_PORT})")
+    serve.add_argument("--batch-window-ms", type=float, default=SERVICE_BATCH_WINDOW * 1000,
+                       help="how long a single-item request waits to share a batch (default: %(default)g)")
+    serve.add_argument("--max-batch", type=int, default=SERVICE_MAX_BATCH,
+                       help="most single-item requests priced in one batch (default: %(default)s)")
+    serve.set_defaults(handler=_run_serve)
+
+    load = subparsers.add_parser("load-test", help="measure a running pricing service's throughput and latency")
+    load.add_argument("--host", default=SERVICE_HOST)
+    load.add_argument("--port", type=int, default=SERVICE_PORT)
+    load.add_argument("--requests", type=int, default=10_000, help="requests to send (default: 10000)")
+    load.add_argument("--concurrency", type=int, default=64, help="keep-alive connections sending at once (default: 64)")
+    load.add_argument("--batch-size", type=int, default=1,
+                      help="items per request; above 1 sends POST /price/batch (default: 1, single-item POST /price)")
+    load.add_argument("-o", "--output", default="-", help="JSON report file (default: stdout)")
+    load.set_defaults(handler=_run_load_test)
+
+    bench = subparsers.add_parser("bench", help="time the pricing kernels and compare against a saved baseline")
+    bench.add_argument("--kernels", nargs="+", help="kernels to run by name (default: all)")
+    bench.add_argument("--min-exponent", type=int, default=1, help="smallest input size as a power of ten")
+    bench.add_argument("--max-exponent", type=int, default=7, help="largest input size as a power of ten")
+    bench.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is kept")
+    bench.add_argument("--baseline", default=BENCH_BASELINE_PATH, help="baseline JSON file")
+    bench.add_argument("--save", action="store_true", help="write this run as the new baseline instead of comparing")
+    bench.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown or memory growth as a fraction")
+    bench.add_argument("-o", "--output", help="also write this run's results to a JSON file")
+    bench.set_defaults(handler=_run_bench)
+
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args) or 0
+    except (OSError, ValueError, KeyError, ImportError, OverflowError) as e:
+        print(f"tariffsight: error: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,103 @@
+"""Currency conversion through a dense currency x currency rate matrix."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Rate table read by the app: from_currency,to_currency,rate (1 from_currency = rate to_currency)
+CURRENCY_RATES_PATH = os.environ.get("TARIFFSIGHT_CURRENCY_RATES", "currency_rates.csv")
+
+# Display symbols; other currencies are shown with their ISO code
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "CNY": "¥", "CAD": "C$", "AUD": "A$"}
+
+def format_money(amount, currency="USD"):
+    """Format an amount with the currency's symbol, e.g. $12.50 or CHF 12.50"""
+    symbol = CURRENCY_SYMBOLS.get(currency)
+    return f"{symbol}{amount:,.2f}" if symbol else f"{currency} {amount:,.2f}"
+
+def _clean_codes(codes):
+    return pd.Series(codes, dtype="string").str.strip().str.upper()
+
+class CurrencyRates:
+    """Conversion factors between every pair of known currencies; rates[i, j] converts currency i into j"""
+
+    def __init__(self, currencies, rates):
+        self.currencies = pd.Index(currencies)
+        self.rates = rates
+
+    @classmethod
+    def from_frame(cls, rates_df, from_column="from_currency", to_column="to_currency", rate_column="rate"):
+        """Build the matrix from quoted pairs, filling inverse and cross rates the table does not quote"""
+
+        from_codes = _clean_codes(rates_df[from_column]).to_numpy(dtype=object)
+        to_codes = _clean_codes(rates_df[to_column]).to_numpy(dtype=object)
+        quoted = pd.to_numeric(rates_df[rate_column], errors="coerce").to_numpy(dtype=np.float64)
+
+        bad = ~(quoted > 0)
+        if bad.any():
+            raise ValueError(f"{int(bad.sum())} currency rates are missing or not positive "
+                             f"(first: row {int(np.flatnonzero(bad)[0])})")
+
+        currencies = pd.Index(np.unique(np.concatenate([from_codes, to_codes])))
+        n = len(currencies)
+        i, j = currencies.get_indexer(from_codes), currencies.get_indexer(to_codes)
+
+        rates = np.full((n, n), np.nan)
+        rates[j, i] = 1 / quoted
+        rates[i, j] = quoted  # Quoted rates win over inverted ones
+        np.fill_diagonal(rates, 1.0)
+
+        # Cross rates through each currency in turn reach every pair connected by quoted rates
+        for k in range(n):
+            rates = np.where(np.isnan(rates), rates[:, [k]] * rates[[k], :], rates)
+
+        return cls(currencies, rates)
+
+    @classmethod
+    def from_csv(cls, path, **columns):
+        return cls.from_frame(pd.read_csv(path), **columns)
+
+    def __contains__(self, currency):
+        return currency in self.currencies
+
+    def codes(self, currencies):
+        """Matrix indexes for an array of currency codes, hashing each distinct code once"""
+
+        labels, uniques = pd.factorize(np.atleast_1d(np.asarray(currencies, dtype=object)))
+        uniques = _clean_codes(uniques)
+        unique_codes = self.currencies.get_indexer(uniques)
+        if (unique_codes < 0).any():
+            unknown = ", ".join(sorted(map(str, uniques[unique_codes < 0])))
+            raise ValueError(f"No exchange rate for {unknown}")
+        if (labels < 0).any():
+            raise ValueError("Currency code is missing")
+        return unique_codes[labels]
+
+    def convert(self, amounts, from_currency, to_currency):
+        """Convert amounts in one gather; each currency argument is a code or an array of codes per amount"""
+
+        factors = self.rates[self.codes(from_currency), self.codes(to_currency)]
+        if np.isnan(factors).any():
+            raise ValueError("No chain of exchange rates links some of these currencies")
+        return np.asarray(amounts, dtype=np.float64) * (factors if factors.size > 1 else factors[0])
+
+    def rate(self, from_currency, to_currency):
+        """Units of to_currency per unit of from_currency"""
+        return float(self.convert(1.0, from_currency, to_currency))
+
+def load_currency_rates(path=CURRENCY_RATES_PATH):
+    return CurrencyRates.from_csv(path)
+
+def convert_catalog_currency(catalog_df, rates, currency, cost_column="cost_currency", price_column="price_currency"):
+    """Convert cost_to_produce and msrp into one currency from per-row cost_currency / price_currency columns.
+
+    Per-shipment costs are taken to be in the target currency already, as they are paid on arrival.
+    """
+
+    converted = catalog_df.copy()
+    for amount_column, currency_column in (("cost_to_produce", cost_column), ("msrp", price_column)):
+        if currency_column in converted.columns and amount_column in converted.columns:
+            amounts = pd.to_numeric(converted[amount_column], errors="coerce").to_numpy(dtype=np.float64)
+            converted[amount_column] = rates.convert(amounts, converted[currency_column].to_numpy(), currency)
+    return converted
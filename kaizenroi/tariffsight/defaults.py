@@ -0,0 +1,46 @@
+"""Defaults and option values shared by the library and the tariffsight command.
+
+Plain literals only: the command builds its parser from these before it loads numpy or pandas.
+"""
+
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP
+
+# Rows read and priced at a time in bulk catalog mode
+BULK_CHUNK_ROWS = 100_000
+
+# Export formats by file extension, with their MIME types
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Minor units per currency unit for each exact money mode
+MONEY_SCALES = {"cents": 100, "millicents": 100_000}
+
+# Rounding rules, named as in the decimal module
+ROUNDING_MODES = (ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN, ROUND_UP, ROUND_FLOOR, ROUND_CEILING)
+
+# Demand curves through the current (msrp, demand) point: constant elasticity, or a straight line with that
+# elasticity at the current price
+DEMAND_MODELS = ("constant", "linear")
+
+# Catalog columns a portfolio can be rolled up by, in default drill-down order
+ROLLUP_DIMENSIONS = ("country_of_origin", "supplier", "category")
+
+# Row groups a shock can target; hs_chapter is the first two digits of hs_code
+SHOCK_DIMENSIONS = ("country_of_origin", "supplier", "category", "hs_chapter", "sku")
+
+# File extension of catalog stores; catalog commands read these like CSV and Parquet catalogs
+STORE_EXTENSION = ".arrow"
+
+# Address the service listens on; it is meant for local clients only
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+
+# Longest a single-item request waits for others to share its batch, and the most items priced in one batch
+SERVICE_BATCH_WINDOW = 0.002
+SERVICE_MAX_BATCH = 4096
+
+# Baseline file written by bench --save and compared against on every run
+BENCH_BASELINE_PATH = "tariffsight_benchmarks.json"
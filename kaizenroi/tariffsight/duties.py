@@ -0,0 +1,148 @@
+"""Stacked duty rules compiled once and evaluated over a whole catalog with array operations."""
+
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# Duty rule file read by the app: a JSON list of rule objects
+DUTY_RULES_PATH = os.environ.get("TARIFFSIGHT_DUTY_RULES", "duty_rules.json")
+
+# Rule kinds: ad_valorem is a percentage of cost_to_produce, specific is an amount per unit (or per unit of a column)
+DUTY_RULE_KINDS = ("ad_valorem", "specific")
+
+_RULE_KEYS = {"name", "kind", "rate", "rate_column", "amount", "per", "min", "max", "cap_basis", "when", "hs_prefix"}
+
+# Equivalent to the plain model: one ad valorem duty at each row's tariff_rate
+DEFAULT_DUTY_RULES = [{"name": "base", "kind": "ad_valorem", "rate_column": "tariff_rate"}]
+
+class _Columns:
+    """Catalog columns as arrays for one evaluation, each converted or factorized at most once"""
+
+    def __init__(self, catalog, rows):
+        self.catalog = catalog
+        self.rows = rows
+        self._numeric = {}
+        self._factorized = {}
+
+    def _raw(self, name):
+        if name not in self.catalog:
+            raise ValueError(f"Duty rules need a {name} column")
+        values = self.catalog[name]
+        return pd.Series([values] * self.rows) if np.ndim(values) == 0 else pd.Series(values)
+
+    def numeric(self, name):
+        """Column as floats; unreadable values become NaN"""
+        if name not in self._numeric:
+            self._numeric[name] = pd.to_numeric(self._raw(name), errors="coerce").to_numpy(dtype=np.float64)
+        return self._numeric[name]
+
+    def matches(self, name, predicate):
+        """Boolean row mask from a predicate run on the column's distinct values (a string Series) only"""
+        if name not in self._factorized:
+            self._factorized[name] = pd.factorize(self._raw(name))
+        codes, uniques = self._factorized[name]
+        unique_match = predicate(pd.Series(uniques, dtype="string").str.strip()).fillna(False).to_numpy(dtype=bool)
+        return np.append(unique_match, False)[codes]
+
+def _compile_condition(rule):
+    """Row mask function for the rule's when / hs_prefix filters, or None when it applies to every row"""
+
+    checks = []
+    for column, allowed in (rule.get("when") or {}).items():
+        allowed = [str(v).strip() for v in (allowed if isinstance(allowed, list) else [allowed])]
+        checks.append(lambda cols, column=column, allowed=allowed: cols.matches(column, lambda values: values.isin(allowed)))
+    if rule.get("hs_prefix"):
+        prefixes = tuple(re.sub(r"\D", "", str(p)) for p in rule["hs_prefix"])
+        checks.append(lambda cols: cols.matches(
+            "hs_code", lambda values: values.str.replace(r"\D", "", regex=True).str.startswith(prefixes)
+        ))
+    if not checks:
+        return None
+
+    def mask(cols):
+        result = checks[0](cols)
+        for check in checks[1:]:
+            result = result & check(cols)
+        return result
+    return mask
+
+def _compile_rule(rule):
+    """Validate one rule and return (name, function of (columns, cost, units) giving the per-unit duty)"""
+
+    name = rule.get("name")
+    if not isinstance(name, str) or not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+        raise ValueError(f"Duty rule name must be an identifier, got {name!r}")
+    unknown = set(rule) - _RULE_KEYS
+    if unknown:
+        raise ValueError(f"Duty rule {name!r} has unknown keys: {', '.join(sorted(unknown))}")
+    kind = rule.get("kind")
+    if kind not in DUTY_RULE_KINDS:
+        raise ValueError(f"Duty rule {name!r} kind must be one of {', '.join(DUTY_RULE_KINDS)}")
+    cap_basis = rule.get("cap_basis", "unit")
+    if cap_basis not in ("unit", "shipment"):
+        raise ValueError(f"Duty rule {name!r} cap_basis must be 'unit' or 'shipment'")
+
+    if kind == "ad_valorem":
+        if ("rate" in rule) == ("rate_column" in rule):
+            raise ValueError(f"Duty rule {name!r} needs exactly one of rate or rate_column")
+        rate, rate_column = float(rule.get("rate", 0.0)), rule.get("rate_column")
+
+        def base(cols, cost):
+            return cost * ((cols.numeric(rate_column) if rate_column else rate) / 100)
+    else:
+        if "amount" not in rule:
+            raise ValueError(f"Duty rule {name!r} needs an amount")
+        amount, per = float(rule["amount"]), rule.get("per")
+
+        def base(cols, cost):
+            return amount * cols.numeric(per) if per else np.full(cols.rows, amount)
+
+    low, high = rule.get("min"), rule.get("max")
+    mask = _compile_condition(rule)
+
+    def evaluate(cols, cost, units):
+        duty = base(cols, cost)
+        if low is not None or high is not None:
+            # Caps on a per-entry fee apply to the whole shipment, then spread back over its units
+            if cap_basis == "shipment":
+                duty = np.clip(duty * units, low, high) / units
+            else:
+                duty = np.clip(duty, low, high)
+        if mask is not None:
+            duty = np.where(mask(cols), duty, 0.0)
+        return duty
+    return name, evaluate
+
+class DutySchedule:
+    """Duty rules compiled to array functions; evaluate() prices every row of a catalog in one pass per rule"""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._compiled = [_compile_rule(rule) for rule in self.rules]
+        names = [name for name, _ in self._compiled]
+        if len(set(names)) != len(names):
+            raise ValueError("Duty rule names must be unique")
+        self.names = names
+
+    @classmethod
+    def from_json(cls, path):
+        with open(path, "r", encoding="utf-8") as fh:
+            rules = json.load(fh)
+        if not isinstance(rules, list):
+            raise ValueError(f"{path} must contain a JSON list of duty rules")
+        return cls(rules)
+
+    def evaluate(self, catalog):
+        """Per-unit duty for each rule, keyed by rule name, over a DataFrame or dict of columns"""
+
+        cols = _Columns(catalog, len(np.atleast_1d(catalog["cost_to_produce"])))
+        cost = cols.numeric("cost_to_produce")
+        units = cols.numeric("units_per_shipment") if "units_per_shipment" in catalog else np.ones(cols.rows)
+        units = np.where(units > 0, units, 1.0)
+        return {name: evaluate(cols, cost, units) for name, evaluate in self._compiled}
+
+def load_duty_schedule(path=DUTY_RULES_PATH):
+    return DutySchedule.from_json(path)
@@ -0,0 +1,168 @@
+"""Streaming export of numeric result frames to CSV, Parquet and Excel, one chunk at a time."""
+
+import io
+import os
+
+from .defaults import EXPORT_FORMATS
+from .model import CATALOG_COLUMNS, CATALOG_TEXT_COLUMNS
+
+# Rows written per chunk when exporting a DataFrame already in memory
+EXPORT_CHUNK_ROWS = 100_000
+
+# Rows per Excel worksheet, header included; longer exports continue on further sheets
+EXCEL_MAX_ROWS = 1_048_576
+
+def export_format(output, fmt=None):
+    """The export format given, else the one named by the output file extension, else csv"""
+
+    if fmt is None:
+        extension = os.path.splitext(output)[1].lstrip(".").lower() if isinstance(output, str) else ""
+        fmt = extension if extension in EXPORT_FORMATS else "csv"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Cannot export to {fmt}; choose one of {', '.join(EXPORT_FORMATS)}")
+    return fmt
+
+def _arrow_schema(df):
+    """Arrow schema for a stream of chunks shaped like df.
+
+    Catalog columns get their catalog types rather than ones inferred from this chunk: identifier columns are
+    text and cost model inputs float64, so numeric-looking SKUs in the first chunk do not fix the type. Other
+    columns must fit the first chunk's types: integer columns may gain blanks and all-blank columns may gain
+    text, so those are widened up front.
+    """
+
+    import pyarrow as pa
+
+    fields = []
+    for field in pa.Schema.from_pandas(df, preserve_index=False):
+        if field.name in CATALOG_TEXT_COLUMNS or pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        elif field.name in CATALOG_COLUMNS or pa.types.is_integer(field.type):
+            field = field.with_type(pa.float64())
+        fields.append(field)
+    return pa.schema(fields)
+
+def _conform_chunk(df, schema):
+    """A chunk cast to the schema's text and number columns, ready for Table.from_pandas with schema"""
+
+    import pandas as pd
+    import pyarrow as pa
+
+    for field in schema:
+        column = df[field.name]
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            df = df.assign(**{field.name: column.astype("string")})
+        elif pa.types.is_floating(field.type) and not pd.api.types.is_numeric_dtype(column):
+            if field.name not in CATALOG_COLUMNS and column.notna().any():
+                raise ValueError(f"Column {field.name!r} holds numbers in the first chunk but text in a later one")
+            # Unreadable cost model inputs are blanks, as when pricing
+            df = df.assign(**{field.name: pd.to_numeric(column, errors="coerce")})
+    return df
+
+class ExportWriter:
+    """Appends DataFrame chunks to one CSV, Parquet or Excel output (a path or a binary stream; CSV also takes
+    a text stream) without holding earlier chunks. Parquet gets one row group per chunk and Excel is written
+    by xlsxwriter in constant-memory mode, so memory stays at one chunk whatever the total size."""
+
+    def __init__(self, output, fmt=None, sheet_name="Results"):
+        self.output = output
+        self.fmt = export_format(output, fmt)
+        self.sheet_name = sheet_name
+        self.rows = 0
+        self._writer = None
+        self._text = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, df):
+        if self.fmt == "csv":
+            self._write_csv(df)
+        elif self.fmt == "parquet":
+            self._write_parquet(df)
+        else:
+            self._write_excel(df)
+        self.rows += len(df)
+
+    def _write_csv(self, df):
+        if self._writer is None:
+            if isinstance(self.output, str):
+                self._writer = open(self.output, "w", encoding="utf-8", newline="")
+            elif isinstance(self.output, io.TextIOBase):
+                self._writer = self.output
+            else:
+                self._writer = self._text = io.TextIOWrapper(self.output, encoding="utf-8", newline="")
+            df.to_csv(self._writer, index=False)
+        else:
+            df.to_csv(self._writer, header=False, index=False)
+
+    def _write_parquet(self, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._schema = _arrow_schema(df)
+            self._writer = pq.ParquetWriter(self.output, self._schema)
+        self._writer.write_table(pa.Table.from_pandas(_conform_chunk(df, self._schema), schema=self._schema,
+                                                     preserve_index=False))
+
+    def _write_excel(self, df):
+        if self._writer is None:
+            import xlsxwriter
+
+            self._writer = xlsxwriter.Workbook(self.output, {"constant_memory": True,
+                                                             "default_date_format": "yyyy-mm-dd"})
+            self._columns = [str(col) for col in df.columns]
+            self._sheet = None
+
+        # Blanks become empty cells; numpy scalars become Python numbers xlsxwriter can write
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if self._sheet is None or self._sheet_row == EXCEL_MAX_ROWS:
+                sheets = len(self._writer.worksheets())
+                self._sheet = self._writer.add_worksheet(self.sheet_name if sheets == 0 else f"{self.sheet_name} ({sheets + 1})")
+                self._sheet.write_row(0, 0, self._columns)
+                self._sheet_row = 1
+            self._sheet.write_row(self._sheet_row, 0, row)
+            self._sheet_row += 1
+
+    def close(self):
+        if self._writer is None:
+            return
+        if self.fmt == "csv":
+            if self._text is not None:
+                self._text.flush()
+                self._text.detach()
+            elif isinstance(self.output, str):
+                self._writer.close()
+        else:
+            if self.fmt == "xlsx" and self._sheet is None:
+                self._writer.add_worksheet(self.sheet_name).write_row(0, 0, self._columns)
+            self._writer.close()
+        self._writer = None
+
+def iter_frame_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Yield row slices of a DataFrame (views, not copies) of at most chunk_rows rows"""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+def export_frames(frames, output, fmt=None, sheet_name="Results"):
+    """Write an iterable of DataFrame chunks with the same columns to one output; returns the row count"""
+
+    with ExportWriter(output, fmt, sheet_name) as writer:
+        for frame in frames:
+            writer.write(frame)
+    return writer.rows
+
+def export_frame(df, output, fmt=None, sheet_name="Results", chunk_rows=EXPORT_CHUNK_ROWS):
+    return export_frames(iter_frame_chunks(df, chunk_rows), output, fmt, sheet_name)
+
+def export_bytes(df, fmt, sheet_name="Results"):
+    """A small result frame exported in memory, e.g. for a download button"""
+
+    buffer = io.BytesIO()
+    export_frame(df, buffer, fmt, sheet_name)
+    return buffer.getvalue()
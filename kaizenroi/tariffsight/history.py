@@ -0,0 +1,92 @@
+"""Persistent store of saved calculations."""
+
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+# Saved calculations are kept in this SQLite database
+HISTORY_DB_PATH = os.environ.get("TARIFFSIGHT_HISTORY_DB", "tariffsight_history.db")
+
+HISTORY_COLUMNS = ["timestamp", "product", "sku", "msrp", "cost", "tariff_rate", "landed_cost", "profit", "margin", "currency"]
+
+class CalculationHistory:
+    """Append-only store of saved calculations in SQLite (WAL mode), queried one page at a time"""
+    
+    def __init__(self, path=HISTORY_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # NOCASE columns let the case-insensitive prefix search use the indexes
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS calculations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                analyst TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                product TEXT NOT NULL COLLATE NOCASE,
+                sku TEXT NOT NULL COLLATE NOCASE,
+                msrp REAL NOT NULL,
+                cost REAL NOT NULL,
+                tariff_rate REAL NOT NULL,
+                landed_cost REAL NOT NULL,
+                profit REAL NOT NULL,
+                margin REAL NOT NULL,
+                currency TEXT NOT NULL DEFAULT 'USD'
+            );
+            CREATE INDEX IF NOT EXISTS idx_calculations_analyst_timestamp ON calculations (analyst, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_calculations_sku ON calculations (sku);
+            CREATE INDEX IF NOT EXISTS idx_calculations_product ON calculations (product);
+        """)
+        # Databases created before amounts carried a currency were all in USD
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(calculations)")}
+        if "currency" not in columns:
+            self._conn.execute("ALTER TABLE calculations ADD COLUMN currency TEXT NOT NULL DEFAULT 'USD'")
+        self._conn.commit()
+    
+    def append(self, analyst, entry):
+        """Save one calculation entry (a dict with the HISTORY_COLUMNS keys)"""
+        
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO calculations (analyst, {', '.join(HISTORY_COLUMNS)}) VALUES ({', '.join('?' * (len(HISTORY_COLUMNS) + 1))})",
+                [analyst] + [entry[col] for col in HISTORY_COLUMNS]
+            )
+            self._conn.commit()
+    
+    def _where(self, analyst, search):
+        clause, params = "analyst = ?", [analyst]
+        if search:
+            # Prefix match; escape LIKE wildcards typed by the user
+            pattern = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            clause += " AND (sku LIKE ? ESCAPE '\\' OR product LIKE ? ESCAPE '\\')"
+            params += [pattern, pattern]
+        return clause, params
+    
+    def count(self, analyst, search=None):
+        """Number of saved calculations, optionally filtered by a SKU or product name prefix"""
+        
+        clause, params = self._where(analyst, search)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM calculations WHERE {clause}", params).fetchone()[0]
+    
+    def page(self, analyst, page=0, page_size=50, search=None):
+        """One page of saved calculations as a DataFrame, newest first"""
+        
+        clause, params = self._where(analyst, search)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(HISTORY_COLUMNS)} FROM calculations WHERE {clause} "
+                "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?",
+                params + [page_size, page * page_size]
+            ).fetchall()
+        return pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+    
+    def clear(self, analyst):
+        """Delete every saved calculation for one analyst"""
+        
+        with self._lock:
+            self._conn.execute("DELETE FROM calculations WHERE analyst = ?", [analyst])
+            self._conn.commit()
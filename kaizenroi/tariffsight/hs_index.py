@@ -0,0 +1,148 @@
+"""HS/HTS tariff schedule index with longest-prefix lookup."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Code lengths the index resolves, longest first: 10-digit statistical suffix, 8-digit tariff line, 6-digit HS subheading
+PREFIX_LEVELS = (10, 8, 6)
+
+TARIFF_SCHEDULE_PATH = os.environ.get("TARIFFSIGHT_TARIFF_SCHEDULE", "tariff_schedule.csv")
+
+def normalize_hs_codes(codes):
+    """Strip dots, spaces and other separators from HS codes; returns (integer value, digit count) arrays"""
+
+    digits = pd.Series(codes, dtype="string").str.replace(r"\D", "", regex=True).fillna("").str.slice(0, max(PREFIX_LEVELS))
+    lengths = digits.str.len().to_numpy(dtype=np.int64)
+    values = digits.where(lengths > 0, "0").astype("int64").to_numpy()
+    return values, lengths
+
+class TariffIndex:
+    """Sorted code arrays per prefix length, searched with binary search"""
+
+    def __init__(self, levels):
+        # levels: {code length: (sorted int64 codes, float64 rates)}
+        self.levels = {length: levels.get(length, (np.empty(0, np.int64), np.empty(0))) for length in PREFIX_LEVELS}
+
+    @classmethod
+    def from_frame(cls, schedule_df, code_column="hs_code", rate_column="tariff_rate"):
+        """Build the index from a schedule DataFrame; later rows win when a code appears twice"""
+
+        values, lengths = normalize_hs_codes(schedule_df[code_column])
+        rates = pd.to_numeric(schedule_df[rate_column], errors="coerce").to_numpy(dtype=np.float64)
+
+        bad = ~np.isin(lengths, PREFIX_LEVELS) | np.isnan(rates)
+        if bad.any():
+            raise ValueError(
+                f"{int(bad.sum())} schedule rows have a code that is not {', '.join(map(str, PREFIX_LEVELS))} digits "
+                f"long or a missing rate (first: row {int(np.flatnonzero(bad)[0])})"
+            )
+
+        levels = {}
+        for length in PREFIX_LEVELS:
+            mask = lengths == length
+            codes = pd.Series(rates[mask], index=values[mask])
+            codes = codes[~codes.index.duplicated(keep="last")].sort_index()
+            levels[length] = (codes.index.to_numpy(dtype=np.int64), codes.to_numpy(dtype=np.float64))
+        return cls(levels)
+
+    @classmethod
+    def from_csv(cls, path, code_column="hs_code", rate_column="tariff_rate"):
+        schedule_df = pd.read_csv(path, dtype={code_column: str}, usecols=[code_column, rate_column])
+        return cls.from_frame(schedule_df, code_column, rate_column)
+
+    def __len__(self):
+        return sum(len(codes) for codes, _ in self.levels.values())
+
+    def lookup_many(self, codes):
+        """Rates for many codes at once: returns (rates with NaN where nothing matched, matched prefix length or 0)"""
+
+        values, lengths = normalize_hs_codes(codes)
+        rates = np.full(len(values), np.nan)
+        matched = np.zeros(len(values), dtype=np.int8)
+
+        for length in PREFIX_LEVELS:
+            level_codes, level_rates = self.levels[length]
+            todo = np.flatnonzero((matched == 0) & (lengths >= length))
+            if len(todo) == 0 or len(level_codes) == 0:
+                continue
+
+            prefixes = values[todo] // 10 ** (lengths[todo] - length)
+            pos = np.minimum(np.searchsorted(level_codes, prefixes), len(level_codes) - 1)
+            hit = level_codes[pos] == prefixes
+            rates[todo[hit]] = level_rates[pos[hit]]
+            matched[todo[hit]] = length
+
+        return rates, matched
+
+    def lookup(self, code):
+        """Rate for one code and the prefix length it matched at, or (None, 0)"""
+
+        rates, matched = self.lookup_many([code])
+        return (None, 0) if matched[0] == 0 else (float(rates[0]), int(matched[0]))
+
+    def save(self, path, source_signature=(0, 0)):
+        """Write the index to an uncompressed .npz file"""
+
+        arrays = {"source_signature": np.asarray(source_signature, dtype=np.int64)}
+        for length, (codes, rates) in self.levels.items():
+            arrays[f"codes_{length}"] = codes
+            arrays[f"rates_{length}"] = rates
+        with open(path, "wb") as fh:
+            np.savez(fh, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save(); returns (index, source signature)"""
+
+        with np.load(path) as data:
+            levels = {length: (data[f"codes_{length}"], data[f"rates_{length}"]) for length in PREFIX_LEVELS}
+            return cls(levels), tuple(int(v) for v in data["source_signature"])
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def load_tariff_index(schedule_path=TARIFF_SCHEDULE_PATH, cache_path=None):
+    """Load a schedule CSV through a binary cache that is rebuilt whenever the CSV changes"""
+
+    if cache_path is None:
+        cache_path = f"{schedule_path}.idx.npz"
+    signature = _file_signature(schedule_path)
+
+    if os.path.exists(cache_path):
+        try:
+            index, cached_signature = TariffIndex.load(cache_path)
+            if cached_signature == signature:
+                return index
+        except (OSError, KeyError, ValueError):
+            pass
+
+    index = TariffIndex.from_csv(schedule_path)
+    try:
+        index.save(cache_path, signature)
+    except OSError:
+        pass  # A read-only location only costs the cache
+    return index
+
+def fill_catalog_tariffs(catalog_df, tariff_index, code_column="hs_code", overwrite=False):
+    """Fill tariff_rate from the schedule for every catalog row with an HS code in one vectorized pass.
+
+    Existing rates are kept unless overwrite is set. Adds a tariff_match_digits column with the prefix
+    length each schedule rate matched at, 0 where the rate did not come from the schedule.
+    """
+
+    filled = catalog_df.copy()
+    rates, matched = tariff_index.lookup_many(filled[code_column].to_numpy())
+
+    if "tariff_rate" in filled.columns and not overwrite:
+        current = pd.to_numeric(filled["tariff_rate"], errors="coerce").to_numpy(dtype=np.float64)
+        use_schedule = np.isnan(current) & (matched > 0)
+        filled["tariff_rate"] = np.where(use_schedule, rates, current)
+        matched = np.where(use_schedule, matched, 0)
+    else:
+        filled["tariff_rate"] = rates
+
+    filled["tariff_match_digits"] = matched
+    return filled
@@ -0,0 +1,283 @@
+"""Landed cost model: scalar and vectorized pricing, closed-form solvers and scenario sweeps."""
+
+import numpy as np
+import pandas as pd
+
+def calculate_landed_cost(msrp, cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0, customs_fee=0, 
+                         broker_fee=0, other_costs=0, units_per_shipment=1):
+    """Calculate the landed cost and profitability with given tariff rate"""
+    
+    # Calculate per unit costs
+    if units_per_shipment <= 0:
+        units_per_shipment = 1
+    
+    shipping_per_unit = shipping_cost / units_per_shipment
+    storage_per_unit = storage_cost / units_per_shipment
+    customs_per_unit = customs_fee / units_per_shipment
+    broker_per_unit = broker_fee / units_per_shipment
+    other_per_unit = other_costs / units_per_shipment
+    
+    # Calculate tariff amount
+    tariff_amount = cost_to_produce * (tariff_rate / 100)
+    
+    # Calculate total landed cost per unit
+    landed_cost = cost_to_produce + tariff_amount + shipping_per_unit + storage_per_unit + customs_per_unit + broker_per_unit + other_per_unit
+    
+    # Calculate profit and margin
+    profit = msrp - landed_cost
+    margin_percentage = (profit / msrp) * 100 if msrp > 0 else 0
+    
+    # Calculate minimum profitable MSRP
+    min_profitable_msrp = landed_cost * 1.01  # Minimum 1% profit margin
+    
+    # Breakeven price
+    breakeven_price = landed_cost
+    
+    return {
+        "landed_cost": landed_cost,
+        "tariff_amount": tariff_amount,
+        "profit": profit,
+        "margin_percentage": margin_percentage,
+        "min_profitable_msrp": min_profitable_msrp,
+        "breakeven_price": breakeven_price,
+        "cost_breakdown": {
+            "production": cost_to_produce,
+            "tariff": tariff_amount,
+            "shipping": shipping_per_unit,
+            "storage": storage_per_unit,
+            "customs": customs_per_unit,
+            "broker": broker_per_unit,
+            "other": other_per_unit
+        }
+    }
+
+# Column names accepted by price_catalog, with the default used when a column is absent
+CATALOG_COLUMNS = {
+    "msrp": None,
+    "cost_to_produce": None,
+    "tariff_rate": None,
+    "shipping_cost": 0.0,
+    "storage_cost": 0.0,
+    "customs_fee": 0.0,
+    "broker_fee": 0.0,
+    "other_costs": 0.0,
+    "units_per_shipment": 1.0,
+}
+
+# Identifier columns read as text, so codes like 0101210000 or 8471.30 and numeric-looking SKUs keep their digits
+CATALOG_TEXT_COLUMNS = ("sku", "hs_code", "country_of_origin", "supplier", "category", "cost_currency", "price_currency")
+
+COST_COMPONENTS = ["production", "tariff", "shipping", "storage", "customs", "broker", "other"]
+
+def calculate_landed_cost_batch(msrp, cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0, customs_fee=0,
+                                broker_fee=0, other_costs=0, units_per_shipment=1, duty_breakdown=None):
+    """Vectorized calculate_landed_cost: inputs broadcast against each other, outputs are arrays.
+    
+    A duty_breakdown ({rule name: per-unit duty}, e.g. from DutySchedule.evaluate) replaces the single
+    ad valorem tariff; the tariff amount is then the sum of its components.
+    """
+    
+    msrp, cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee, other_costs, \
+        units_per_shipment = np.broadcast_arrays(*[
+            np.asarray(value, dtype=np.float64) for value in (
+                msrp, cost_to_produce, tariff_rate, shipping_cost, storage_cost,
+                customs_fee, broker_fee, other_costs, units_per_shipment
+            )
+        ])
+    
+    # Calculate per unit costs
+    units_per_shipment = np.where(units_per_shipment > 0, units_per_shipment, 1.0)
+    
+    shipping_per_unit = shipping_cost / units_per_shipment
+    storage_per_unit = storage_cost / units_per_shipment
+    customs_per_unit = customs_fee / units_per_shipment
+    broker_per_unit = broker_fee / units_per_shipment
+    other_per_unit = other_costs / units_per_shipment
+    
+    # Calculate tariff amount
+    if duty_breakdown is None:
+        tariff_amount = cost_to_produce * (tariff_rate / 100)
+    else:
+        tariff_amount = np.zeros_like(cost_to_produce)
+        for duty in duty_breakdown.values():
+            tariff_amount = tariff_amount + duty
+    
+    # Calculate total landed cost per unit
+    landed_cost = cost_to_produce + tariff_amount + shipping_per_unit + storage_per_unit + customs_per_unit + broker_per_unit + other_per_unit
+    
+    # Calculate profit and margin (0 where the price is not positive)
+    profit = msrp - landed_cost
+    margin_percentage = np.zeros_like(profit)
+    np.divide(profit, msrp, out=margin_percentage, where=msrp > 0)
+    margin_percentage *= 100
+    
+    result = {
+        "landed_cost": landed_cost,
+        "tariff_amount": tariff_amount,
+        "profit": profit,
+        "margin_percentage": margin_percentage,
+        "min_profitable_msrp": landed_cost * 1.01,  # Minimum 1% profit margin
+        "breakeven_price": landed_cost,
+        "cost_breakdown": {
+            "production": cost_to_produce,
+            "tariff": tariff_amount,
+            "shipping": shipping_per_unit,
+            "storage": storage_per_unit,
+            "customs": customs_per_unit,
+            "broker": broker_per_unit,
+            "other": other_per_unit
+        }
+    }
+    if duty_breakdown is not None:
+        result["duty_breakdown"] = duty_breakdown
+    return result
+
+def solve_pricing_targets(msrp, cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0, customs_fee=0,
+                          broker_fee=0, other_costs=0, units_per_shipment=1, target_margin=20.0):
+    """Exact breakeven tariff, breakeven price and target-margin price, vectorized like calculate_landed_cost_batch"""
+    
+    result = calculate_landed_cost_batch(
+        msrp, cost_to_produce, tariff_rate, shipping_cost, storage_cost,
+        customs_fee, broker_fee, other_costs, units_per_shipment
+    )
+    landed_cost = result["landed_cost"]
+    production = result["cost_breakdown"]["production"]
+    msrp = np.broadcast_to(np.asarray(msrp, dtype=np.float64), landed_cost.shape)
+    target_margin = np.broadcast_to(np.asarray(target_margin, dtype=np.float64), landed_cost.shape)
+    
+    # Landed cost is linear in tariff: landed = production * (1 + rate / 100) + per-unit fees,
+    # so profit is zero at rate = (msrp - production - fees) / production * 100
+    fees_per_unit = landed_cost - production - result["tariff_amount"]
+    breakeven_tariff = np.full(landed_cost.shape, np.nan)
+    np.divide((msrp - production - fees_per_unit) * 100, production, out=breakeven_tariff, where=production > 0)
+    
+    # margin = (price - landed) / price, so price = landed / (1 - margin); undefined at 100% and above
+    target_price = np.full(landed_cost.shape, np.nan)
+    np.divide(landed_cost, 1 - target_margin / 100, out=target_price, where=target_margin < 100)
+    
+    return {
+        "breakeven_tariff": breakeven_tariff,
+        "breakeven_price": landed_cost,
+        "target_price": target_price
+    }
+
+def _catalog_inputs(catalog_df, optional=()):
+    """Map catalog columns to cost model keyword arguments, filling defaults for optional columns"""
+    
+    missing = [col for col, default in CATALOG_COLUMNS.items()
+               if default is None and col not in optional and col not in catalog_df.columns]
+    if missing:
+        raise ValueError(f"Catalog is missing required columns: {', '.join(missing)}")
+    
+    return {
+        col: catalog_df[col].to_numpy(dtype=np.float64) if col in catalog_df.columns else (np.nan if default is None else default)
+        for col, default in CATALOG_COLUMNS.items()
+    }
+
+def solve_catalog_targets(catalog_df, target_margin=20.0):
+    """Solve pricing targets for every row of a catalog DataFrame and return them as a DataFrame"""
+    
+    solved = solve_pricing_targets(**_catalog_inputs(catalog_df), target_margin=target_margin)
+    return pd.DataFrame(solved, index=catalog_df.index)
+
+def price_catalog(catalog_df, duty_schedule=None, money=None):
+    """Price every row of a catalog DataFrame in one pass and return it with the result columns appended.
+    
+    With a duty_schedule the tariff is the sum of its rules, each also written as a duty_<rule>_per_unit column;
+    tariff_rate is then only needed by rules that read it. With money (an ExactMoney), amounts are computed in
+    integer minor units and only converted to floats for the output columns.
+    """
+    
+    pricer = calculate_landed_cost_batch if money is None else money.calculate_landed_cost
+    if duty_schedule is None:
+        result = pricer(**_catalog_inputs(catalog_df))
+    else:
+        result = pricer(**_catalog_inputs(catalog_df, optional=("tariff_rate",)),
+                        duty_breakdown=duty_schedule.evaluate(catalog_df))
+    if money is not None:
+        result = money.to_amounts(result)
+    
+    priced = catalog_df.copy()
+    for key in ["landed_cost", "tariff_amount", "profit", "margin_percentage", "min_profitable_msrp", "breakeven_price"]:
+        priced[key] = result[key]
+    for component in COST_COMPONENTS:
+        priced[f"{component}_per_unit"] = result["cost_breakdown"][component]
+    for name, duty in result.get("duty_breakdown", {}).items():
+        priced[f"duty_{name}_per_unit"] = duty
+    
+    return priced
+
+def generate_tariff_scenarios(base_msrp, cost_to_produce, min_tariff=0, max_tariff=100, steps=10, 
+                             shipping_cost=0, storage_cost=0, customs_fee=0, broker_fee=0, 
+                             other_costs=0, units_per_shipment=1):
+    """Generate scenarios for different tariff rates"""
+    
+    tariff_rates = np.linspace(min_tariff, max_tariff, steps)
+    result = calculate_landed_cost_batch(
+        base_msrp, cost_to_produce, tariff_rates, shipping_cost, storage_cost, 
+        customs_fee, broker_fee, other_costs, units_per_shipment
+    )
+    
+    return pd.DataFrame({
+        "tariff_rate": tariff_rates,
+        "landed_cost": result["landed_cost"],
+        "profit": result["profit"],
+        "margin": result["margin_percentage"],
+        "breakeven_price": result["breakeven_price"]
+    })
+
+def generate_price_scenarios(tariff_rate, cost_to_produce, min_price_factor=0.8, max_price_factor=2.0, steps=10,
+                            shipping_cost=0, storage_cost=0, customs_fee=0, broker_fee=0, 
+                            other_costs=0, units_per_shipment=1):
+    """Generate scenarios for different price points at a fixed tariff rate"""
+    
+    # Calculate base landed cost without MSRP
+    base_result = calculate_landed_cost(
+        100, cost_to_produce, tariff_rate, shipping_cost, storage_cost, 
+        customs_fee, broker_fee, other_costs, units_per_shipment
+    )
+    base_landed_cost = base_result["landed_cost"]
+    
+    # Generate price range from min_price_factor to max_price_factor of landed cost
+    min_price = base_landed_cost * min_price_factor
+    max_price = base_landed_cost * max_price_factor
+    
+    price_points = np.linspace(min_price, max_price, steps)
+    result = calculate_landed_cost_batch(
+        price_points, cost_to_produce, tariff_rate, shipping_cost, storage_cost, 
+        customs_fee, broker_fee, other_costs, units_per_shipment
+    )
+    
+    return pd.DataFrame({
+        "msrp": price_points,
+        "profit": result["profit"],
+        "margin": result["margin_percentage"],
+        "landed_cost": result["landed_cost"]
+    })
+
+def generate_sensitivity_grid(cost_to_produce, min_tariff=0, max_tariff=100, tariff_steps=100,
+                              min_price=50, max_price=200, price_steps=100, shipping_cost=0, storage_cost=0,
+                              customs_fee=0, broker_fee=0, other_costs=0, units_per_shipment=1):
+    """Profit and margin over the full tariff x price grid (rows are tariff rates, columns are prices)"""
+    
+    tariff_rates = np.linspace(min_tariff, max_tariff, tariff_steps)
+    price_points = np.linspace(min_price, max_price, price_steps)
+    
+    # Landed cost does not depend on price, so it is computed once per tariff rate and broadcast across prices
+    landed_cost = calculate_landed_cost_batch(
+        0, cost_to_produce, tariff_rates, shipping_cost, storage_cost,
+        customs_fee, broker_fee, other_costs, units_per_shipment
+    )["landed_cost"]
+    
+    profit = price_points[np.newaxis, :] - landed_cost[:, np.newaxis]
+    margin = np.zeros_like(profit)
+    np.divide(profit, price_points[np.newaxis, :], out=margin, where=price_points[np.newaxis, :] > 0)
+    margin *= 100
+    
+    return {
+        "tariff_rates": tariff_rates,
+        "price_points": price_points,
+        "landed_cost": landed_cost,
+        "profit": profit,
+        "margin": margin
+    }
@@ -0,0 +1,210 @@
+"""Exact money arithmetic on int64 arrays of minor units (cents or milli-cents) with explicit rounding."""
+
+from decimal import (ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP, Decimal,
+                     localcontext)
+
+import numpy as np
+
+from .currency import CURRENCY_SYMBOLS
+from .defaults import MONEY_SCALES, ROUNDING_MODES
+from .model import COST_COMPONENTS
+
+# Tariff rates are held as integer millionths of a percent, so 25.123456% is exact
+RATE_SCALE = 1_000_000
+
+# Largest magnitude in minor units one exact amount may take, so the sum of the seven cost components and the
+# MSRP stays inside int64 (about $5.7 trillion in milli-cents)
+MAX_MINOR = 2**59
+
+def _check_minor(minor, what):
+    """Raise OverflowError where minor units exceed MAX_MINOR rather than let int64 wrap around"""
+    if minor.size and np.abs(minor).max() > MAX_MINOR:
+        raise OverflowError(f"{what} exceeds the exact money range of {MAX_MINOR:,} minor units")
+
+def _divide_wide(numerators, denominator, rounding):
+    """divide_rounded for numerators beyond int64, as exact Python ints"""
+    with localcontext() as context:
+        context.prec = 60
+        return [int((Decimal(n) / Decimal(denominator)).quantize(Decimal(1), rounding=rounding)) for n in numerators]
+
+def _round_scaled(values, rounding):
+    """Round a float array already in minor units to integers by rounding rule, in place"""
+
+    # Inputs such as 19.99 are meant as exact decimals; snap away the binary noise in 19.99 * 100 first
+    values *= 1e6
+    np.rint(values, out=values)
+    values /= 1e6
+    if rounding == ROUND_HALF_EVEN:
+        return np.rint(values, out=values)
+    if rounding == ROUND_FLOOR:
+        return np.floor(values, out=values)
+    if rounding == ROUND_CEILING:
+        return np.ceil(values, out=values)
+    if rounding == ROUND_DOWN:
+        return np.trunc(values, out=values)
+    if rounding not in (ROUND_HALF_UP, ROUND_UP):
+        raise ValueError(f"Unknown rounding {rounding!r}; choose one of {', '.join(ROUNDING_MODES)}")
+    sign = np.sign(values)
+    np.abs(values, out=values)
+    if rounding == ROUND_HALF_UP:
+        values += 0.5
+        np.floor(values, out=values)
+    else:
+        np.ceil(values, out=values)
+    values *= sign
+    return values
+
+def divide_rounded(numerator, denominator, rounding=ROUND_HALF_EVEN):
+    """Exact integer division of int64 arrays (positive denominators) rounded by rule"""
+
+    numerator = np.asarray(numerator, dtype=np.int64)
+    denominator = np.asarray(denominator, dtype=np.int64)
+    quotient, remainder = np.divmod(numerator, denominator)  # Floor division: 0 <= remainder < denominator
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding in (ROUND_CEILING, ROUND_DOWN, ROUND_UP):
+        adjust = remainder > 0
+        if rounding == ROUND_DOWN:
+            adjust &= numerator < 0
+        elif rounding == ROUND_UP:
+            adjust &= numerator >= 0
+    elif rounding in (ROUND_HALF_EVEN, ROUND_HALF_UP):
+        remainder <<= 1  # Twice the remainder, compared with the denominator to find the nearest quotient
+        adjust = remainder == denominator
+        adjust &= (quotient & 1).astype(bool) if rounding == ROUND_HALF_EVEN else numerator >= 0
+        adjust |= remainder > denominator
+    else:
+        raise ValueError(f"Unknown rounding {rounding!r}; choose one of {', '.join(ROUNDING_MODES)}")
+    quotient += adjust
+    return quotient
+
+class ExactMoney:
+    """An exact money mode: amounts as int64 minor units at a fixed scale, rounded by one rule throughout"""
+
+    def __init__(self, scale=MONEY_SCALES["cents"], rounding=ROUND_HALF_EVEN):
+        if isinstance(scale, str):
+            if scale not in MONEY_SCALES:
+                raise ValueError(f"Unknown money scale {scale!r}; choose one of {', '.join(MONEY_SCALES)}")
+            scale = MONEY_SCALES[scale]
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unknown rounding {rounding!r}; choose one of {', '.join(ROUNDING_MODES)}")
+        self.scale = int(scale)
+        self.rounding = rounding
+
+    def to_minor(self, amounts):
+        """Amounts in currency units as int64 minor units; NaN becomes 0 (see "valid" in the pricing result)"""
+        scaled = np.array(amounts, dtype=np.float64)
+        scaled *= self.scale
+        scaled[~np.isfinite(scaled)] = 0.0
+        _check_minor(scaled, "An amount")
+        return _round_scaled(scaled, self.rounding).astype(np.int64)
+
+    def from_minor(self, minor):
+        """Minor units back to float currency units, for display and export only"""
+        return np.asarray(minor, dtype=np.int64) / self.scale
+
+    def total(self, amounts):
+        """Exact sum of currency amounts (floats from this mode) as a Python int of minor units"""
+        # Summed as Python ints, so long catalogs of large amounts cannot wrap around
+        return int(self.to_minor(amounts).sum(dtype=object))
+
+    def format(self, minor, currency="USD"):
+        """One amount in minor units formatted to cents, rounding by this mode's rule without floats"""
+
+        cents = int(divide_rounded(int(minor), self.scale // 100, self.rounding))
+        whole, fraction = divmod(abs(cents), 100)
+        text = f"{whole:,}.{fraction:02d}"
+        symbol = CURRENCY_SYMBOLS.get(currency)
+        text = f"{symbol}{text}" if symbol else f"{currency} {text}"
+        return f"-{text}" if cents < 0 else text
+
+    def calculate_landed_cost(self, msrp, cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0,
+                              customs_fee=0, broker_fee=0, other_costs=0, units_per_shipment=1,
+                              duty_breakdown=None):
+        """calculate_landed_cost_batch in exact money: every amount in the result is an int64 minor-unit array.
+
+        Each per-unit component is rounded once by this mode's rule and the landed cost is their exact sum,
+        so the breakdown always adds up. min_profitable_msrp rounds up so it never falls below 1% margin.
+        Rows with a missing input are False in result["valid"]; with a duty_breakdown, tariff_rate is not an
+        input and a row is invalid only where a duty is missing. Amounts beyond MAX_MINOR raise OverflowError.
+        """
+
+        inputs = np.broadcast_arrays(*[np.asarray(value, dtype=np.float64) for value in (
+            msrp, cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee,
+            other_costs, units_per_shipment
+        )])
+        # With duty rules tariff_rate may be absent (NaN); the rules' own inputs are checked through their duties
+        checked = inputs if duty_breakdown is None else inputs[:2] + inputs[3:]
+        valid = np.logical_and.reduce([np.isfinite(value) for value in checked])
+        msrp, cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee, \
+            other_costs, units_per_shipment = inputs
+
+        # Units are a whole count here; non-positive counts fall back to 1 as in the float model
+        units = np.rint(np.nan_to_num(units_per_shipment, nan=1.0)).astype(np.int64)
+        units = np.where(units > 0, units, 1)
+
+        msrp_minor = self.to_minor(msrp)
+        production = self.to_minor(cost_to_produce)
+        # Fees that are zero throughout (often storage and other costs) skip the division
+        per_unit = {name: divide_rounded(self.to_minor(fee), units, self.rounding) if fee.any() else np.zeros_like(units)
+                    for name, fee in (("shipping", shipping_cost), ("storage", storage_cost), ("customs", customs_fee),
+                                      ("broker", broker_fee), ("other", other_costs))}
+
+        if duty_breakdown is None:
+            rate = np.rint(np.nan_to_num(tariff_rate, nan=0.0) * RATE_SCALE)
+            _check_minor(rate, "A tariff rate")
+            rate = rate.astype(np.int64)
+            # production * rate passes int64 from about $92,000 at 100% in milli-cents; those rows divide exactly
+            # as Python ints, the rest stay vectorized
+            wide = np.abs(production.astype(np.float64)) * np.abs(rate) >= 2.0**62
+            tariff = np.asarray(divide_rounded(np.where(wide, 0, production) * rate, 100 * RATE_SCALE, self.rounding))
+            if wide.any():
+                tariff[wide] = _divide_wide([p * r for p, r in zip(production[wide].tolist(), rate[wide].tolist())],
+                                            100 * RATE_SCALE, self.rounding)
+            _check_minor(tariff, "A tariff amount")
+        else:
+            duties = {}
+            tariff = np.zeros_like(production)
+            for name, duty in duty_breakdown.items():
+                valid = valid & np.isfinite(duty)
+                duties[name] = self.to_minor(duty)
+                tariff = tariff + duties[name]
+
+        landed = production + tariff + sum(per_unit.values())
+        profit = msrp_minor - landed
+        margin = np.zeros(profit.shape)
+        np.divide(profit, msrp_minor, out=margin, where=msrp_minor > 0)
+
+        result = {
+            "landed_cost": landed,
+            "tariff_amount": tariff,
+            "profit": profit,
+            "margin_percentage": margin * 100,
+            # ceil(landed * 1.01) without forming landed * 101, which could pass int64
+            "min_profitable_msrp": landed + divide_rounded(landed, 100, ROUND_CEILING),
+            "breakeven_price": landed,
+            "cost_breakdown": dict(zip(COST_COMPONENTS, [production, tariff, *per_unit.values()])),
+            "valid": valid,
+            "scale": self.scale,
+        }
+        if duty_breakdown is not None:
+            result["duty_breakdown"] = duties
+        return result
+
+    def to_amounts(self, result):
+        """A calculate_landed_cost result with its minor units converted to float currency amounts, NaN where
+        an input was missing; the presentation edge for exact pricing"""
+
+        invalid = ~result["valid"]
+
+        def amounts(minor):
+            values = self.from_minor(minor)
+            return np.where(invalid, np.nan, values) if invalid.any() else values
+
+        converted = {key: amounts(result[key]) for key in
+                     ("landed_cost", "tariff_amount", "profit", "min_profitable_msrp", "breakeven_price")}
+        converted["margin_percentage"] = np.where(invalid, np.nan, result["margin_percentage"])
+        converted["cost_breakdown"] = {name: amounts(value) for name, value in result["cost_breakdown"].items()}
+        if "duty_breakdown" in result:
+            converted["duty_breakdown"] = {name: amounts(value) for name, value in result["duty_breakdown"].items()}
+        return converted
@@ -0,0 +1,112 @@
+"""Profit-maximizing prices under price-elastic demand, solved in closed form for many SKUs at once."""
+
+import numpy as np
+import pandas as pd
+
+from .defaults import DEMAND_MODELS
+from .model import price_catalog
+
+# Catalog columns read by optimize_catalog_prices besides the landed cost inputs; None marks a required column
+PRICING_COLUMNS = {
+    "msrp": None,
+    "elasticity": None,
+    "demand_per_period": 1.0,
+    "price_floor": np.nan,
+    "price_ceiling": np.nan,
+}
+
+def demand_at_price(price, msrp, demand, elasticity, demand_model="constant"):
+    """Units sold at price on the demand curve through (msrp, demand); elasticity is the magnitude, e.g. 1.8
+    for a 1.8% drop in volume per 1% rise in price"""
+
+    elasticity = np.abs(elasticity)
+    if demand_model == "constant":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return demand * (price / msrp) ** -elasticity
+    if demand_model == "linear":
+        return demand * np.maximum(1 - elasticity * (price - msrp) / msrp, 0.0)
+    raise ValueError(f"Unknown demand model {demand_model!r}; choose one of {', '.join(DEMAND_MODELS)}")
+
+def optimize_price(msrp, landed_cost, elasticity, demand=1.0, price_floor=np.nan, price_ceiling=np.nan, charm=None,
+                   demand_model="constant"):
+    """Price maximizing total profit (price - landed_cost) * demand for every SKU; inputs broadcast.
+
+    Profit is single-peaked in price on both demand models, so the peak is solved in closed form and clipped
+    to the floor and ceiling (NaN for none). With constant elasticity of 1 or less profit keeps rising with
+    price, so the optimum is the ceiling, or NaN without one. With charm (e.g. 0.99) the price becomes the
+    better of the charm prices just below and above the optimum that lie within the bounds.
+    """
+
+    msrp, landed_cost, elasticity, demand, price_floor, price_ceiling = np.broadcast_arrays(*[
+        np.asarray(value, dtype=np.float64) for value in (msrp, landed_cost, elasticity, demand, price_floor, price_ceiling)
+    ])
+    elasticity = np.abs(elasticity)
+    price_floor = np.where(np.isnan(price_floor), 0.0, price_floor)
+    price_ceiling = np.where(np.isnan(price_ceiling), np.inf, price_ceiling)
+
+    # Constant elasticity: the markup rule p = c * e / (e - 1). Linear: halfway between cost and the choke price
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if demand_model == "constant":
+            price = np.where(elasticity > 1, landed_cost * elasticity / (elasticity - 1), np.inf)
+        elif demand_model == "linear":
+            price = np.where(elasticity > 0, (msrp * (1 + 1 / elasticity) + landed_cost) / 2, np.inf)
+        else:
+            raise ValueError(f"Unknown demand model {demand_model!r}; choose one of {', '.join(DEMAND_MODELS)}")
+    price = np.clip(np.round(price, 2), price_floor, price_ceiling)
+    price = np.where(np.isfinite(price), price, np.nan)
+
+    if charm is not None:
+        if not 0 <= charm < 1:
+            raise ValueError("charm must be the cents a price ends in, e.g. 0.99")
+        below = np.floor(price - charm) + charm
+        candidates = np.round(np.stack([below, below + 1]), 2)
+        inside = (candidates >= price_floor) & (candidates <= price_ceiling)
+        with np.errstate(invalid="ignore"):
+            profits = (candidates - landed_cost) * demand_at_price(candidates, msrp, demand, elasticity, demand_model)
+        best = np.argmax(np.where(inside, profits, -np.inf), axis=0)
+        price = np.where(inside.any(axis=0), np.take_along_axis(candidates, best[np.newaxis], axis=0)[0], price)
+
+    expected_demand = demand_at_price(price, msrp, demand, elasticity, demand_model)
+    expected_profit = (price - landed_cost) * expected_demand
+    current_profit = (msrp - landed_cost) * demand
+    return {
+        "optimal_price": price,
+        "expected_demand": expected_demand,
+        "expected_profit": expected_profit,
+        "current_profit": current_profit,
+        "profit_gain": expected_profit - current_profit,
+    }
+
+def optimize_catalog_prices(catalog_df, elasticity=None, charm=None, demand_model="constant", duty_schedule=None):
+    """Profit-maximizing price for every catalog row, at its landed_cost column or else the cost model's.
+
+    Needs msrp and an elasticity column (or the elasticity argument for every row); demand_per_period,
+    price_floor and price_ceiling columns are optional. Reprice the catalog after a tariff change, then
+    optimize, to get the prices for the new landed costs.
+    """
+
+    columns = dict(PRICING_COLUMNS)
+    if elasticity is not None:
+        columns["elasticity"] = elasticity
+    missing = [col for col, default in columns.items() if default is None and col not in catalog_df.columns]
+    if missing:
+        raise ValueError(f"Catalog is missing required columns: {', '.join(missing)}")
+
+    inputs = {
+        col: pd.to_numeric(catalog_df[col], errors="coerce").to_numpy(dtype=np.float64)
+        if col in catalog_df.columns and not (col == "elasticity" and elasticity is not None) else default
+        for col, default in columns.items()
+    }
+    if "landed_cost" in catalog_df.columns:
+        landed_cost = pd.to_numeric(catalog_df["landed_cost"], errors="coerce").to_numpy(dtype=np.float64)
+    else:
+        landed_cost = price_catalog(catalog_df, duty_schedule)["landed_cost"].to_numpy()
+
+    result = optimize_price(inputs["msrp"], landed_cost, inputs["elasticity"], inputs["demand_per_period"],
+                            inputs["price_floor"], inputs["price_ceiling"], charm, demand_model)
+    optimized = catalog_df.copy()
+    for key, values in result.items():
+        optimized[key] = values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        optimized["price_change_pct"] = (result["optimal_price"] / inputs["msrp"] - 1) * 100
+    return optimized
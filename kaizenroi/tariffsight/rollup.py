@@ -0,0 +1,100 @@
+"""Portfolio rollups of a priced catalog by origin country, supplier and category, with drill-down."""
+
+import numpy as np
+import pandas as pd
+
+from .defaults import ROLLUP_DIMENSIONS
+
+# Group label for rows with no value in a rollup column
+ROLLUP_UNKNOWN = "Unknown"
+
+# Totals kept per group; weighted_margin is derived from them
+_TOTALS = ["skus", "unprofitable_skus", "units", "total_duty", "total_revenue", "total_profit"]
+
+class PortfolioRollup:
+    """Group totals at the finest grain (one group per combination of dimension values), fed a priced chunk at
+    a time; every rollup level and drill-down is then aggregated from these totals instead of the catalog rows.
+
+    Duty, revenue and profit are per-unit results weighted by the volume column (units_per_shipment by default).
+    """
+
+    def __init__(self, dimensions=ROLLUP_DIMENSIONS, volume_column="units_per_shipment"):
+        self.dimensions = list(dimensions)
+        self.volume_column = volume_column
+        self.available = []
+        self.leaves = pd.DataFrame(columns=self.dimensions + _TOTALS)
+        self._views = {}
+
+    @classmethod
+    def from_frame(cls, priced_df, **options):
+        rollup = cls(**options)
+        rollup.add(priced_df)
+        return rollup
+
+    def add(self, priced_df):
+        """Fold a priced catalog chunk (price_catalog output) into the group totals"""
+
+        if priced_df.empty:
+            return
+        for dim in self.dimensions:
+            if dim in priced_df.columns and dim not in self.available:
+                self.available.append(dim)
+        self.available.sort(key=self.dimensions.index)
+
+        profit = priced_df["profit"].to_numpy(dtype=np.float64)
+        if self.volume_column in priced_df.columns:
+            units = pd.to_numeric(priced_df[self.volume_column], errors="coerce").to_numpy(dtype=np.float64)
+        else:
+            units = np.ones(len(priced_df))
+        values = pd.DataFrame({
+            "skus": 1,
+            "unprofitable_skus": (profit < 0).astype(np.int64),
+            "units": units,
+            "total_duty": priced_df["tariff_amount"].to_numpy(dtype=np.float64) * units,
+            "total_revenue": np.where(np.isnan(profit), np.nan, priced_df["msrp"].to_numpy(dtype=np.float64) * units),
+            "total_profit": profit * units,
+        }, index=priced_df.index)
+        keys = [priced_df[dim] if dim in priced_df.columns else pd.Series(ROLLUP_UNKNOWN, index=priced_df.index, name=dim)
+                for dim in self.dimensions]
+
+        # Group on the raw values, then clean the (few) group labels and merge groups they make equal
+        part = values.groupby(keys, dropna=False, sort=False).sum(min_count=0).reset_index()
+        for dim in self.dimensions:
+            labels = part[dim].astype("string").str.strip()
+            part[dim] = labels.mask(labels.isna() | (labels == ""), ROLLUP_UNKNOWN).astype(object)
+        combined = part if self.leaves.empty else pd.concat([self.leaves, part], ignore_index=True)
+        self.leaves = combined.groupby(self.dimensions, sort=False).sum(min_count=0).reset_index()
+        self._views = {}
+
+    def totals(self, by, path=None):
+        """Groups of one rollup level, largest duty first; path maps outer dimensions to the group drilled into.
+
+        Each (level, path) is aggregated once and cached until more rows are added.
+        """
+
+        if by not in self.dimensions:
+            raise ValueError(f"Cannot roll up by {by}; choose one of {', '.join(self.dimensions)}")
+        path = dict(path or {})
+        key = (by, tuple(sorted(path.items())))
+        if key not in self._views:
+            leaves = self.leaves
+            if path:
+                mask = np.ones(len(leaves), dtype=bool)
+                for dim, value in path.items():
+                    mask &= (leaves[dim] == value).to_numpy()
+                leaves = leaves[mask]
+            view = leaves.groupby(by, sort=False)[_TOTALS].sum().reset_index()
+            with np.errstate(divide="ignore", invalid="ignore"):
+                view["weighted_margin"] = np.where(view["total_revenue"] != 0,
+                                                   view["total_profit"] / view["total_revenue"] * 100, np.nan)
+            self._views[key] = view.sort_values("total_duty", ascending=False, ignore_index=True)
+        return self._views[key]
+
+    def overall(self):
+        """Portfolio-wide totals as a dict, with weighted_margin"""
+
+        totals = {name: float(self.leaves[name].sum()) for name in _TOTALS}
+        totals["skus"], totals["unprofitable_skus"] = int(totals["skus"]), int(totals["unprofitable_skus"])
+        totals["weighted_margin"] = (totals["total_profit"] / totals["total_revenue"] * 100
+                                     if totals["total_revenue"] else float("nan"))
+        return totals
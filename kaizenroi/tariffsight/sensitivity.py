@@ -0,0 +1,151 @@
+"""Analytic sensitivity of profit and margin to every cost input, per SKU and as a portfolio tornado."""
+
+import numpy as np
+import pandas as pd
+
+from .model import _catalog_inputs
+
+# Cost model inputs a sensitivity analysis moves, one at a time
+SENSITIVITY_INPUTS = ("cost_to_produce", "tariff_rate", "shipping_cost", "storage_cost", "customs_fee", "broker_fee",
+                      "other_costs", "units_per_shipment")
+
+# Per-shipment fees, each spread over the units of a shipment
+_FEES = ("shipping_cost", "storage_cost", "customs_fee", "broker_fee", "other_costs")
+
+def _margin(profit, msrp):
+    margin = np.zeros_like(profit)
+    np.divide(profit * 100, msrp, out=margin, where=msrp > 0)
+    return np.where(np.isnan(profit), np.nan, margin)
+
+def landed_cost_sensitivity(msrp, cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0, customs_fee=0,
+                            broker_fee=0, other_costs=0, units_per_shipment=1, swing_pct=10):
+    """Per-unit profit and margin sensitivity to every input of calculate_landed_cost, in one vectorized pass.
+
+    Returns the base profit and margin and, per input, the derivative of profit and margin and the profit
+    and margin with that input alone moved swing_pct percent down ("low") and up ("high"). Profit is linear
+    in every input but units per shipment, whose swings are evaluated exactly rather than from the derivative.
+    """
+
+    if not 0 < swing_pct < 100:
+        raise ValueError("swing_pct must be between 0 and 100")
+    msrp, *inputs = np.broadcast_arrays(*[
+        np.asarray(value, dtype=np.float64) for value in (
+            msrp, cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee, other_costs,
+            units_per_shipment
+        )
+    ])
+    values = dict(zip(SENSITIVITY_INPUTS, inputs))
+    cost, rate = values["cost_to_produce"], values["tariff_rate"]
+    units = np.where(values["units_per_shipment"] > 0, values["units_per_shipment"], 1.0)
+    fees = sum(values[name] for name in _FEES)
+
+    production_and_tariff = cost * (1 + rate / 100)
+    profit = msrp - production_and_tariff - fees / units
+    swing = swing_pct / 100
+
+    derivative = {"cost_to_produce": -(1 + rate / 100), "tariff_rate": -cost / 100}
+    derivative.update({name: -1 / units for name in _FEES})
+    derivative["units_per_shipment"] = fees / units ** 2
+
+    profit_low, profit_high = {}, {}
+    for name, slope in derivative.items():
+        if name == "units_per_shipment":
+            profit_low[name] = msrp - production_and_tariff - fees / (units * (1 - swing))
+            profit_high[name] = msrp - production_and_tariff - fees / (units * (1 + swing))
+        else:
+            step = slope * values[name] * swing
+            profit_low[name] = profit - step
+            profit_high[name] = profit + step
+
+    return {
+        "profit": profit,
+        "margin": _margin(profit, msrp),
+        "profit_derivative": {name: np.broadcast_to(slope, profit.shape) for name, slope in derivative.items()},
+        "margin_derivative": {name: _margin(np.broadcast_to(slope, profit.shape), msrp) for name, slope in derivative.items()},
+        "profit_low": profit_low,
+        "profit_high": profit_high,
+        "margin_low": {name: _margin(value, msrp) for name, value in profit_low.items()},
+        "margin_high": {name: _margin(value, msrp) for name, value in profit_high.items()},
+    }
+
+def _sensitivity_inputs(catalog_df):
+    """Cost model inputs of a catalog; a priced catalog's tariff is taken as its effective ad valorem rate, so
+    stacked duties are moved as a whole"""
+
+    inputs = _catalog_inputs(catalog_df, optional=("tariff_rate",) if "tariff_amount" in catalog_df.columns else ())
+    if "tariff_amount" in catalog_df.columns:
+        tariff = catalog_df["tariff_amount"].to_numpy(dtype=np.float64)
+        inputs["tariff_rate"] = np.zeros_like(tariff)
+        np.divide(tariff * 100, inputs["cost_to_produce"], out=inputs["tariff_rate"], where=inputs["cost_to_produce"] != 0)
+        inputs["tariff_rate"][np.isnan(tariff)] = np.nan
+    return inputs
+
+def catalog_sensitivity(catalog_df, swing_pct=10):
+    """The catalog with each input's profit swing per unit (high minus low, as a magnitude) and the input
+    moving profit most (top_driver) for every row"""
+
+    result = landed_cost_sensitivity(**_sensitivity_inputs(catalog_df), swing_pct=swing_pct)
+    swings = np.stack([np.abs(result["profit_high"][name] - result["profit_low"][name]) for name in SENSITIVITY_INPUTS])
+
+    ranked = catalog_df.copy()
+    for name, swing in zip(SENSITIVITY_INPUTS, swings):
+        ranked[f"{name}_profit_swing"] = swing
+    top = np.argmax(np.nan_to_num(swings, nan=-1.0), axis=0)
+    ranked["top_driver"] = np.where(np.isnan(swings).all(axis=0), None, np.array(SENSITIVITY_INPUTS, dtype=object)[top])
+    return ranked
+
+class SensitivityTornado:
+    """Portfolio profit and weighted margin with each input moved swing_pct percent down and up across every
+    SKU at once, fed a catalog chunk at a time; totals are weighted by the volume column at its base value."""
+
+    def __init__(self, swing_pct=10, volume_column="units_per_shipment"):
+        if not 0 < swing_pct < 100:
+            raise ValueError("swing_pct must be between 0 and 100")
+        self.swing_pct = swing_pct
+        self.volume_column = volume_column
+        self.skus = 0
+        self.profit = 0.0
+        self.revenue = 0.0
+        self._low = dict.fromkeys(SENSITIVITY_INPUTS, 0.0)
+        self._high = dict.fromkeys(SENSITIVITY_INPUTS, 0.0)
+
+    def add(self, catalog_df):
+        """Fold a catalog or priced catalog chunk into the totals; rows with a missing input are left out"""
+
+        if catalog_df.empty:
+            return
+        inputs = _sensitivity_inputs(catalog_df)
+        result = landed_cost_sensitivity(**inputs, swing_pct=self.swing_pct)
+        if self.volume_column in catalog_df.columns:
+            weight = pd.to_numeric(catalog_df[self.volume_column], errors="coerce").to_numpy(dtype=np.float64)
+        else:
+            weight = np.ones(len(catalog_df))
+        weight = np.where(np.isfinite(result["profit"]), weight, np.nan)
+
+        self.skus += int(np.isfinite(weight).sum())
+        self.profit += float(np.nansum(weight * result["profit"]))
+        self.revenue += float(np.nansum(weight * inputs["msrp"]))
+        for name in SENSITIVITY_INPUTS:
+            self._low[name] += float(np.nansum(weight * result["profit_low"][name]))
+            self._high[name] += float(np.nansum(weight * result["profit_high"][name]))
+
+    def overall(self):
+        """Base portfolio totals as a dict, with weighted_margin"""
+        return {"skus": self.skus, "total_profit": self.profit, "total_revenue": self.revenue,
+                "weighted_margin": self.profit / self.revenue * 100 if self.revenue else float("nan")}
+
+    def table(self):
+        """One row per input with portfolio profit and weighted margin at its low and high values, widest
+        profit swing first"""
+
+        table = pd.DataFrame({
+            "input": list(SENSITIVITY_INPUTS),
+            "profit_low": [self._low[name] for name in SENSITIVITY_INPUTS],
+            "profit_high": [self._high[name] for name in SENSITIVITY_INPUTS],
+        })
+        with np.errstate(divide="ignore", invalid="ignore"):
+            revenue = self.revenue if self.revenue else np.nan
+            table["margin_low"] = table["profit_low"] / revenue * 100
+            table["margin_high"] = table["profit_high"] / revenue * 100
+        table["profit_swing"] = (table["profit_high"] - table["profit_low"]).abs()
+        return table.sort_values("profit_swing", ascending=False, ignore_index=True)
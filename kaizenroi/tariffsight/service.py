@@ -0,0 +1,358 @@
+"""Local HTTP/JSON pricing service over the cost model, built on asyncio streams with no dependencies beyond numpy.
+
+Concurrent single-item requests are coalesced into one vectorized batch; connections are kept alive.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from http import HTTPStatus
+
+import numpy as np
+
+from .defaults import SERVICE_BATCH_WINDOW, SERVICE_HOST, SERVICE_MAX_BATCH, SERVICE_PORT
+from .model import CATALOG_COLUMNS, COST_COMPONENTS, calculate_landed_cost_batch
+
+# Latest request latencies kept per endpoint, and the percentiles /stats reports from them
+SERVICE_LATENCY_SAMPLES = 10_000
+SERVICE_PERCENTILES = (50, 90, 99, 99.9)
+
+# Largest request body accepted, and how long an idle keep-alive connection is held open
+SERVICE_MAX_BODY = 16 * 1024 * 1024
+SERVICE_IDLE_SECONDS = 30
+
+# Endpoints by (method, path)
+SERVICE_ROUTES = {
+    ("GET", "/health"): "health",
+    ("GET", "/stats"): "stats",
+    ("POST", "/price"): "price",
+    ("POST", "/price/batch"): "price_batch",
+}
+
+# Per-unit results returned for every item, besides its cost_breakdown
+_RESULT_KEYS = ("landed_cost", "tariff_amount", "profit", "margin_percentage", "min_profitable_msrp", "breakeven_price")
+
+class _RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _check_item(item, index=0):
+    """The cost model inputs of one JSON item as floats, with defaults for optional fees"""
+
+    if not isinstance(item, dict):
+        raise _RequestError(HTTPStatus.BAD_REQUEST, f"Item {index} is not an object")
+    values = []
+    for col, default in CATALOG_COLUMNS.items():
+        value = item.get(col, default)
+        if value is None:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, f"Item {index} is missing {col}")
+        try:
+            number = float(value)
+        except (TypeError, ValueError, OverflowError):  # JSON integers can be too large for a float
+            number = np.nan
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(number):
+            raise _RequestError(HTTPStatus.BAD_REQUEST, f"Item {index}: {col} must be a finite number")
+        values.append(number)
+    return values
+
+def _price_items(items, rows):
+    """Price checked input rows in one batch and return one result object per item, or None for an item whose
+    result is not finite (inputs near the float limit)"""
+
+    # Overflow to inf is reported per item below rather than as a warning
+    with np.errstate(over="ignore", invalid="ignore"):
+        result = calculate_landed_cost_batch(*np.array(rows, dtype=np.float64).T)
+    columns = {key: result[key].tolist() for key in _RESULT_KEYS}
+    breakdown = {name: result["cost_breakdown"][name].tolist() for name in COST_COMPONENTS}
+    finite = np.logical_and.reduce([np.isfinite(result[key]) for key in _RESULT_KEYS]
+                                   + [np.isfinite(values) for values in result["cost_breakdown"].values()])
+
+    priced = []
+    for i, item in enumerate(items):
+        if not finite[i]:
+            priced.append(None)
+            continue
+        entry = {"id": item["id"]} if "id" in item else {}
+        entry.update({key: values[i] for key, values in columns.items()})
+        entry["cost_breakdown"] = {name: values[i] for name, values in breakdown.items()}
+        priced.append(entry)
+    return priced
+
+def _not_finite(index):
+    return _RequestError(HTTPStatus.UNPROCESSABLE_ENTITY, f"Item {index}: the result is not a finite number; "
+                                                          "the inputs are too large to price")
+
+def _percentiles(samples):
+    if not samples:
+        return {}
+    values = np.percentile(np.fromiter(samples, dtype=np.float64), SERVICE_PERCENTILES) * 1000
+    latency = {f"p{p:g}": round(float(v), 3) for p, v in zip(SERVICE_PERCENTILES, values)}
+    latency["max"] = round(max(samples) * 1000, 3)
+    return latency
+
+def _response(status, payload, keep_alive):
+    body = json.dumps(payload, separators=(",", ":"), allow_nan=False).encode()
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+class PricingService:
+    """The cost model over HTTP/JSON: POST /price prices one item, POST /price/batch a list of items (or
+    {"items": [...]}), GET /stats reports request counts, latency percentiles and batching, GET /health.
+
+    An item has msrp, cost_to_produce and tariff_rate, optionally the per-shipment fees and units_per_shipment,
+    and an optional id echoed in its result. Single items arriving within batch_window seconds of each other
+    are priced together in one batch of at most max_batch items.
+    """
+
+    def __init__(self, host=SERVICE_HOST, port=SERVICE_PORT, batch_window=SERVICE_BATCH_WINDOW,
+                 max_batch=SERVICE_MAX_BATCH):
+        self.host = host
+        self.port = port
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.started = time.time()
+        self._server = None
+        self._pending = []
+        self._flush_handle = None
+        self._requests = dict.fromkeys(SERVICE_ROUTES.values(), 0)
+        self._latencies = {name: deque(maxlen=SERVICE_LATENCY_SAMPLES) for name in SERVICE_ROUTES.values()}
+        self._batches = 0
+        self._batched_items = 0
+
+    async def start(self):
+        """Start listening; with port 0 the port chosen by the OS is stored in self.port"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def stats(self):
+        return {
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "requests": dict(self._requests),
+            "latency_ms": {name: _percentiles(samples) for name, samples in self._latencies.items() if samples},
+            "batches": self._batches,
+            "batched_items": self._batched_items,
+            "mean_batch_size": round(self._batched_items / self._batches, 2) if self._batches else 0.0,
+        }
+
+    def _price_one(self, item):
+        """A future for one item's result, priced with whatever other single items arrive in the batch window"""
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, _check_item(item), future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        items, rows, futures = zip(*pending)
+        self._batches += 1
+        self._batched_items += len(items)
+        try:
+            priced = _price_items(items, rows)
+        except Exception as e:
+            # Runs from the event loop, not a request; every waiting request fails with the error instead of hanging
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, priced):
+            if future.done():
+                continue
+            if result is None:
+                future.set_exception(_not_finite(0))
+            else:
+                future.set_result(result)
+
+    async def _route(self, name, body):
+        if name == "health":
+            return {"status": "ok"}
+        if name == "stats":
+            return self.stats()
+        try:
+            payload = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, f"Body is not valid JSON: {e}")
+        if name == "price":
+            return await self._price_one(payload)
+
+        items = payload.get("items") if isinstance(payload, dict) else payload
+        if not isinstance(items, list) or not items:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, 'Expected a non-empty list of items (or {"items": [...]})')
+        rows = [_check_item(item, i) for i, item in enumerate(items)]
+        self._batches += 1
+        self._batched_items += len(items)
+        priced = _price_items(items, rows)
+        if None in priced:
+            raise _not_finite(priced.index(None))
+        return {"results": priced}
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), SERVICE_IDLE_SECONDS)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+                    break
+                started = time.perf_counter()
+                lines = head.decode("latin-1").split("\r\n")
+                method, path, version = (lines[0].split(" ") + ["", "", ""])[:3]
+                headers = {}
+                for line in lines[1:]:
+                    key, _, value = line.partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                name = SERVICE_ROUTES.get((method, path.split("?", 1)[0]))
+                try:
+                    if "chunked" in headers.get("transfer-encoding", "").lower():
+                        keep_alive = False
+                        raise _RequestError(HTTPStatus.LENGTH_REQUIRED, "Send the body with a Content-Length")
+                    try:
+                        length = int(headers.get("content-length", 0))
+                    except ValueError:
+                        keep_alive = False
+                        raise _RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+                    if length > SERVICE_MAX_BODY:
+                        keep_alive = False
+                        raise _RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Bodies are limited to {SERVICE_MAX_BODY:,} bytes")
+                    body = await reader.readexactly(length) if length > 0 else b""
+                    if name is None:
+                        known = any(route_path == path.split("?", 1)[0] for _, route_path in SERVICE_ROUTES)
+                        raise _RequestError(HTTPStatus.METHOD_NOT_ALLOWED if known else HTTPStatus.NOT_FOUND,
+                                            f"No endpoint {method} {path}")
+                    status, payload = HTTPStatus.OK, await self._route(name, body)
+                except _RequestError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as e:  # A failure in pricing itself is this request's 500, not a dropped connection
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Pricing failed: {e}"}
+
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if name is not None:
+                    self._requests[name] += 1
+                    self._latencies[name].append(time.perf_counter() - started)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+def run_service(host=SERVICE_HOST, port=SERVICE_PORT, batch_window=SERVICE_BATCH_WINDOW, max_batch=SERVICE_MAX_BATCH,
+                on_start=None):
+    """Run a PricingService until interrupted; on_start is called with it once it is listening"""
+
+    async def main():
+        service = PricingService(host, port, batch_window, max_batch)
+        await service.start()
+        if on_start is not None:
+            on_start(service)
+        await service.serve_forever()
+
+    asyncio.run(main())
+
+async def _client_request(reader, writer, host, method, path, payload=None):
+    """One request on an open keep-alive connection; returns (status, decoded JSON body)"""
+
+    body = json.dumps(payload, separators=(",", ":"), allow_nan=False).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status = int(head.split(" ", 2)[1])
+    length = 0
+    for line in head.split("\r\n")[1:]:
+        key, _, value = line.partition(":")
+        if key.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length)) if length else None
+
+async def load_test(host=SERVICE_HOST, port=SERVICE_PORT, requests=10_000, concurrency=64, batch_size=1, seed=0):
+    """Drive a running service from concurrency keep-alive connections and measure it from the client side.
+
+    Sends requests single-item POST /price calls, or POST /price/batch calls of batch_size items when batch_size
+    is above 1, with random order lines. Returns throughput, client latency percentiles and the service's /stats.
+    """
+
+    rng = np.random.default_rng(seed)
+    cost = rng.uniform(5, 200, 1000)
+    lines = [{
+        "id": f"line-{i}", "msrp": round(c * m, 2), "cost_to_produce": round(c, 2), "tariff_rate": round(t, 1),
+        "shipping_cost": round(s, 2), "customs_fee": 250.0, "units_per_shipment": int(u),
+    } for i, (c, m, t, s, u) in enumerate(zip(cost, rng.uniform(1.2, 3.0, 1000), rng.uniform(0, 150, 1000),
+                                               rng.uniform(0, 5000, 1000), rng.integers(1, 5000, 1000)))]
+    path = "/price" if batch_size <= 1 else "/price/batch"
+
+    latencies = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in remaining:
+                if batch_size <= 1:
+                    payload = lines[i % len(lines)]
+                else:
+                    start = i * batch_size
+                    payload = {"items": [lines[(start + k) % len(lines)] for k in range(batch_size)]}
+                sent = time.perf_counter()
+                status, _ = await _client_request(reader, writer, host, "POST", path, payload)
+                latencies.append(time.perf_counter() - sent)
+                errors += status != HTTPStatus.OK
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(max(1, min(concurrency, requests)))])
+    seconds = time.perf_counter() - started
+
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, server = await _client_request(reader, writer, host, "GET", "/stats")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    items = requests * max(batch_size, 1)
+    return {
+        "requests": requests,
+        "items": items,
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "requests_per_second": round(requests / seconds, 1),
+        "items_per_second": round(items / seconds, 1),
+        "latency_ms": _percentiles(latencies),
+        "server": server,
+    }
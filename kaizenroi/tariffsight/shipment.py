@@ -0,0 +1,149 @@
+"""Shipment size optimizer: per-unit landed cost over candidate shipment sizes for many SKUs at once."""
+
+import numpy as np
+import pandas as pd
+
+# Geometric grid of candidate sizes per SKU, from 1 unit up to its demand cap
+SHIPMENT_CANDIDATES = 256
+
+# Container counts tried on each side of the one holding the bound's minimum (see optimize_shipment_size)
+CONTAINER_WINDOW = 1
+
+# SKUs evaluated per block, bounding the (SKUs x candidates) working arrays
+SHIPMENT_CHUNK_SKUS = 8192
+
+# Catalog columns read by optimize_catalog_shipments; None marks a required column
+SHIPMENT_COLUMNS = {
+    "cost_to_produce": None,
+    "tariff_rate": None,
+    "shipping_cost": 0.0,
+    "storage_cost": 0.0,
+    "customs_fee": 0.0,
+    "broker_fee": 0.0,
+    "other_costs": 0.0,
+    "demand_per_period": None,
+    "holding_cost": 0.0,
+    "container_capacity": np.inf,
+}
+
+def shipment_unit_cost(units, cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee,
+                       other_costs, demand_per_period, holding_cost, container_capacity):
+    """Per-unit landed cost when shipping `units` at a time; inputs broadcast against each other.
+
+    Shipping is charged per container, the other fees per shipment, and holding cost grows with the
+    average inventory a shipment leaves on hand (units / 2 for units / demand periods).
+    A container_capacity of inf or <= 0 means no container limit.
+    """
+
+    units = np.maximum(units, 1.0)
+    container_capacity = np.where(container_capacity > 0, container_capacity, np.inf)
+    containers = np.where(np.isfinite(container_capacity), np.ceil(units / container_capacity), 1.0)
+    fixed = shipping_cost * containers + storage_cost + customs_fee + broker_fee + other_costs
+    return cost_to_produce * (1 + tariff_rate / 100) + fixed / units + holding_cost * units / (2 * demand_per_period)
+
+def optimize_shipment_size(cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0, customs_fee=0, broker_fee=0,
+                           other_costs=0, demand_per_period=1000, holding_cost=0, container_capacity=np.inf,
+                           max_periods=12, candidates=SHIPMENT_CANDIDATES, curve_points=64):
+    """Shipment size minimizing per-unit landed cost for each SKU, capped at max_periods of demand.
+
+    Inputs broadcast like calculate_landed_cost_batch (container_capacity inf or <= 0 means no limit).
+    Returns recommended_units and landed_cost arrays, plus curve_units / curve_cost of shape
+    (SKUs, curve_points) tracing each SKU's cost curve on a geometric grid.
+    """
+
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (
+        cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee,
+        other_costs, demand_per_period, holding_cost, container_capacity
+    )])
+    cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee, broker_fee, \
+        other_costs, demand_per_period, holding_cost, container_capacity = arrays
+    container_capacity = np.where(container_capacity > 0, container_capacity, np.inf)
+    demand_per_period = np.where(demand_per_period > 0, demand_per_period, np.nan)
+    max_units = np.maximum(np.floor(demand_per_period * max_periods), 1.0)
+    max_units = np.where(np.isnan(max_units), 1.0, max_units)
+
+    n = len(cost_to_produce)
+    recommended = np.empty(n)
+    best_cost = np.empty(n)
+    curve_units = np.empty((n, curve_points))
+    curve_cost = np.empty((n, curve_points))
+    grid = np.linspace(0.0, 1.0, candidates)
+    curve_grid = np.linspace(0.0, 1.0, curve_points)
+
+    for start in range(0, n, SHIPMENT_CHUNK_SKUS):
+        block = slice(start, min(start + SHIPMENT_CHUNK_SKUS, n))
+        args = [a[block, None] for a in (cost_to_produce, tariff_rate, shipping_cost, storage_cost, customs_fee,
+                                         broker_fee, other_costs, demand_per_period, holding_cost, container_capacity)]
+        cap = max_units[block, None]
+        capacity = args[-1]
+
+        # The per-unit fees are at least S / C + F / q + h * q / (2 D) (S shipping per container of C units, F the
+        # other fees), equal to it on full containers. That bound is convex, so no size beyond the full containers
+        # either side of its minimum q_m can win, and only the container counts around q_m need trying
+        per_container = np.where(np.isfinite(capacity), capacity, cap)
+        other_fees = args[3] + args[4] + args[5] + args[6]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            q_m = np.where(args[8] > 0, np.sqrt(2 * args[7] * other_fees / args[8]), cap)
+        q_m = np.minimum(np.maximum(np.nan_to_num(q_m, nan=1.0), 1.0), cap)
+        k = np.ceil(q_m / per_container) + np.arange(-CONTAINER_WINDOW, CONTAINER_WINDOW + 1)
+        k = np.minimum(np.maximum(k, 1.0), np.ceil(cap / per_container))
+
+        # Within a container count k the cost is fixed_k / q + h * q / (2 D), minimized at q = sqrt(2 D fixed_k / h);
+        # clipping that to the k-container range and adding the full-container sizes covers every local optimum
+        low, high = (k - 1) * per_container + 1, np.minimum(k * per_container, cap)
+        fixed = args[2] * k + other_fees
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eoq = np.where(args[8] > 0, np.sqrt(2 * args[7] * fixed / args[8]), high)
+        eoq = np.minimum(np.maximum(eoq, low), high)
+
+        units = np.concatenate([
+            np.round(cap ** grid),
+            np.floor(high),
+            np.floor(eoq),
+            np.ceil(np.minimum(eoq, np.floor(high))),
+        ], axis=1)
+
+        costs = shipment_unit_cost(units, *args)
+        best = np.argmin(np.where(np.isnan(costs), np.inf, costs), axis=1)
+        rows = np.arange(units.shape[0])
+        recommended[block] = units[rows, best]
+        best_cost[block] = costs[rows, best]
+
+        curve_units[block] = np.round(cap ** curve_grid)
+        curve_cost[block] = shipment_unit_cost(curve_units[block], *args)
+
+    return {
+        "recommended_units": recommended,
+        "landed_cost": best_cost,
+        "max_units": max_units,
+        "curve_units": curve_units,
+        "curve_cost": curve_cost,
+    }
+
+def optimize_catalog_shipments(catalog_df, max_periods=12, candidates=SHIPMENT_CANDIDATES):
+    """Recommended units_per_shipment for every catalog row, with the per-unit saving over the current size.
+
+    Needs cost_to_produce, tariff_rate and demand_per_period columns; the rest of SHIPMENT_COLUMNS are optional.
+    Current sizes above max_periods of demand can show a negative saving, as the recommendation respects the cap.
+    """
+
+    missing = [col for col, default in SHIPMENT_COLUMNS.items() if default is None and col not in catalog_df.columns]
+    if missing:
+        raise ValueError(f"Catalog is missing required columns: {', '.join(missing)}")
+
+    inputs = {
+        col: pd.to_numeric(catalog_df[col], errors="coerce").to_numpy(dtype=np.float64)
+        if col in catalog_df.columns else default
+        for col, default in SHIPMENT_COLUMNS.items()
+    }
+    result = optimize_shipment_size(**inputs, max_periods=max_periods, candidates=candidates, curve_points=2)
+
+    optimized = catalog_df.copy()
+    optimized["recommended_units_per_shipment"] = result["recommended_units"]
+    optimized["optimized_landed_cost"] = result["landed_cost"]
+    if "units_per_shipment" in catalog_df.columns:
+        current_units = pd.to_numeric(catalog_df["units_per_shipment"], errors="coerce").to_numpy(dtype=np.float64)
+        current = shipment_unit_cost(current_units, **inputs)
+        optimized["current_landed_cost"] = current
+        optimized["savings_per_unit"] = current - result["landed_cost"]
+    return optimized
@@ -0,0 +1,139 @@
+"""Tariff shocks applied incrementally to a priced baseline catalog, touching only the affected rows."""
+
+import numpy as np
+import pandas as pd
+
+from .defaults import SHOCK_DIMENSIONS
+
+# Priced catalog columns a baseline keeps; the first five are required
+SHOCK_COLUMNS = ["msrp", "cost_to_produce", "tariff_rate", "tariff_amount", "landed_cost", "units_per_shipment",
+                 "sku", "country_of_origin", "supplier", "category", "hs_code"]
+
+class ShockBaseline:
+    """A priced catalog held as arrays, with per-dimension row indexes built on first use.
+
+    shock() finds the affected rows through the index and reprices only those from the cached per-unit
+    tariff and landed cost, so its cost grows with the rows affected rather than the catalog size.
+    """
+
+    def __init__(self, priced_df):
+        missing = [col for col in SHOCK_COLUMNS[:5] if col not in priced_df.columns]
+        if missing:
+            raise ValueError(f"Priced catalog is missing columns: {', '.join(missing)}")
+
+        def numeric(col):
+            return pd.to_numeric(priced_df[col], errors="coerce").to_numpy(dtype=np.float64)
+
+        self.rows = len(priced_df)
+        self.msrp = numeric("msrp")
+        self.cost = numeric("cost_to_produce")
+        self.tariff_rate = numeric("tariff_rate")
+        self.tariff_amount = numeric("tariff_amount")
+        self.landed_cost = numeric("landed_cost")
+        self.units = numeric("units_per_shipment") if "units_per_shipment" in priced_df.columns else np.ones(self.rows)
+        self.keys = {col: priced_df[col].to_numpy() for col in SHOCK_COLUMNS[6:] if col in priced_df.columns}
+        self.available = [dim for dim in SHOCK_DIMENSIONS
+                          if (dim == "hs_chapter" and "hs_code" in self.keys) or dim in self.keys]
+        self._indexes = {}
+
+    @classmethod
+    def from_csv(cls, path):
+        """Load the columns a baseline needs from a priced catalog CSV (tariffsight price output)"""
+        header = pd.read_csv(path, nrows=0).columns
+        return cls(pd.read_csv(path, usecols=[col for col in SHOCK_COLUMNS if col in header],
+                               dtype={"sku": str, "hs_code": str}))
+
+    def _index(self, dim):
+        """(group labels, group number per row, row numbers sorted by group, group start offsets) for one dimension"""
+
+        if dim not in self._indexes:
+            if dim not in self.available:
+                raise ValueError(f"Catalog has no {'hs_code' if dim == 'hs_chapter' else dim} column to select rows by")
+            codes, uniques = pd.factorize(self.keys["hs_code" if dim == "hs_chapter" else dim])
+            labels = pd.Series(uniques, dtype="string").str.strip()
+            if dim == "hs_chapter":
+                labels = labels.str.replace(r"\D", "", regex=True).str.slice(0, 2)
+
+            # Labels that clean to the same text (e.g. "CN" and " CN") share one group
+            groups, group_labels = pd.factorize(labels)
+            row_groups = np.append(groups, -1)[codes]
+            order = np.argsort(row_groups, kind="stable")
+            starts = np.searchsorted(row_groups[order], np.arange(len(group_labels) + 1))
+            self._indexes[dim] = (pd.Index(group_labels), row_groups, order, starts)
+        return self._indexes[dim]
+
+    def groups(self, dim):
+        """Distinct values of a dimension with their row counts, largest first"""
+        labels, _, _, starts = self._index(dim)
+        return pd.Series(np.diff(starts), index=labels, name="rows").sort_values(ascending=False)
+
+    def select(self, where):
+        """Row numbers matching every dim -> value (or list of values) in where, in ascending order"""
+
+        if not where:
+            return np.arange(self.rows)
+        matches = []
+        for dim, values in where.items():
+            labels, row_groups, order, starts = self._index(dim)
+            values = values if isinstance(values, (list, tuple, set)) else [values]
+            found = labels.get_indexer([str(v).strip() for v in values])
+            found = found[found >= 0]
+            matches.append((int((starts[found + 1] - starts[found]).sum()), found, row_groups, order, starts))
+
+        # Gather the rows of the narrowest filter, then check the others on those rows only
+        matches.sort(key=lambda match: match[0])
+        _, found, _, order, starts = matches[0]
+        rows = np.sort(np.concatenate([order[starts[g]:starts[g + 1]] for g in found] or [np.empty(0, np.int64)]))
+        for _, found, row_groups, _, _ in matches[1:]:
+            rows = rows[np.isin(row_groups[rows], found)]
+        return rows
+
+    def shock(self, where, rate=None, change=None):
+        """Reprice the rows matching where with their ad valorem tariff set to rate, or moved by change points.
+
+        Returns (deltas DataFrame of the affected rows indexed by baseline row number, summary dict).
+        """
+
+        if (rate is None) == (change is None):
+            raise ValueError("Give exactly one of rate or change")
+        rows = self.select(where)
+
+        cost, msrp, units = self.cost[rows], self.msrp[rows], self.units[rows]
+        old_rate, old_landed = self.tariff_rate[rows], self.landed_cost[rows]
+        new_rate = np.full(len(rows), float(rate)) if rate is not None else old_rate + change
+        new_rate = np.maximum(new_rate, 0.0)
+
+        # Only the ad valorem part moves; specific duties and per-shipment costs carry over unchanged
+        tariff_delta = cost * (new_rate - old_rate) / 100
+        new_landed = old_landed + tariff_delta
+        with np.errstate(divide="ignore", invalid="ignore"):
+            old_margin = (msrp - old_landed) / msrp * 100
+            new_margin = (msrp - new_landed) / msrp * 100
+
+        deltas = pd.DataFrame({
+            "old_tariff_rate": old_rate,
+            "new_tariff_rate": new_rate,
+            "old_tariff_amount": self.tariff_amount[rows],
+            "new_tariff_amount": self.tariff_amount[rows] + tariff_delta,
+            "old_landed_cost": old_landed,
+            "new_landed_cost": new_landed,
+            "old_profit": msrp - old_landed,
+            "new_profit": msrp - new_landed,
+            "profit_delta": -tariff_delta,
+            "old_margin": old_margin,
+            "new_margin": new_margin,
+            "margin_delta": new_margin - old_margin,
+        }, index=pd.Index(rows, name="row"))
+        if "sku" in self.keys:
+            deltas.insert(0, "sku", self.keys["sku"][rows])
+
+        old_profit, new_profit = msrp - old_landed, msrp - new_landed
+        summary = {
+            "affected_rows": int(len(rows)),
+            "total_tariff_delta": float(np.nansum(tariff_delta * units)),
+            "total_profit_delta": float(np.nansum(-tariff_delta * units)),
+            "newly_unprofitable": int(((old_profit >= 0) & (new_profit < 0)).sum()),
+            "no_longer_unprofitable": int(((old_profit < 0) & (new_profit >= 0)).sum()),
+            "average_margin_delta": float(np.nanmean(new_margin - old_margin)) if len(rows) else 0.0,
+        }
+        return deltas, summary
@@ -0,0 +1,105 @@
+"""Monte Carlo evaluation of the landed cost model under uncertain inputs."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .model import calculate_landed_cost_batch
+
+# Draws evaluated per chunk in Monte Carlo mode; bounds the memory used by intermediate arrays
+SIMULATION_CHUNK_DRAWS = 250_000
+
+SIMULATION_PERCENTILES = (5, 25, 50, 75, 95)
+
+DISTRIBUTIONS = ["Fixed", "Uniform", "Triangular", "Normal"]
+
+def spread_distribution(kind, center, spread_pct):
+    """Distribution spec centred on a value with a +/- spread in percent (the standard deviation for Normal)"""
+    
+    spread = abs(center) * spread_pct / 100
+    if kind == "Uniform":
+        return ("uniform", center - spread, center + spread)
+    if kind == "Triangular":
+        return ("triangular", center - spread, center, center + spread)
+    if kind == "Normal":
+        return ("normal", center, spread)
+    return ("fixed", center)
+
+def _sample(spec, rng, size):
+    """Draw size samples for a cost model input given as a number or a distribution spec tuple"""
+    
+    if not isinstance(spec, tuple):
+        return np.full(size, float(spec))
+    
+    kind, *params = spec
+    if kind == "fixed" or (kind != "normal" and params[0] == params[-1]):
+        return np.full(size, float(params[0]))
+    if kind == "uniform":
+        return rng.uniform(params[0], params[1], size)
+    if kind == "triangular":
+        return rng.triangular(params[0], params[1], params[2], size)
+    if kind == "normal":
+        return rng.normal(params[0], params[1], size)
+    raise ValueError(f"Unknown distribution: {kind}")
+
+def _simulate_chunk(specs, size, seed_sequence):
+    """Evaluate one chunk of draws; each chunk has its own seed so results do not depend on scheduling"""
+    
+    rng = np.random.default_rng(seed_sequence)
+    inputs = {name: _sample(spec, rng, size) for name, spec in specs.items()}
+    
+    # Costs, fees and rates cannot be negative; units per shipment are whole and at least 1
+    for name in inputs:
+        np.maximum(inputs[name], 0, out=inputs[name])
+    inputs["units_per_shipment"] = np.maximum(np.rint(inputs["units_per_shipment"]), 1)
+    
+    result = calculate_landed_cost_batch(**inputs)
+    return result["profit"].astype(np.float32), result["margin_percentage"].astype(np.float32)
+
+def simulate_landed_cost(msrp, cost_to_produce, tariff_rate, shipping_cost=0, storage_cost=0, customs_fee=0,
+                         broker_fee=0, other_costs=0, units_per_shipment=1, draws=1_000_000, seed=0,
+                         chunk_draws=SIMULATION_CHUNK_DRAWS, workers=1, histogram_bins=100):
+    """Monte Carlo landed cost: every input may be a number or a spec such as ("normal", mean, std),
+    ("uniform", low, high) or ("triangular", low, mode, high)"""
+    
+    specs = {
+        "msrp": msrp,
+        "cost_to_produce": cost_to_produce,
+        "tariff_rate": tariff_rate,
+        "shipping_cost": shipping_cost,
+        "storage_cost": storage_cost,
+        "customs_fee": customs_fee,
+        "broker_fee": broker_fee,
+        "other_costs": other_costs,
+        "units_per_shipment": units_per_shipment,
+    }
+    
+    draws = int(draws)
+    chunk_draws = max(1, int(chunk_draws))
+    sizes = [min(chunk_draws, draws - start) for start in range(0, draws, chunk_draws)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_simulate_chunk, [specs] * len(sizes), sizes, seeds))
+    else:
+        chunks = [_simulate_chunk(specs, size, seq) for size, seq in zip(sizes, seeds)]
+    
+    # Only the float32 profit and margin of each draw are kept between chunks
+    profit = np.concatenate([chunk[0] for chunk in chunks])
+    margin = np.concatenate([chunk[1] for chunk in chunks])
+    del chunks
+    
+    counts, edges = np.histogram(profit, bins=histogram_bins)
+    
+    return {
+        "draws": draws,
+        "percentiles": np.array(SIMULATION_PERCENTILES, dtype=np.float64),
+        "profit_percentiles": np.percentile(profit, SIMULATION_PERCENTILES),
+        "margin_percentiles": np.percentile(margin, SIMULATION_PERCENTILES),
+        "probability_of_loss": float(np.count_nonzero(profit < 0)) / draws,
+        "mean_profit": float(profit.mean(dtype=np.float64)),
+        "std_profit": float(profit.std(dtype=np.float64)),
+        "mean_margin": float(margin.mean(dtype=np.float64)),
+        "profit_histogram": (counts, edges)
+    }
@@ -0,0 +1,122 @@
+"""Catalogs kept on disk as memory-mapped Arrow IPC files, read a few columns and rows at a time."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .export import _arrow_schema, _conform_chunk
+
+# Catalog store the app opens, if present
+CATALOG_STORE_PATH = os.environ.get("TARIFFSIGHT_CATALOG_STORE", "catalog_store.arrow")
+
+# Open stores by path, with the file signature they were opened at
+_open_stores = {}
+
+class CatalogStore:
+    """A catalog in an uncompressed Arrow IPC file, memory-mapped rather than read.
+
+    Opening parses only the schema and record batch layout. Reads touch just the pages of the columns and
+    rows asked for, and numeric columns come back as views of the mapping, so every session and process that
+    opens the file shares one copy of those pages in the OS cache instead of holding its own.
+    """
+
+    def __init__(self, path):
+        import pyarrow as pa
+
+        self.path = path
+        self._reader = pa.ipc.open_file(pa.memory_map(path))
+        self.schema = self._reader.schema
+        self.columns = list(self.schema.names)
+        self._batches = [self._reader.get_batch(i) for i in range(self._reader.num_record_batches)]
+        self._starts = np.cumsum([0] + [batch.num_rows for batch in self._batches])
+        self.rows = int(self._starts[-1])
+
+    @classmethod
+    def build(cls, frames, path):
+        """Write an iterable of DataFrame chunks to a store at path (one record batch each) and open it.
+
+        The file is written beside path and moved over it at the end, so sessions reading an older store keep
+        their mapping until they reopen.
+        """
+
+        import pyarrow as pa
+
+        temp_path = f"{path}.tmp"
+        writer = None
+        try:
+            for frame in frames:
+                if writer is None:
+                    schema = _arrow_schema(frame)
+                    writer = pa.ipc.new_file(temp_path, schema)
+                writer.write_table(pa.Table.from_pandas(_conform_chunk(frame, schema), schema=schema,
+                                                        preserve_index=False))
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            raise ValueError("Catalog has no rows to store")
+        os.replace(temp_path, path)
+        return cls(path)
+
+    def _check_columns(self, columns):
+        if columns is None:
+            return self.columns
+        missing = [col for col in columns if col not in self.columns]
+        if missing:
+            raise ValueError(f"Catalog store has no columns: {', '.join(missing)}")
+        return list(columns)
+
+    def _slices(self, columns, start, stop):
+        """Record batch slices covering rows [start, stop), projected to columns"""
+
+        start, stop, _ = slice(start, stop).indices(self.rows)
+        first = int(np.searchsorted(self._starts, start, side="right")) - 1
+        for i in range(max(first, 0), len(self._batches)):
+            if self._starts[i] >= stop:
+                break
+            offset = max(start - self._starts[i], 0)
+            length = min(stop, self._starts[i + 1]) - self._starts[i] - offset
+            yield self._batches[i].select(columns).slice(offset, length)
+
+    def read(self, columns=None, start=0, stop=None):
+        """Rows [start, stop) of the given columns (default all) as a DataFrame indexed by row number"""
+
+        import pyarrow as pa
+
+        columns = self._check_columns(columns)
+        table = pa.Table.from_batches(list(self._slices(columns, start, stop)),
+                                      pa.schema([self.schema.field(col) for col in columns]))
+        df = table.to_pandas(split_blocks=True)
+        df.index = pd.RangeIndex(*slice(start, stop).indices(self.rows)[:2])
+        return df
+
+    def column(self, name, start=0, stop=None):
+        """One column's rows [start, stop) as an array, a view of the mapping for numbers without blanks
+        that lie in one record batch"""
+
+        parts = list(self._slices(self._check_columns([name]), start, stop))
+        if len(parts) == 1:
+            return parts[0].column(0).to_numpy(zero_copy_only=False)
+        return self.read([name], start, stop)[name].to_numpy()
+
+    def iter_chunks(self, columns=None, chunk_rows=None):
+        """Yield (chunk DataFrame, fraction of the store read) for the given columns, one record batch (or
+        chunk_rows rows of one) at a time; the same shape as iter_catalog_chunks"""
+
+        columns = self._check_columns(columns)
+        for start, stop in zip(self._starts[:-1], self._starts[1:]):
+            step = chunk_rows or int(stop - start)
+            for chunk_start in range(int(start), int(stop), max(step, 1)):
+                chunk_stop = min(chunk_start + step, int(stop))
+                yield self.read(columns, chunk_start, chunk_stop), chunk_stop / max(self.rows, 1)
+
+def open_catalog_store(path=CATALOG_STORE_PATH):
+    """The CatalogStore at path, reused until the file changes, so reruns and sessions in a process share it"""
+
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _open_stores.get(path)
+    if cached is None or cached[0] != signature:
+        cached = _open_stores[path] = (signature, CatalogStore(path))
+    return cached[1]
@@ -0,0 +1,129 @@
+"""Catalog x scenario sweeps split across a process pool, with the catalog held once in shared memory."""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .model import _catalog_inputs, calculate_landed_cost_batch, price_catalog
+
+# Pool tasks per worker; tariff levels are dealt out in this many blocks per worker to keep every core busy
+SWEEP_TASKS_PER_WORKER = 4
+
+# Columns of a sweep result, one row per (tariff rate, price factor) scenario
+SWEEP_COLUMNS = ["tariff_rate", "price_factor", "total_revenue", "total_tariff", "total_landed_cost", "total_profit",
+                 "weighted_margin", "unprofitable_skus", "unprofitable_loss"]
+
+# Rows of the shared catalog array
+_SWEEP_ROWS = ("msrp", "production", "fees", "units")
+
+# The shared catalog of a pool worker, attached once when the worker starts
+_worker_catalog = {}
+
+def _attach_catalog(name, skus):
+    block = shared_memory.SharedMemory(name=name)
+    _worker_catalog["block"] = block
+    _worker_catalog["arrays"] = np.ndarray((len(_SWEEP_ROWS), skus), dtype=np.float64, buffer=block.buf)
+
+def _sweep_levels(catalog, tariff_rates, price_factors):
+    """Unprofitable SKU count and their total loss for every price factor at each tariff level.
+
+    A SKU loses money at price factor f when f < landed / msrp, so one sort of that ratio per tariff level
+    answers every price factor by binary search, with suffix sums giving the loss of the SKUs past it.
+    """
+
+    msrp, production, fees, units = catalog
+    counts = np.empty((len(tariff_rates), len(price_factors)), dtype=np.int64)
+    losses = np.empty((len(tariff_rates), len(price_factors)))
+    for i, rate in enumerate(tariff_rates):
+        landed = production * (1 + rate / 100)
+        landed += fees
+        ratio = landed / msrp
+        order = np.argsort(ratio, kind="stable")
+        ratio = ratio[order]
+
+        # Totals over the sorted rows from each position to the end, with a zero past the last row
+        tail_cost = np.append(np.cumsum((units * landed)[order][::-1])[::-1], 0.0)
+        tail_revenue = np.append(np.cumsum((units * msrp)[order][::-1])[::-1], 0.0)
+        first = np.searchsorted(ratio, price_factors, side="right")
+        counts[i] = len(ratio) - first
+        losses[i] = tail_cost[first] - price_factors * tail_revenue[first]
+    return counts, losses
+
+def _sweep_block(tariff_rates, price_factors):
+    return _sweep_levels(_worker_catalog["arrays"], tariff_rates, price_factors)
+
+def sweep_catalog(catalog_df, tariff_rates, price_factors, workers=1):
+    """Portfolio totals for every catalog SKU under every (tariff rate, price factor) scenario.
+
+    Each scenario sets every SKU's ad valorem tariff to the rate and its price to the factor times its msrp.
+    Totals are weighted by units_per_shipment; rows with a missing input or no positive msrp are left out.
+    With workers > 1 the tariff levels are split across a process pool that reads the catalog from shared
+    memory. Every level is computed the same way whichever process runs it, so results do not depend on workers.
+    """
+
+    tariff_rates = np.asarray(tariff_rates, dtype=np.float64).ravel()
+    price_factors = np.asarray(price_factors, dtype=np.float64).ravel()
+    if not len(tariff_rates) or not len(price_factors):
+        raise ValueError("A sweep needs at least one tariff rate and one price factor")
+
+    inputs = _catalog_inputs(catalog_df, optional=("tariff_rate",))
+    base = calculate_landed_cost_batch(**dict(inputs, tariff_rate=0.0))
+    production = base["cost_breakdown"]["production"]
+    columns = np.broadcast_arrays(inputs["msrp"], production, base["landed_cost"] - production,
+                                  np.asarray(inputs["units_per_shipment"], dtype=np.float64))
+    valid = np.logical_and.reduce([np.isfinite(column) for column in columns]) & (columns[0] > 0)
+    skus = int(valid.sum())
+
+    # Linear totals follow from catalog sums; only the unprofitable counts and losses need the SKUs
+    msrp, production, fees, units = [column[valid] for column in columns]
+    units = np.where(units > 0, units, 1.0)
+    revenue = price_factors * (units * msrp).sum()
+    tariff = tariff_rates / 100 * (units * production).sum()
+    landed = (units * (production + fees)).sum() + tariff
+    profit = revenue[np.newaxis, :] - landed[:, np.newaxis]
+    margin = np.full(profit.shape, np.nan)
+    np.divide(profit * 100, np.broadcast_to(revenue, profit.shape), out=margin, where=revenue != 0)
+
+    blocks = np.array_split(tariff_rates, min(len(tariff_rates), max(1, workers) * SWEEP_TASKS_PER_WORKER))
+    if workers > 1 and len(blocks) > 1 and skus:
+        block = shared_memory.SharedMemory(create=True, size=len(_SWEEP_ROWS) * skus * 8)
+        try:
+            shared = np.ndarray((len(_SWEEP_ROWS), skus), dtype=np.float64, buffer=block.buf)
+            shared[:] = (msrp, production, fees, units)
+            del shared, msrp, production, fees, units
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_catalog, initargs=(block.name, skus)) as pool:
+                parts = list(pool.map(_sweep_block, blocks, [price_factors] * len(blocks)))
+        finally:
+            block.close()
+            block.unlink()
+    else:
+        catalog = (msrp, production, fees, units)
+        parts = [_sweep_levels(catalog, rates, price_factors) for rates in blocks]
+
+    return pd.DataFrame({
+        "tariff_rate": np.repeat(tariff_rates, len(price_factors)),
+        "price_factor": np.tile(price_factors, len(tariff_rates)),
+        "total_revenue": np.tile(revenue, len(tariff_rates)),
+        "total_tariff": np.repeat(tariff, len(price_factors)),
+        "total_landed_cost": np.repeat(landed, len(price_factors)),
+        "total_profit": profit.ravel(),
+        "weighted_margin": margin.ravel(),
+        "unprofitable_skus": np.concatenate([part[0] for part in parts]).ravel(),
+        "unprofitable_loss": np.concatenate([part[1] for part in parts]).ravel(),
+    }, columns=SWEEP_COLUMNS)
+
+def sweep_scenario_skus(catalog_df, tariff_rate, price_factor):
+    """Every catalog SKU priced under one sweep scenario, the per-SKU detail behind one row of sweep_catalog.
+
+    Returns the catalog with msrp set to price_factor times its msrp (the original kept as base_msrp), every
+    tariff_rate set to the rate, the price_catalog result columns, and in_sweep marking the rows the sweep
+    totals count.
+    """
+
+    msrp = _catalog_inputs(catalog_df, optional=("tariff_rate",))["msrp"]
+    scenario = catalog_df.assign(base_msrp=msrp, msrp=msrp * float(price_factor), tariff_rate=float(tariff_rate))
+    priced = price_catalog(scenario)
+    priced["in_sweep"] = np.isfinite(priced["landed_cost"].to_numpy()) & (msrp > 0)
+    return priced
@@ -0,0 +1,162 @@
+"""Effective-dated tariff rates, resolved per (key, date) with binary search."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+# Timeline CSV read by the app: key,effective_from[,effective_to],tariff_rate
+TARIFF_TIMELINE_PATH = os.environ.get("TARIFFSIGHT_TARIFF_TIMELINE", "tariff_timeline.csv")
+
+# Timeline key that applies to every key without intervals of its own
+DEFAULT_KEY = "*"
+
+# Dates are days since 1970-01-01, shifted to be non-negative and packed below the key code
+_DAY_BITS = 32
+_DAY_OFFSET = 1 << (_DAY_BITS - 1)
+_OPEN_END = np.iinfo(np.int64).max
+
+def _to_days(dates):
+    return pd.to_datetime(pd.Series(dates), errors="coerce").to_numpy(dtype="datetime64[D]")
+
+class TariffTimeline:
+    """Non-overlapping [effective_from, effective_to) rate intervals per key, sorted by (key, start)"""
+
+    def __init__(self, keys, interval_keys, starts, ends, rates):
+        self.keys = pd.Index(keys)
+        self.interval_keys = interval_keys
+        self.starts = starts
+        self.ends = ends
+        self.rates = rates
+        self._packed_starts = self._pack(interval_keys, starts)
+
+    @staticmethod
+    def _pack(key_codes, days):
+        return (key_codes.astype(np.int64) << _DAY_BITS) | (days.astype(np.int64) + _DAY_OFFSET)
+
+    @classmethod
+    def from_frame(cls, timeline_df, key_column="sku", start_column="effective_from", end_column="effective_to",
+                   rate_column="tariff_rate"):
+        """Build the timeline from a DataFrame; a missing end date runs to the key's next interval, or forever"""
+
+        keys = timeline_df[key_column].astype(str).str.strip().to_numpy()
+        starts = _to_days(timeline_df[start_column])
+        if end_column in timeline_df.columns:
+            ends = _to_days(timeline_df[end_column])
+        else:
+            ends = np.full(len(timeline_df), np.datetime64("NaT"), dtype="datetime64[D]")
+        rates = pd.to_numeric(timeline_df[rate_column], errors="coerce").to_numpy(dtype=np.float64)
+
+        bad = np.isnat(starts) | np.isnan(rates)
+        if bad.any():
+            raise ValueError(f"{int(bad.sum())} timeline rows have a missing or unreadable start date or rate "
+                             f"(first: row {int(np.flatnonzero(bad)[0])})")
+
+        key_codes, unique_keys = pd.factorize(keys, sort=True)
+        start_days = starts.astype(np.int64)
+        order = np.lexsort((start_days, key_codes))
+        key_codes, start_days, ends, rates = key_codes[order], start_days[order], ends[order], rates[order]
+
+        # Open-ended intervals close where the next interval for the same key begins
+        same_key_next = np.append(key_codes[1:] == key_codes[:-1], False)
+        next_start = np.append(start_days[1:], _OPEN_END)
+        end_days = np.where(np.isnat(ends), np.where(same_key_next, next_start, _OPEN_END), ends.astype(np.int64))
+
+        if (end_days <= start_days).any():
+            row = int(order[np.flatnonzero(end_days <= start_days)[0]])
+            raise ValueError(f"Timeline row {row} ends on or before its effective date")
+        overlap = same_key_next & (end_days > next_start)
+        if overlap.any():
+            i = int(np.flatnonzero(overlap)[0])
+            raise ValueError(f"Timeline intervals overlap for key {unique_keys[key_codes[i]]!r} "
+                             f"(rows {int(order[i])} and {int(order[i + 1])})")
+
+        return cls(unique_keys, key_codes.astype(np.int64), start_days, end_days, rates)
+
+    @classmethod
+    def from_csv(cls, path, key_column="sku", **columns):
+        timeline_df = pd.read_csv(path, dtype={key_column: str})
+        return cls.from_frame(timeline_df, key_column, **columns)
+
+    def __len__(self):
+        return len(self.rates)
+
+    def _lookup_codes(self, key_codes, days):
+        rates = np.full(len(days), np.nan)
+        valid = key_codes >= 0
+        if not valid.any() or len(self.rates) == 0:
+            return rates
+
+        rows = np.flatnonzero(valid)
+        pos = np.searchsorted(self._packed_starts, self._pack(key_codes[rows], days[rows]), side="right") - 1
+        hit = pos >= 0
+        pos_hit = np.where(hit, pos, 0)
+        hit &= (self.interval_keys[pos_hit] == key_codes[rows]) & (days[rows] < self.ends[pos_hit])
+        rates[rows[hit]] = self.rates[pos[hit]]
+        return rates
+
+    def rates_at(self, keys, dates):
+        """Rates in effect for each (key, date) pair, NaN where no interval covers the date"""
+
+        days_dt = _to_days(dates)
+        has_date = ~np.isnat(days_dt)
+        days = np.where(has_date, days_dt.astype(np.int64), 0)
+
+        # Hash the distinct query keys once instead of every row
+        query_codes, query_keys = pd.factorize(np.asarray(keys, dtype=object))
+        key_codes = np.append(self.keys.get_indexer(query_keys.astype(str)), -1)[query_codes]
+        key_codes = np.where(has_date, key_codes, -1)
+        rates = self._lookup_codes(key_codes, days)
+
+        # Keys with no interval on that date fall back to the default key
+        default_code = self.keys.get_indexer([DEFAULT_KEY])[0]
+        if default_code >= 0:
+            fallback = np.flatnonzero(np.isnan(rates) & has_date)
+            rates[fallback] = self._lookup_codes(np.full(len(fallback), default_code), days[fallback])
+        return rates
+
+    def rate_at(self, key, date):
+        """Rate in effect for one key on one date, or None"""
+
+        rate = self.rates_at([key], [date])[0]
+        return None if np.isnan(rate) else float(rate)
+
+def load_tariff_timeline(path=TARIFF_TIMELINE_PATH):
+    return TariffTimeline.from_csv(path)
+
+def apply_tariff_timeline(catalog_df, timeline, key_column="sku", date_column="arrival_date", overwrite=False):
+    """Set tariff_rate to the rate in effect on each row's arrival date; existing rates are kept unless overwrite is set"""
+
+    dated = catalog_df.copy()
+    rates = timeline.rates_at(dated[key_column].to_numpy(), dated[date_column].to_numpy())
+
+    if "tariff_rate" in dated.columns and not overwrite:
+        current = pd.to_numeric(dated["tariff_rate"], errors="coerce").to_numpy(dtype=np.float64)
+        dated["tariff_rate"] = np.where(np.isnan(current), rates, current)
+    else:
+        dated["tariff_rate"] = rates
+    return dated
+
+def reprice_history(history_df, timeline):
+    """Re-price saved calculations under the tariff rate in effect on each calculation's timestamp.
+
+    Only the tariff line changes, so the new landed cost is the saved one shifted by the rate difference
+    on the manufacturing cost. Adds schedule_rate and repriced_* columns, NaN where the timeline has no rate.
+    """
+
+    repriced = history_df.copy()
+    schedule_rate = timeline.rates_at(repriced["sku"].to_numpy(), repriced["timestamp"].to_numpy())
+
+    msrp = repriced["msrp"].to_numpy(dtype=np.float64)
+    landed_cost = (repriced["landed_cost"].to_numpy(dtype=np.float64)
+                   + repriced["cost"].to_numpy(dtype=np.float64)
+                   * (schedule_rate - repriced["tariff_rate"].to_numpy(dtype=np.float64)) / 100)
+    profit = msrp - landed_cost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin = np.where(msrp > 0, profit / msrp * 100, 0.0)
+
+    repriced["schedule_rate"] = schedule_rate
+    repriced["repriced_landed_cost"] = landed_cost
+    repriced["repriced_profit"] = profit
+    repriced["repriced_margin"] = np.where(np.isnan(schedule_rate), np.nan, margin)
+    return repriced
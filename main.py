@@ -6,6 +6,8 @@ import os
 import base64
 import glob
 
+from kaizenroi.profiling import Profiler, profiling_requested
+
 # ==============================================================================
 # 1. CONFIGURATION & ASSETS
 # ==============================================================================
@@ -16,8 +18,11 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# Timing spans for this rerun; ?profile=1 shows them in the sidebar and logs them
+profiler = Profiler("quality_wars", enabled=profiling_requested(st.query_params))
+
 # CUSTOM CSS: EARTH/SPACE THEME & ANIMATIONS
-st.markdown("""
+APP_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@300;500;700&display=swap');
 
@@ -182,7 +187,10 @@ st.markdown("""
         text-decoration: none;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+with profiler.span("inject css"):
+    st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # ==============================================================================
 # 2. CONTENT DATABASES
@@ -1134,33 +1142,48 @@ def show_gameover():
 # 7. MAIN CONTROLLER
 # ==============================================================================
 
-show_sidebar()
+# st.rerun() inside the screens ends the run early; the profile is still written
+try:
+    with profiler.span("sidebar"):
+        show_sidebar()
 
-# HUD (Skip on Menu/Gameover/Viewer)
-if st.session_state.game_state not in ['MENU', 'GAMEOVER', 'VIEWER']:
-    st.markdown(f"""
-    <div class="hud-container">
-        <div class="metric-box"><div class="metric-label">ROUND</div><div class="metric-value">{st.session_state.current_round}/{st.session_state.total_rounds}</div></div>
-        <div class="metric-box"><div class="metric-label">ROI SCORE</div><div class="metric-value">${st.session_state.game_score}</div></div>
-        <div class="metric-box"><div class="metric-label">INTEL</div><div class="metric-value">{st.session_state.trivia_score}</div></div>
-    </div>
-    """, unsafe_allow_html=True)
+    # HUD (Skip on Menu/Gameover/Viewer)
+    if st.session_state.game_state not in ['MENU', 'GAMEOVER', 'VIEWER']:
+        with profiler.span("render hud"):
+            st.markdown(f"""
+            <div class="hud-container">
+                <div class="metric-box"><div class="metric-label">ROUND</div><div class="metric-value">{st.session_state.current_round}/{st.session_state.total_rounds}</div></div>
+                <div class="metric-box"><div class="metric-label">ROI SCORE</div><div class="metric-value">${st.session_state.game_score}</div></div>
+                <div class="metric-box"><div class="metric-label">INTEL</div><div class="metric-value">{st.session_state.trivia_score}</div></div>
+            </div>
+            """, unsafe_allow_html=True)
 
-if st.session_state.game_state == 'MENU':
-    show_menu()
-elif st.session_state.game_state == 'VIEWER':
-    show_viewer()
-elif st.session_state.game_state == 'INTEL':
-    show_intel_briefing()
-elif st.session_state.game_state == 'GAME':
-    # Space Shooter
-    html_code = get_space_shooter_html(st.session_state.current_round, st.session_state.game_duration_setting)
-    components.html(html_code, height=550)
-elif st.session_state.game_state == 'BOXING_GAME':
-    # Boxing
-    html_code = get_boxing_html(st.session_state.current_round, st.session_state.game_duration_setting)
-    components.html(html_code, height=450)
-elif st.session_state.game_state == 'TRIVIA':
-    show_trivia_round()
-elif st.session_state.game_state == 'GAMEOVER':
-    show_gameover()
+    if st.session_state.game_state == 'MENU':
+        with profiler.span("menu"):
+            show_menu()
+    elif st.session_state.game_state == 'VIEWER':
+        with profiler.span("viewer"):
+            show_viewer()
+    elif st.session_state.game_state == 'INTEL':
+        with profiler.span("intel briefing"):
+            show_intel_briefing()
+    elif st.session_state.game_state == 'GAME':
+        # Space Shooter
+        with profiler.span("build space shooter html"):
+            html_code = get_space_shooter_html(st.session_state.current_round, st.session_state.game_duration_setting)
+        with profiler.span("render space shooter"):
+            components.html(html_code, height=550)
+    elif st.session_state.game_state == 'BOXING_GAME':
+        # Boxing
+        with profiler.span("build boxing html"):
+            html_code = get_boxing_html(st.session_state.current_round, st.session_state.game_duration_setting)
+        with profiler.span("render boxing"):
+            components.html(html_code, height=450)
+    elif st.session_state.game_state == 'TRIVIA':
+        with profiler.span("trivia round"):
+            show_trivia_round()
+    elif st.session_state.game_state == 'GAMEOVER':
+        with profiler.span("game over"):
+            show_gameover()
+finally:
+    profiler.finish(st)
@@ -1,7 +1,7 @@
 from setuptools import setup, find_packages
 
 # Read the contents of the README file
-with open("README.md", "r", encoding="utf-8") as fh:
+with open("readme.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 # Read the contents of the requirements file
@@ -31,7 +31,7 @@ setup(
     install_requires=requirements,
     entry_points={
         "console_scripts": [
-            "kaizenroi=kaizenroi.app:main",
+            "tariffsight=kaizenroi.tariffsight.cli:main",
         ],
     },
 )
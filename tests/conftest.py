@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import CATALOG_COLUMNS
+
+# Cost model input columns of the sample catalog, in calculate_landed_cost_batch order
+INPUT_COLUMNS = list(CATALOG_COLUMNS)
+
+def make_catalog(rows=500, seed=7):
+    rng = np.random.default_rng(seed)
+    cost = rng.uniform(1, 200, rows).round(2)
+    return pd.DataFrame({
+        "sku": [f"SKU-{i:05d}" for i in range(rows)],
+        "msrp": (cost * rng.uniform(0.9, 3.0, rows)).round(2),
+        "cost_to_produce": cost,
+        "tariff_rate": rng.choice([0.0, 2.5, 7.5, 25.0, 60.0], rows),
+        "shipping_cost": rng.uniform(0, 3000, rows).round(2),
+        "storage_cost": rng.uniform(0, 500, rows).round(2),
+        "customs_fee": 250.0,
+        "broker_fee": rng.uniform(0, 200, rows).round(2),
+        "other_costs": 0.0,
+        "units_per_shipment": rng.integers(1, 2000, rows).astype(np.float64),
+        "country_of_origin": rng.choice(["CN", "VN", "MX", "DE"], rows),
+        "supplier": rng.choice(["Acme", "Globex", "Initech"], rows),
+        "category": rng.choice(["Apparel", "Electronics", "Furniture"], rows),
+        "hs_code": rng.choice(["8471.30.01", "8517.62", "6109.10.00", "9403.60.80", "0101.21"], rows),
+    })
+
+@pytest.fixture
+def catalog():
+    return make_catalog()
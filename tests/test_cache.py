@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from kaizenroi.tariffsight import ResultCache, normalize_cache_key
+
+class _Figure:
+    """Stands in for a Plotly figure: a small object whose traces hold the data"""
+
+    def __init__(self, points):
+        self.x = np.arange(points, dtype=np.float64)
+
+    def to_plotly_json(self):
+        return {"data": [{"type": "scatter", "x": self.x}], "layout": {}}
+
+    def to_json(self):
+        return '{"data":[{"type":"scatter","x":[' + ",".join(map(str, self.x)) + ']}],"layout":{}}'
+
+def test_figures_are_sized_by_their_data():
+    cache = ResultCache()
+    figure = cache.get_or_compute(normalize_cache_key("figure", (1,)), lambda: _Figure(100_000))
+    assert cache.stats()["bytes"] == len(figure.to_json()) > 100_000
+
+def test_byte_limit_evicts_least_recently_used_figures():
+    cache = ResultCache(max_bytes=2_000_000)
+    for i in range(5):
+        cache.get_or_compute(("figure", i), lambda: _Figure(100_000))
+    stats = cache.stats()
+    assert stats["bytes"] <= 2_000_000
+    assert stats["evictions"] > 0 and stats["entries"] < 5
+
+def test_frames_series_and_arrays_are_sized_by_memory():
+    cache = ResultCache()
+    frame = pd.DataFrame({"a": np.zeros(1000)})
+    cache.get_or_compute(("frame",), lambda: frame)
+    cache.get_or_compute(("series",), lambda: frame["a"])
+    cache.get_or_compute(("array",), lambda: np.zeros(1000))
+    assert cache.stats()["bytes"] >= 3 * 8000
+
+def test_numbers_normalize_to_one_key():
+    assert normalize_cache_key("f", (25, True)) == normalize_cache_key("f", (25.0, True))
@@ -0,0 +1,48 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import TariffIndex, iter_catalog_chunks, price_catalog_file
+
+CATALOG_CSV = """sku,hs_code,msrp,cost_to_produce,units_per_shipment
+00123,0101210000,120.00,60.00,10
+00124,8471.30,900.00,400.00,5
+SKU-X,9999,10.00,4.00,1
+"""
+
+SCHEDULE = pd.DataFrame({"hs_code": ["0101.21.00.00", "847130"], "tariff_rate": [5.0, 2.5]})
+
+def _write_catalog(tmp_path):
+    path = tmp_path / "catalog.csv"
+    path.write_text(CATALOG_CSV)
+    return path
+
+def test_csv_identifier_columns_read_as_text(tmp_path):
+    path = _write_catalog(tmp_path)
+    with open(path, "rb") as source:
+        chunks = [chunk for chunk, _ in iter_catalog_chunks(source, str(path), chunk_rows=2)]
+
+    catalog = pd.concat(chunks, ignore_index=True)
+    assert catalog["hs_code"].tolist() == ["0101210000", "8471.30", "9999"]
+    assert catalog["sku"].tolist() == ["00123", "00124", "SKU-X"]
+
+def test_zero_padded_and_dotted_hs_codes_match_schedule(tmp_path):
+    path = _write_catalog(tmp_path)
+    output = io.StringIO()
+    with open(path, "rb") as source:
+        summary = price_catalog_file(source, str(path), output, chunk_rows=2,
+                                     tariff_index=TariffIndex.from_frame(SCHEDULE))
+
+    priced = pd.read_csv(io.StringIO(output.getvalue()), dtype={"sku": str, "hs_code": str})
+    assert summary["schedule_rates"] == 2
+    assert priced["hs_code"].tolist() == ["0101210000", "8471.30", "9999"]
+    assert priced["tariff_match_digits"].tolist() == [10, 6, 0]
+    np.testing.assert_allclose(priced["tariff_rate"].to_numpy()[:2], [5.0, 2.5])
+    assert np.isnan(priced["tariff_rate"].iloc[2])
+    np.testing.assert_allclose(priced["tariff_amount"].to_numpy()[:2], [3.0, 10.0])
+
+    # SKU-X has no rate, so no margin; the average is over the two priced rows
+    assert summary["margin_rows"] == 2
+    assert summary["average_margin"] == pytest.approx(priced["margin_percentage"].iloc[:2].mean())
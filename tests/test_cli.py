@@ -0,0 +1,34 @@
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+import kaizenroi.tariffsight as tariffsight
+from kaizenroi.tariffsight.cli import main
+
+def test_parser_loads_no_numpy_or_pandas():
+    code = ("import sys; from kaizenroi.tariffsight.cli import build_parser; build_parser(); "
+            "print(sorted({'numpy', 'pandas', 'asyncio'} & set(sys.modules)))")
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert loaded.strip() == "[]"
+
+@pytest.mark.parametrize("name", tariffsight.__all__)
+def test_every_public_name_resolves(name):
+    assert getattr(tariffsight, name) is not None
+    assert name in dir(tariffsight)
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        tariffsight.no_such_name
+
+def test_price_command_prices_a_catalog_file(tmp_path, catalog, capsys):
+    source, output = tmp_path / "catalog.csv", tmp_path / "priced.csv"
+    catalog.to_csv(source, index=False)
+
+    assert main(["price", str(source), "-o", str(output)]) == 0
+    priced = pd.read_csv(output)
+    expected = tariffsight.price_catalog(catalog)
+    assert len(priced) == len(catalog)
+    pd.testing.assert_series_equal(priced["landed_cost"], expected["landed_cost"], check_exact=False)
+    assert "Priced 500 rows" in capsys.readouterr().err
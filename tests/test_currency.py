@@ -0,0 +1,70 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import CurrencyRates, convert_catalog_currency, format_money
+
+# Value of one unit of each currency in a common unit, so every chain of quotes gives the same cross rate
+VALUES = {"USD": 1.0, "EUR": 1.08, "GBP": 1.27, "CNY": 0.138, "JPY": 0.0067, "MXN": 0.058, "CAD": 0.73}
+QUOTES = [("EUR", "USD"), ("usd", "CNY"), ("GBP", "EUR "), ("JPY", "CNY"), ("CAD", "GBP")]
+
+def _table(quotes=QUOTES):
+    return pd.DataFrame({
+        "from_currency": [a for a, _ in quotes],
+        "to_currency": [b for _, b in quotes],
+        "rate": [VALUES[a.strip().upper()] / VALUES[b.strip().upper()] for a, b in quotes],
+    })
+
+def _reference_rate(quotes, source, target):
+    """Rate by walking quoted pairs (either way round) from source to target, or None"""
+    edges = {}
+    for a, b in quotes:
+        a, b = a.strip().upper(), b.strip().upper()
+        rate = VALUES[a] / VALUES[b]
+        edges.setdefault(a, []).append((b, rate))
+        edges.setdefault(b, []).append((a, 1 / rate))
+    found, todo = {source: 1.0}, deque([source])
+    while todo:
+        code = todo.popleft()
+        for neighbour, rate in edges.get(code, []):
+            if neighbour not in found:
+                found[neighbour] = found[code] * rate
+                todo.append(neighbour)
+    return found.get(target)
+
+def test_cross_rates_match_a_walk_over_quoted_pairs():
+    rates = CurrencyRates.from_frame(_table())
+    codes = list(rates.currencies)
+    assert "MXN" not in rates
+    for source in codes:
+        for target in codes:
+            assert rates.rate(source, target) == pytest.approx(_reference_rate(QUOTES, source, target), rel=1e-12)
+
+def test_unlinked_and_unknown_currencies_raise():
+    rates = CurrencyRates.from_frame(_table([("EUR", "USD"), ("MXN", "CAD")]))
+    assert rates.rate("CAD", "MXN") == pytest.approx(VALUES["CAD"] / VALUES["MXN"])
+    with pytest.raises(ValueError, match="No chain"):
+        rates.convert(1.0, "EUR", "MXN")
+    with pytest.raises(ValueError, match="No exchange rate for CHF"):
+        rates.convert(1.0, "CHF", "USD")
+    with pytest.raises(ValueError):
+        CurrencyRates.from_frame(_table().assign(rate=0.0))
+
+def test_catalog_conversion_per_row():
+    rates = CurrencyRates.from_frame(_table())
+    catalog = pd.DataFrame({"msrp": [100.0, 50.0, 20.0], "cost_to_produce": [40.0, 300.0, 8.0],
+                            "shipping_cost": [900.0, 900.0, 900.0],
+                            "cost_currency": ["CNY", "JPY", "usd"], "price_currency": ["USD", "EUR", "GBP"]})
+    converted = convert_catalog_currency(catalog, rates, "USD")
+
+    expected_cost = [c * VALUES[code.upper()] for c, code in zip(catalog["cost_to_produce"], catalog["cost_currency"])]
+    expected_msrp = [p * VALUES[code] for p, code in zip(catalog["msrp"], catalog["price_currency"])]
+    np.testing.assert_allclose(converted["cost_to_produce"], expected_cost)
+    np.testing.assert_allclose(converted["msrp"], expected_msrp)
+    assert converted["shipping_cost"].tolist() == [900.0] * 3
+
+def test_format_money_uses_symbols_or_codes():
+    assert format_money(1234.5) == "$1,234.50"
+    assert format_money(12.5, "CHF") == "CHF 12.50"
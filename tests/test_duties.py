@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import DEFAULT_DUTY_RULES, DutySchedule, price_catalog
+
+def test_rules_match_hand_computed_duties(catalog):
+    schedule = DutySchedule([
+        {"name": "mfn", "kind": "ad_valorem", "rate_column": "tariff_rate"},
+        {"name": "section301", "kind": "ad_valorem", "rate": 25, "when": {"country_of_origin": ["CN", "VN"]}},
+        {"name": "computers", "kind": "specific", "amount": 1.5, "hs_prefix": ["8471"]},
+        {"name": "mpf", "kind": "ad_valorem", "rate": 0.3464, "min": 31.67, "max": 614.35, "cap_basis": "shipment"},
+        {"name": "floor", "kind": "ad_valorem", "rate": 1, "min": 0.5},
+    ])
+    duties = schedule.evaluate(catalog)
+
+    cost = catalog["cost_to_produce"].to_numpy()
+    units = catalog["units_per_shipment"].to_numpy()
+    np.testing.assert_allclose(duties["mfn"], cost * catalog["tariff_rate"] / 100)
+    asian = catalog["country_of_origin"].isin(["CN", "VN"]).to_numpy()
+    np.testing.assert_allclose(duties["section301"], np.where(asian, cost * 0.25, 0.0))
+    computers = catalog["hs_code"].str.startswith("8471").to_numpy()
+    np.testing.assert_allclose(duties["computers"], np.where(computers, 1.5, 0.0))
+    np.testing.assert_allclose(duties["mpf"], np.clip(cost * 0.003464 * units, 31.67, 614.35) / units)
+    np.testing.assert_allclose(duties["floor"], np.maximum(cost * 0.01, 0.5))
+
+def test_filters_ignore_stray_whitespace_and_hs_punctuation(catalog):
+    messy = catalog.head(3).assign(country_of_origin=[" CN", "CN ", "MX"], hs_code=["8471 30 01", "847130", "84.71"])
+    duties = DutySchedule([
+        {"name": "cn", "kind": "specific", "amount": 1, "when": {"country_of_origin": "CN"}},
+        {"name": "hs", "kind": "specific", "amount": 1, "hs_prefix": ["8471.30"]},
+    ]).evaluate(messy)
+    assert duties["cn"].tolist() == [1.0, 1.0, 0.0]
+    assert duties["hs"].tolist() == [1.0, 1.0, 0.0]
+
+@pytest.mark.parametrize("rules", [
+    [{"name": "bad name", "kind": "specific", "amount": 1}],
+    [{"name": "x", "kind": "specific", "amount": 1, "typo": 1}],
+    [{"name": "x", "kind": "quota", "amount": 1}],
+    [{"name": "x", "kind": "ad_valorem", "rate": 1, "rate_column": "tariff_rate"}],
+    [{"name": "x", "kind": "ad_valorem"}],
+    [{"name": "x", "kind": "specific"}],
+    [{"name": "x", "kind": "specific", "amount": 1, "cap_basis": "container"}],
+    [{"name": "x", "kind": "specific", "amount": 1}, {"name": "x", "kind": "specific", "amount": 2}],
+])
+def test_invalid_rules_are_rejected(rules):
+    with pytest.raises(ValueError):
+        DutySchedule(rules)
+
+def test_priced_tariff_is_the_sum_of_rule_duties(catalog):
+    schedule = DutySchedule([
+        {"name": "mfn", "kind": "ad_valorem", "rate_column": "tariff_rate"},
+        {"name": "computers", "kind": "specific", "amount": 1.5, "hs_prefix": ["8471"]},
+    ])
+    priced = price_catalog(catalog, schedule)
+
+    duties = priced["duty_mfn_per_unit"] + priced["duty_computers_per_unit"]
+    np.testing.assert_allclose(priced["tariff_amount"], duties)
+    untaxed = price_catalog(catalog.assign(tariff_rate=0.0))
+    np.testing.assert_allclose(priced["landed_cost"], untaxed["landed_cost"] + duties)
+    # The default schedule is the plain ad valorem tariff
+    default = price_catalog(catalog, DutySchedule(DEFAULT_DUTY_RULES))
+    np.testing.assert_allclose(default["landed_cost"], price_catalog(catalog)["landed_cost"])
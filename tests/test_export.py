@@ -0,0 +1,30 @@
+import io
+
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import CatalogStore, export_frames
+
+FIRST = pd.DataFrame({"sku": [101, 102], "msrp": [10, 20], "note": ["a", "b"]})
+LATER = pd.DataFrame({"sku": ["SKU-X", "103"], "msrp": ["15.5", None], "note": [None, None]})
+
+def test_parquet_schema_takes_catalog_types_not_first_chunk():
+    import pyarrow.parquet as pq
+
+    buffer = io.BytesIO()
+    assert export_frames([FIRST, LATER], buffer, "parquet") == 4
+
+    table = pq.read_table(io.BytesIO(buffer.getvalue()))
+    assert str(table.schema.field("sku").type) == "string"
+    assert table.column("sku").to_pylist() == ["101", "102", "SKU-X", "103"]
+    assert table.column("msrp").to_pylist() == [10.0, 20.0, 15.5, None]
+
+def test_catalog_store_accepts_later_text_skus(tmp_path):
+    store = CatalogStore.build([FIRST, LATER], str(tmp_path / "catalog.arrow"))
+    assert store.read(["sku"])["sku"].tolist() == ["101", "102", "SKU-X", "103"]
+
+def test_other_columns_changing_type_fail_clearly():
+    first = FIRST.assign(count=[1, 2])
+    later = LATER.assign(count=["many", None])
+    with pytest.raises(ValueError, match="count"):
+        export_frames([first, later], io.BytesIO(), "parquet")
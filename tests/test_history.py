@@ -0,0 +1,45 @@
+import sqlite3
+
+from kaizenroi.tariffsight import CalculationHistory
+
+def _entry(i, sku=None, product=None):
+    return {"timestamp": f"2025-01-01 10:{i // 60:02d}:{i % 60:02d}", "product": product or f"Widget {i}",
+            "sku": sku or f"SKU-{i:04d}", "msrp": 100.0, "cost": 40.0, "tariff_rate": 25.0, "landed_cost": 55.0,
+            "profit": 45.0, "margin": 45.0, "currency": "USD"}
+
+def test_pages_are_newest_first_and_kept_per_analyst(tmp_path):
+    history = CalculationHistory(str(tmp_path / "history.db"))
+    for i in range(120):
+        history.append("alice", _entry(i))
+    history.append("bob", _entry(0))
+
+    assert history.count("alice") == 120
+    first, last = history.page("alice", 0, 50), history.page("alice", 2, 50)
+    assert first["sku"].tolist() == [f"SKU-{i:04d}" for i in range(119, 69, -1)]
+    assert len(last) == 20
+
+    history.clear("alice")
+    assert history.count("alice") == 0
+    assert history.count("bob") == 1
+
+def test_search_is_a_case_insensitive_prefix_with_literal_wildcards(tmp_path):
+    history = CalculationHistory(str(tmp_path / "history.db"))
+    for i, (sku, product) in enumerate([("AB-1", "Lamp"), ("ab-2", "Desk"), ("XAB", "Chair"), ("A%B", "Lamp Shade"),
+                                        ("A_C", "Rug")]):
+        history.append("alice", _entry(i, sku, product))
+
+    assert sorted(history.page("alice", search="ab")["sku"]) == ["AB-1", "ab-2"]
+    assert history.count("alice", "lamp") == 2
+    assert history.page("alice", search="A%")["sku"].tolist() == ["A%B"]
+    assert history.page("alice", search="A_")["sku"].tolist() == ["A_C"]
+
+def test_old_databases_gain_a_currency_column(tmp_path):
+    path = str(tmp_path / "history.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE calculations (id INTEGER PRIMARY KEY AUTOINCREMENT, analyst TEXT NOT NULL, "
+                     "timestamp TEXT NOT NULL, product TEXT NOT NULL, sku TEXT NOT NULL, msrp REAL NOT NULL, "
+                     "cost REAL NOT NULL, tariff_rate REAL NOT NULL, landed_cost REAL NOT NULL, profit REAL NOT NULL, "
+                     "margin REAL NOT NULL)")
+        conn.execute("INSERT INTO calculations VALUES (1, 'alice', '2024-01-01', 'Lamp', 'AB-1', 1, 1, 1, 1, 0, 0)")
+
+    assert CalculationHistory(path).page("alice")["currency"].tolist() == ["USD"]
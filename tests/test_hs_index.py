@@ -0,0 +1,63 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import TariffIndex, fill_catalog_tariffs, load_tariff_index
+from kaizenroi.tariffsight.hs_index import PREFIX_LEVELS
+
+SCHEDULE = pd.DataFrame({
+    "hs_code": ["8471.30", "8471.30.01", "8471.30.0100", "8517.62", "6109.10.00", "0101.21", "8471.30.01"],
+    "tariff_rate": [1.0, 2.0, 3.0, 4.0, 16.5, 0.0, 2.5],
+})
+
+def _reference(schedule_df, code):
+    """Longest matching prefix by a plain dictionary walk"""
+    rates = {re.sub(r"\D", "", c): r for c, r in zip(schedule_df["hs_code"], schedule_df["tariff_rate"])}
+    digits = re.sub(r"\D", "", code or "")[:max(PREFIX_LEVELS)]
+    for length in PREFIX_LEVELS:
+        if len(digits) >= length and digits[:length] in rates:
+            return rates[digits[:length]], length
+    return None, 0
+
+def test_lookup_many_matches_a_prefix_walk():
+    rng = np.random.default_rng(5)
+    index = TariffIndex.from_frame(SCHEDULE)
+    stems = ["8471300100", "8471300199", "8471309900", "8517620000", "6109100010", "0101210000", "9999999999"]
+    codes = [stem[:rng.choice([4, 6, 8, 10])] for stem in rng.choice(stems, 500)]
+    codes = [f"{c[:4]}.{c[4:6]}.{c[6:]}" if i % 3 == 0 else c for i, c in enumerate(codes)] + [None, "", "abc"]
+
+    rates, matched = index.lookup_many(codes)
+    for code, rate, length in zip(codes, rates, matched):
+        expected_rate, expected_length = _reference(SCHEDULE, code)
+        assert length == expected_length
+        assert (np.isnan(rate) and expected_rate is None) or rate == expected_rate
+    # Later schedule rows win for duplicate codes
+    assert index.lookup("8471.30.01.99") == (2.5, 8)
+    assert len(index) == 6
+
+def test_schedule_codes_must_have_a_known_length():
+    with pytest.raises(ValueError):
+        TariffIndex.from_frame(pd.DataFrame({"hs_code": ["8471.3"], "tariff_rate": [1.0]}))
+
+def test_fill_keeps_existing_rates_unless_overwriting():
+    catalog = pd.DataFrame({"hs_code": ["8471.30.01.00", "8517.62.00", "9999.99"], "tariff_rate": [7.0, np.nan, np.nan]})
+    index = TariffIndex.from_frame(SCHEDULE)
+
+    filled = fill_catalog_tariffs(catalog, index)
+    assert filled["tariff_rate"].tolist()[:2] == [7.0, 4.0]
+    assert np.isnan(filled["tariff_rate"].iloc[2])
+    assert filled["tariff_match_digits"].tolist() == [0, 6, 0]
+    assert fill_catalog_tariffs(catalog, index, overwrite=True)["tariff_rate"].tolist()[0] == 3.0
+
+def test_cache_is_rebuilt_when_the_schedule_changes(tmp_path):
+    path = tmp_path / "schedule.csv"
+    SCHEDULE.to_csv(path, index=False)
+    assert load_tariff_index(str(path)).lookup("8517.62") == (4.0, 6)
+    assert os.path.exists(f"{path}.idx.npz")
+
+    SCHEDULE.assign(tariff_rate=SCHEDULE["tariff_rate"] + 10).to_csv(path, index=False)
+    os.utime(path, ns=(0, 10**9))
+    assert load_tariff_index(str(path)).lookup("8517.62") == (14.0, 6)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import (
+    DEFAULT_DUTY_RULES,
+    DutySchedule,
+    calculate_landed_cost,
+    calculate_landed_cost_batch,
+    price_catalog,
+    solve_pricing_targets,
+)
+
+from .conftest import INPUT_COLUMNS
+
+def test_batch_matches_scalar_model(catalog):
+    rows = catalog[INPUT_COLUMNS].head(50)
+    batch = calculate_landed_cost_batch(*[rows[col].to_numpy() for col in INPUT_COLUMNS])
+    for i, row in enumerate(rows.itertuples(index=False)):
+        scalar = calculate_landed_cost(*row)
+        for key in ("landed_cost", "tariff_amount", "profit", "margin_percentage", "min_profitable_msrp"):
+            assert batch[key][i] == pytest.approx(scalar[key])
+        for name, value in scalar["cost_breakdown"].items():
+            assert batch["cost_breakdown"][name][i] == pytest.approx(value)
+
+def test_default_duty_rules_reproduce_the_plain_model(catalog):
+    plain = price_catalog(catalog)
+    stacked = price_catalog(catalog, DutySchedule(DEFAULT_DUTY_RULES))
+    np.testing.assert_allclose(stacked["landed_cost"], plain["landed_cost"])
+    np.testing.assert_allclose(stacked["duty_base_per_unit"], plain["tariff_amount"])
+
+def test_pricing_targets_hit_zero_profit_and_the_target_margin(catalog):
+    inputs = {col: catalog[col].to_numpy() for col in INPUT_COLUMNS}
+    solved = solve_pricing_targets(**inputs, target_margin=35.0)
+
+    at_breakeven = calculate_landed_cost_batch(**dict(inputs, tariff_rate=solved["breakeven_tariff"]))
+    np.testing.assert_allclose(at_breakeven["profit"], 0.0, atol=1e-8)
+    at_target = calculate_landed_cost_batch(**dict(inputs, msrp=solved["target_price"]))
+    np.testing.assert_allclose(at_target["margin_percentage"], 35.0)
@@ -0,0 +1,99 @@
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import ROUNDING_MODES, DutySchedule, ExactMoney, divide_rounded, price_catalog
+from kaizenroi.tariffsight.money import MAX_MINOR, RATE_SCALE
+
+from .conftest import INPUT_COLUMNS
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_divide_rounded_matches_decimal(rounding):
+    rng = np.random.default_rng(3)
+    numerators = rng.integers(-10**9, 10**9, 5000)
+    denominators = rng.integers(1, 1000, 5000)
+    # Exact ties and multiples, where rounding rules differ
+    numerators[:1000] = denominators[:1000] * rng.integers(-500, 500, 1000) + denominators[:1000] // 2
+    denominators[:1000] += denominators[:1000] % 2
+
+    expected = [int((Decimal(int(n)) / Decimal(int(d))).quantize(Decimal(1), rounding=rounding))
+                for n, d in zip(numerators, denominators)]
+    assert divide_rounded(numerators, denominators, rounding).tolist() == expected
+
+@pytest.mark.parametrize("rounding, cents", [(ROUND_HALF_EVEN, [12, 14, -12]), (ROUND_HALF_UP, [13, 14, -13])])
+def test_ties_round_by_rule(rounding, cents):
+    assert ExactMoney("cents", rounding).to_minor([0.125, 0.135, -0.125]).tolist() == cents
+
+def test_format_rounds_without_floats():
+    money = ExactMoney("millicents")
+    assert money.format(123_456_785) == "$1,234.57"
+    assert money.format(-500) == "$0.00"
+    assert ExactMoney().format(-123456, "CHF") == "-CHF 1,234.56"
+
+def test_exact_pricing_tracks_float_and_adds_up(catalog):
+    money = ExactMoney()
+    inputs = {col: catalog[col].to_numpy() for col in INPUT_COLUMNS}
+    exact = money.calculate_landed_cost(**inputs)
+
+    assert exact["valid"].all()
+    np.testing.assert_array_equal(exact["landed_cost"], sum(exact["cost_breakdown"].values()))
+    np.testing.assert_array_equal(exact["profit"], money.to_minor(inputs["msrp"]) - exact["landed_cost"])
+    # Each of the seven components is off by at most half a cent
+    floating = price_catalog(catalog)
+    np.testing.assert_allclose(money.to_amounts(exact)["landed_cost"], floating["landed_cost"], atol=0.035 + 1e-9)
+
+def test_exact_pricing_with_duty_schedule_and_no_tariff_rate(catalog):
+    schedule = DutySchedule([
+        {"name": "mfn", "kind": "ad_valorem", "rate": 4.5},
+        {"name": "section301", "kind": "ad_valorem", "rate": 25, "when": {"country_of_origin": "CN"}},
+        {"name": "mpf", "kind": "ad_valorem", "rate": 0.3464, "min": 31.67, "max": 614.35, "cap_basis": "shipment"},
+    ])
+    no_rate = catalog.drop(columns="tariff_rate")
+    floating = price_catalog(no_rate, schedule)
+    exact = price_catalog(no_rate, schedule, money=ExactMoney())
+
+    assert floating["landed_cost"].notna().all()
+    assert exact["landed_cost"].notna().all()
+    np.testing.assert_allclose(exact["landed_cost"], floating["landed_cost"], atol=0.05)
+    for name in schedule.names:
+        np.testing.assert_allclose(exact[f"duty_{name}_per_unit"], floating[f"duty_{name}_per_unit"], atol=0.005 + 1e-9)
+
+def test_missing_inputs_are_invalid_rows(catalog):
+    broken = catalog.head(5).copy()
+    broken.loc[broken.index[1], "msrp"] = np.nan
+    priced = price_catalog(broken, money=ExactMoney())
+    assert priced["landed_cost"].isna().tolist() == [False, True, False, False, False]
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_tariff_past_int64_product_is_exact(rounding):
+    money = ExactMoney("millicents", rounding)
+    # 1e11 milli-cents x 1e8 rate units is 1e19, past int64
+    result = money.calculate_landed_cost(2_000_000, 1_000_000, 100)
+    assert result["tariff_amount"] == 100_000_000_000
+    assert result["profit"] == 0
+
+    rng = np.random.default_rng(11)
+    costs = np.round(rng.uniform(-5e7, 5e7, 200), 5)
+    rates = np.round(rng.uniform(0, 400, 200), 6)
+    tariff = money.calculate_landed_cost(0, costs, rates)["tariff_amount"]
+    production = money.to_minor(costs).tolist()
+    rate_units = np.rint(rates * RATE_SCALE).astype(np.int64).tolist()
+    expected = [int((Decimal(p * r) / Decimal(100 * RATE_SCALE)).quantize(Decimal(1), rounding=rounding))
+                for p, r in zip(production, rate_units)]
+    assert tariff.tolist() == expected
+
+def test_min_profitable_msrp_near_int64_bound():
+    # landed * 101 would pass int64 here
+    result = ExactMoney("millicents").calculate_landed_cost(0, MAX_MINOR / 2 / 100_000, 0)
+    landed = int(result["landed_cost"])
+    assert landed > 2**63 // 101
+    assert result["min_profitable_msrp"] == landed + -(-landed // 100)
+
+def test_amounts_past_exact_range_raise():
+    money = ExactMoney("millicents")
+    with pytest.raises(OverflowError):
+        money.calculate_landed_cost(1e14, 10, 5)
+    with pytest.raises(OverflowError):
+        money.calculate_landed_cost(100, 5e12, 100_000)
+    assert money.total(np.full(64, MAX_MINOR / 100_000)) == 64 * MAX_MINOR
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import demand_at_price, optimize_catalog_prices, optimize_price, price_catalog
+
+MSRP = np.array([20.0, 50.0, 120.0, 9.99, 300.0])
+LANDED = np.array([12.0, 41.0, 60.0, 3.5, 280.0])
+ELASTICITY = np.array([1.5, 3.0, 2.2, 1.1, 8.0])
+
+def _grid_best(model, floor=0.0, ceiling=None):
+    """Best total profit per SKU over a fine price grid"""
+    best = np.full(len(MSRP), -np.inf)
+    for i in range(len(MSRP)):
+        top = ceiling[i] if ceiling is not None else MSRP[i] * 6
+        prices = np.linspace(max(floor, LANDED[i]), top, 200_001)
+        profit = (prices - LANDED[i]) * demand_at_price(prices, MSRP[i], 100.0, ELASTICITY[i], model)
+        best[i] = profit.max()
+    return best
+
+@pytest.mark.parametrize("model", ["constant", "linear"])
+def test_closed_form_price_beats_a_grid_search(model):
+    result = optimize_price(MSRP, LANDED, ELASTICITY, demand=100.0, demand_model=model)
+    assert np.all(result["expected_profit"] >= _grid_best(model) - 1e-3)
+
+def test_bounds_and_inelastic_demand():
+    ceiling = MSRP * 1.1
+    result = optimize_price(MSRP, LANDED, ELASTICITY, demand=100.0, price_ceiling=ceiling)
+    assert np.all(result["optimal_price"] <= ceiling)
+    assert np.all(result["expected_profit"] >= _grid_best("constant", ceiling=ceiling) - 1e-3)
+
+    inelastic = optimize_price(10.0, 5.0, 0.8)
+    assert np.isnan(inelastic["optimal_price"])
+    assert optimize_price(10.0, 5.0, 0.8, price_ceiling=14.0)["optimal_price"] == 14.0
+
+def test_charm_prices_end_in_the_charm_and_pick_the_better_side():
+    plain = optimize_price(MSRP, LANDED, ELASTICITY, demand=100.0)
+    charmed = optimize_price(MSRP, LANDED, ELASTICITY, demand=100.0, charm=0.99)
+    np.testing.assert_allclose(np.round(charmed["optimal_price"] % 1, 2), 0.99)
+    assert np.all(np.abs(charmed["optimal_price"] - plain["optimal_price"]) < 1)
+    for step in (-1, 1):
+        neighbour = optimize_price(MSRP, LANDED, ELASTICITY, demand=100.0, price_floor=charmed["optimal_price"] + step,
+                                   price_ceiling=charmed["optimal_price"] + step)
+        assert np.all(charmed["expected_profit"] >= neighbour["expected_profit"] - 1e-9)
+
+def test_catalog_prices_use_the_model_landed_cost(catalog):
+    elastic = catalog.assign(elasticity=2.5)
+    optimized = optimize_catalog_prices(elastic)
+    expected = optimize_price(catalog["msrp"], price_catalog(catalog)["landed_cost"], 2.5)
+    np.testing.assert_allclose(optimized["optimal_price"], expected["optimal_price"])
+    with pytest.raises(ValueError):
+        optimize_catalog_prices(catalog)
@@ -0,0 +1,45 @@
+import json
+from unittest import mock
+
+from kaizenroi.profiling import Profiler
+
+def _log(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_fragment_rerun_records_its_inner_spans(tmp_path):
+    log_path = tmp_path / "profile.jsonl"
+    profiler = Profiler("app", enabled=True, log_path=str(log_path))
+    with profiler.fragment_span("tab"):
+        with profiler.span("compute"):
+            pass
+    profiler.finish()
+
+    # After the full rerun has finished, the fragment reruns alone
+    st = mock.MagicMock()
+    with profiler.fragment_span("tab", st):
+        with profiler.span("compute"):
+            pass
+        with profiler.fragment_span("nested fragment"):
+            with profiler.span("inner"):
+                pass
+    with profiler.span("after the fragment"):
+        pass
+
+    full, fragment = _log(log_path)
+    assert [span["name"] for span in full["spans"]] == ["tab", "compute"]
+    assert fragment["app"] == "app:tab"
+    assert [(span["name"], span["depth"]) for span in fragment["spans"]] == [
+        ("tab", 0), ("compute", 1), ("nested fragment", 1), ("inner", 2)
+    ]
+    assert len(profiler.spans) == 2
+    st.expander.assert_called_once()
+    st.sidebar.expander.assert_not_called()
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    log_path = tmp_path / "profile.jsonl"
+    profiler = Profiler("app", enabled=False, log_path=str(log_path))
+    with profiler.fragment_span("tab", mock.MagicMock()):
+        with profiler.span("compute"):
+            pass
+    profiler.finish()
+    assert profiler.spans == [] and not log_path.exists()
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from kaizenroi.tariffsight import PortfolioRollup, price_catalog
+
+def test_rollup_in_chunks_matches_a_groupby(catalog):
+    priced = price_catalog(catalog)
+    rollup = PortfolioRollup()
+    for start in range(0, len(priced), 97):
+        rollup.add(priced.iloc[start:start + 97])
+
+    units = priced["units_per_shipment"]
+    expected = pd.DataFrame({
+        "country_of_origin": priced["country_of_origin"],
+        "total_duty": priced["tariff_amount"] * units,
+        "total_profit": priced["profit"] * units,
+    }).groupby("country_of_origin").sum()
+    totals = rollup.totals("country_of_origin").set_index("country_of_origin").loc[expected.index]
+    np.testing.assert_allclose(totals["total_duty"], expected["total_duty"])
+    np.testing.assert_allclose(totals["total_profit"], expected["total_profit"])
+    assert rollup.overall()["skus"] == len(priced)
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import (
+    SENSITIVITY_INPUTS,
+    SensitivityTornado,
+    calculate_landed_cost_batch,
+    catalog_sensitivity,
+    landed_cost_sensitivity,
+    price_catalog,
+)
+
+from .conftest import INPUT_COLUMNS
+
+SWING = 15
+
+def _inputs(catalog):
+    return {col: catalog[col].to_numpy() for col in INPUT_COLUMNS}
+
+def _rerun(inputs, name, factor):
+    return calculate_landed_cost_batch(**dict(inputs, **{name: inputs[name] * factor}))
+
+def test_swings_match_rerunning_the_model(catalog):
+    inputs = _inputs(catalog)
+    result = landed_cost_sensitivity(**inputs, swing_pct=SWING)
+    np.testing.assert_allclose(result["profit"], calculate_landed_cost_batch(**inputs)["profit"])
+    for name in SENSITIVITY_INPUTS:
+        low, high = _rerun(inputs, name, 1 - SWING / 100), _rerun(inputs, name, 1 + SWING / 100)
+        np.testing.assert_allclose(result["profit_low"][name], low["profit"], atol=1e-9)
+        np.testing.assert_allclose(result["profit_high"][name], high["profit"], atol=1e-9)
+        np.testing.assert_allclose(result["margin_high"][name], high["margin_percentage"], atol=1e-9)
+
+def test_derivatives_match_finite_differences(catalog):
+    inputs = _inputs(catalog)
+    result = landed_cost_sensitivity(**inputs)
+    step = 1e-4
+    for name in SENSITIVITY_INPUTS:
+        h = np.maximum(np.abs(inputs[name]), 1.0) * step
+        up = calculate_landed_cost_batch(**dict(inputs, **{name: inputs[name] + h}))["profit"]
+        down = calculate_landed_cost_batch(**dict(inputs, **{name: inputs[name] - h}))["profit"]
+        np.testing.assert_allclose(result["profit_derivative"][name], (up - down) / (2 * h), rtol=1e-4, atol=1e-7)
+
+def test_top_driver_is_the_widest_swing(catalog):
+    ranked = catalog_sensitivity(catalog, swing_pct=SWING)
+    swings = ranked[[f"{name}_profit_swing" for name in SENSITIVITY_INPUTS]].to_numpy()
+    assert ranked["top_driver"].tolist() == [SENSITIVITY_INPUTS[i] for i in swings.argmax(axis=1)]
+
+def test_tornado_matches_portfolio_reruns_in_any_chunking(catalog):
+    inputs = _inputs(catalog)
+    units = inputs["units_per_shipment"]
+    whole = SensitivityTornado(SWING)
+    whole.add(catalog)
+    chunked = SensitivityTornado(SWING)
+    for start in range(0, len(catalog), 128):
+        chunked.add(price_catalog(catalog.iloc[start:start + 128]))
+
+    table = whole.table().set_index("input")
+    for name in SENSITIVITY_INPUTS:
+        assert table.loc[name, "profit_low"] == pytest.approx((units * _rerun(inputs, name, 1 - SWING / 100)["profit"]).sum())
+        assert table.loc[name, "profit_high"] == pytest.approx((units * _rerun(inputs, name, 1 + SWING / 100)["profit"]).sum())
+    pd.testing.assert_frame_equal(whole.table(), chunked.table())
+    assert whole.overall()["total_profit"] == pytest.approx((units * calculate_landed_cost_batch(**inputs)["profit"]).sum())
+
+def test_swing_must_be_a_percentage():
+    with pytest.raises(ValueError):
+        landed_cost_sensitivity(10, 5, 0, swing_pct=100)
+    with pytest.raises(ValueError):
+        SensitivityTornado(0)
+
+def test_tornado_leaves_out_rows_with_a_missing_input(catalog):
+    broken = catalog.copy()
+    broken.loc[:4, "msrp"] = np.nan
+    broken.loc[5:9, "shipping_cost"] = np.nan
+    with_gaps = SensitivityTornado(SWING)
+    with_gaps.add(broken)
+    clean = SensitivityTornado(SWING)
+    clean.add(catalog.iloc[10:])
+
+    assert with_gaps.overall() == pytest.approx(clean.overall())
+    pd.testing.assert_frame_equal(with_gaps.table(), clean.table())
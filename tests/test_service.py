@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from kaizenroi.tariffsight import PricingService, calculate_landed_cost, load_test
+from kaizenroi.tariffsight import service as service_module
+from kaizenroi.tariffsight.service import _client_request
+
+ITEMS = [
+    {"id": f"line-{i}", "msrp": 100.0 + i, "cost_to_produce": 40.0, "tariff_rate": 5.0 * i, "shipping_cost": 900.0,
+     "units_per_shipment": 300}
+    for i in range(20)
+]
+
+def _run_with_service(scenario, **options):
+    async def main():
+        service = PricingService(port=0, **options)
+        await service.start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+
+    return asyncio.run(main())
+
+async def _request(service, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(service.host, service.port)
+    try:
+        return await _client_request(reader, writer, service.host, method, path, payload)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+def test_concurrent_single_items_are_coalesced_and_match_the_model():
+    async def scenario(service):
+        responses = await asyncio.gather(*[_request(service, "POST", "/price", item) for item in ITEMS])
+        return responses, service.stats()
+
+    responses, stats = _run_with_service(scenario, batch_window=0.05)
+    for item, (status, result) in zip(ITEMS, responses):
+        expected = calculate_landed_cost(**{key: value for key, value in item.items() if key != "id"})
+        assert status == 200
+        assert result["id"] == item["id"]
+        assert result["landed_cost"] == pytest.approx(expected["landed_cost"])
+        assert result["profit"] == pytest.approx(expected["profit"])
+        assert result["cost_breakdown"]["shipping"] == pytest.approx(3.0)
+    assert stats["requests"]["price"] == len(ITEMS)
+    assert stats["batches"] < len(ITEMS)
+
+def test_invalid_items_get_400_and_keep_the_connection():
+    async def scenario(service):
+        reader, writer = await asyncio.open_connection(service.host, service.port)
+        try:
+            responses = []
+            for payload in (dict(ITEMS[0], msrp=10 ** 400), dict(ITEMS[0], msrp="12"), {"msrp": 10.0}, ITEMS[0]):
+                responses.append(await _client_request(reader, writer, service.host, "POST", "/price", payload))
+            return responses
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    responses = _run_with_service(scenario)
+    assert [status for status, _ in responses] == [400, 400, 400, 200]
+    assert "msrp must be a finite number" in responses[0][1]["error"]
+    assert "missing cost_to_produce" in responses[2][1]["error"]
+
+def test_batch_endpoint_prices_every_item():
+    async def scenario(service):
+        return await _request(service, "POST", "/price/batch", {"items": ITEMS})
+
+    status, body = _run_with_service(scenario)
+    assert status == 200
+    assert [result["id"] for result in body["results"]] == [item["id"] for item in ITEMS]
+
+def test_load_test_counts_the_items_it_sends():
+    async def scenario(service):
+        return await load_test(service.host, service.port, requests=2, concurrency=1, batch_size=2500)
+
+    report = _run_with_service(scenario)
+    assert report["errors"] == 0
+    assert report["items"] == 5000
+    assert report["server"]["batched_items"] == 5000
+
+def test_results_past_the_float_limit_get_422():
+    async def scenario(service):
+        huge = dict(ITEMS[0], msrp=1e308, cost_to_produce=1e308, tariff_rate=100.0)
+        single = await _request(service, "POST", "/price", huge)
+        batch = await _request(service, "POST", "/price/batch", [ITEMS[0], huge])
+        return single, batch
+
+    (single_status, single), (batch_status, batch) = _run_with_service(scenario)
+    assert single_status == batch_status == 422
+    assert batch["error"].startswith("Item 1:")
+
+def test_failed_batch_answers_500_instead_of_hanging(monkeypatch):
+    def fail(items, rows):
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(service_module, "_price_items", fail)
+
+    async def scenario(service):
+        requests = [_request(service, "POST", "/price", item) for item in ITEMS[:3]]
+        return await asyncio.wait_for(asyncio.gather(*requests), 5)
+
+    responses = _run_with_service(scenario)
+    assert [status for status, _ in responses] == [500, 500, 500]
+    assert "model unavailable" in responses[0][1]["error"]
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import optimize_shipment_size, shipment_unit_cost
+
+@pytest.mark.parametrize("capacity, holding", [(np.inf, 0.4), (90.0, 0.05), (250.0, 2.0)])
+def test_shipment_size_matches_exhaustive_search(capacity, holding):
+    args = dict(cost_to_produce=np.array([12.0, 80.0, 3.0]), tariff_rate=np.array([25.0, 7.5, 0.0]),
+                shipping_cost=np.array([900.0, 2500.0, 300.0]), customs_fee=250.0, demand_per_period=np.array([40.0, 55.0, 25.0]),
+                holding_cost=holding, container_capacity=capacity)
+    result = optimize_shipment_size(**args, max_periods=12)
+
+    for i in range(3):
+        units = np.arange(1, result["max_units"][i] + 1)
+        costs = shipment_unit_cost(units, args["cost_to_produce"][i], args["tariff_rate"][i], args["shipping_cost"][i],
+                                   0.0, 250.0, 0.0, 0.0, args["demand_per_period"][i], holding, capacity)
+        assert result["landed_cost"][i] == pytest.approx(costs.min())
+
+def test_high_demand_sku_finds_optimum_past_many_containers():
+    # The best size, about 15,800 units, is some 1,600 containers of 10 units
+    args = dict(cost_to_produce=np.array([12.0, 5.0]), tariff_rate=np.array([25.0, 10.0]),
+                shipping_cost=np.array([900.0, 40.0]), customs_fee=250.0, demand_per_period=np.array([5000.0, 20000.0]),
+                holding_cost=np.array([0.01, 0.002]), container_capacity=np.array([10.0, 7.0]))
+    result = optimize_shipment_size(**args, max_periods=12)
+
+    for i in range(2):
+        units = np.arange(1, result["max_units"][i] + 1)
+        costs = shipment_unit_cost(units, args["cost_to_produce"][i], args["tariff_rate"][i], args["shipping_cost"][i],
+                                   0.0, 250.0, 0.0, 0.0, args["demand_per_period"][i], args["holding_cost"][i],
+                                   args["container_capacity"][i])
+        assert result["landed_cost"][i] == pytest.approx(costs.min(), rel=1e-12)
+        assert result["recommended_units"][i] > 64 * args["container_capacity"][i]
+
+def test_random_skus_match_exhaustive_search():
+    rng = np.random.default_rng(4)
+    n = 40
+    args = dict(cost_to_produce=rng.uniform(1, 100, n), tariff_rate=rng.choice([0.0, 7.5, 25.0], n),
+                shipping_cost=rng.uniform(0, 3000, n), storage_cost=rng.uniform(0, 300, n), customs_fee=250.0,
+                broker_fee=0.0, other_costs=0.0, demand_per_period=rng.uniform(1, 400, n),
+                holding_cost=rng.choice([0.0, 0.05, 0.5, 5.0], n),
+                container_capacity=rng.choice([np.inf, 1.0, 3.0, 17.0, 250.0], n))
+    result = optimize_shipment_size(**args, max_periods=12)
+
+    for i in range(n):
+        units = np.arange(1, result["max_units"][i] + 1)
+        costs = shipment_unit_cost(units, *[value[i] if np.ndim(value) else value for value in args.values()])
+        assert result["landed_cost"][i] == pytest.approx(costs.min(), rel=1e-12)
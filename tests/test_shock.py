@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import ShockBaseline, price_catalog
+
+def _reprice(catalog, mask, rate=None, change=None):
+    shocked = catalog.copy()
+    rates = shocked["tariff_rate"].to_numpy(copy=True)
+    rates[mask] = rate if rate is not None else np.maximum(rates[mask] + change, 0.0)
+    shocked["tariff_rate"] = rates
+    return price_catalog(shocked)
+
+@pytest.mark.parametrize("where, rate, change", [
+    ({"country_of_origin": "CN"}, 60.0, None),
+    ({"hs_chapter": "84"}, None, 10.0),
+    ({"country_of_origin": ["CN", "VN"], "category": "Electronics"}, None, -30.0),
+    ({"sku": "SKU-00042"}, 0.0, None),
+])
+def test_shock_matches_full_reprice(catalog, where, rate, change):
+    baseline_df = price_catalog(catalog)
+    deltas, summary = ShockBaseline(baseline_df).shock(where, rate=rate, change=change)
+
+    mask = np.ones(len(catalog), dtype=bool)
+    for dim, values in where.items():
+        values = values if isinstance(values, list) else [values]
+        column = catalog["hs_code"].str[:2] if dim == "hs_chapter" else catalog[dim]
+        mask &= column.isin(values).to_numpy()
+    repriced = _reprice(catalog, mask, rate, change)
+
+    assert deltas.index.tolist() == np.flatnonzero(mask).tolist()
+    rows = deltas.index.to_numpy()
+    np.testing.assert_allclose(deltas["new_landed_cost"], repriced["landed_cost"].to_numpy()[rows], atol=1e-9)
+    np.testing.assert_allclose(deltas["new_tariff_amount"], repriced["tariff_amount"].to_numpy()[rows], atol=1e-9)
+    np.testing.assert_allclose(deltas["new_margin"], repriced["margin_percentage"].to_numpy()[rows], atol=1e-9)
+
+    units = catalog["units_per_shipment"].to_numpy()
+    profit_change = units * (repriced["profit"] - baseline_df["profit"]).to_numpy()
+    assert summary["affected_rows"] == mask.sum()
+    assert summary["total_profit_delta"] == pytest.approx(profit_change.sum())
+    old_loss, new_loss = baseline_df["profit"].to_numpy() < 0, repriced["profit"].to_numpy() < 0
+    assert summary["newly_unprofitable"] == int((~old_loss & new_loss).sum())
+
+def test_shock_from_priced_csv(tmp_path, catalog):
+    path = tmp_path / "priced.csv"
+    price_catalog(catalog.assign(sku=[f"{i:05d}" for i in range(len(catalog))])).to_csv(path, index=False)
+    baseline = ShockBaseline.from_csv(path)
+    deltas, _ = baseline.shock({"sku": "00042"}, rate=10.0)
+    assert deltas["sku"].tolist() == ["00042"]
+
+def test_shock_needs_one_of_rate_or_change(catalog):
+    baseline = ShockBaseline(price_catalog(catalog))
+    with pytest.raises(ValueError):
+        baseline.shock({"country_of_origin": "CN"})
+    with pytest.raises(ValueError):
+        baseline.shock({"supplier": "Acme"}, rate=1.0, change=1.0)
+
+def test_groups_count_rows_and_unknown_dimensions_are_rejected(catalog):
+    baseline = ShockBaseline(price_catalog(catalog).drop(columns="supplier"))
+    groups = baseline.groups("country_of_origin")
+    assert groups.to_dict() == catalog["country_of_origin"].value_counts().to_dict()
+    assert groups.is_monotonic_decreasing
+    assert baseline.groups("hs_chapter").to_dict() == catalog["hs_code"].str[:2].value_counts().to_dict()
+    assert baseline.select({}).tolist() == list(range(len(catalog)))
+    with pytest.raises(ValueError):
+        baseline.select({"supplier": "Acme"})
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from kaizenroi.tariffsight import calculate_landed_cost, simulate_landed_cost, spread_distribution
+
+FIXED = dict(msrp=100.0, cost_to_produce=40.0, tariff_rate=25.0, shipping_cost=900.0, customs_fee=250.0,
+             units_per_shipment=100)
+
+def test_fixed_inputs_give_the_model_result():
+    result = simulate_landed_cost(**FIXED, draws=1000)
+    expected = calculate_landed_cost(**FIXED)
+    np.testing.assert_allclose(result["profit_percentiles"], expected["profit"], rtol=1e-6)
+    assert result["probability_of_loss"] == 0.0
+    assert result["std_profit"] == pytest.approx(0.0, abs=1e-4)
+
+def test_uniform_cost_matches_the_analytic_distribution():
+    # Profit is linear in cost: 100 - 1.25 * cost - 11.5, with cost uniform on [50, 90]
+    result = simulate_landed_cost(**dict(FIXED, cost_to_produce=("uniform", 50.0, 90.0)), draws=400_000,
+                                  chunk_draws=50_000, seed=3)
+    assert result["mean_profit"] == pytest.approx(88.5 - 1.25 * 70, abs=0.05)
+    assert result["std_profit"] == pytest.approx(1.25 * 40 / np.sqrt(12), rel=0.01)
+    # Loss once cost passes 70.8
+    assert result["probability_of_loss"] == pytest.approx((90 - 70.8) / 40, abs=0.005)
+    counts, edges = result["profit_histogram"]
+    assert counts.sum() == 400_000
+    assert edges[0] == pytest.approx(88.5 - 1.25 * 90, abs=0.01)
+
+def test_results_do_not_depend_on_worker_count():
+    inputs = dict(FIXED, tariff_rate=spread_distribution("Triangular", 25.0, 40),
+                  shipping_cost=spread_distribution("Normal", 900.0, 20))
+    single = simulate_landed_cost(**inputs, draws=20_000, chunk_draws=5000, seed=9)
+    pooled = simulate_landed_cost(**inputs, draws=20_000, chunk_draws=5000, seed=9, workers=2)
+    np.testing.assert_array_equal(single["profit_percentiles"], pooled["profit_percentiles"])
+    assert single["mean_margin"] == pooled["mean_margin"]
+
+def test_spread_distributions_and_unknown_kinds():
+    assert spread_distribution("Uniform", 40.0, 10) == ("uniform", 36.0, 44.0)
+    assert spread_distribution("Fixed", 40.0, 10) == ("fixed", 40.0)
+    with pytest.raises(ValueError):
+        simulate_landed_cost(**dict(FIXED, msrp=("lognormal", 1.0, 2.0)), draws=10)
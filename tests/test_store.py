@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import CatalogStore, open_catalog_store
+
+from .conftest import make_catalog
+
+def _build(tmp_path, catalog, chunk_rows=128):
+    path = str(tmp_path / "catalog.arrow")
+    frames = (catalog.iloc[start:start + chunk_rows] for start in range(0, len(catalog), chunk_rows))
+    return CatalogStore.build(frames, path), path
+
+def test_projected_reads_match_the_catalog(tmp_path):
+    catalog = make_catalog(1000)
+    catalog.loc[5, "shipping_cost"] = np.nan
+    store, _ = _build(tmp_path, catalog)
+    assert store.rows == 1000
+
+    pd.testing.assert_frame_equal(store.read(), catalog, check_dtype=False)
+    window = store.read(["sku", "msrp"], 100, 300)
+    pd.testing.assert_frame_equal(window, catalog.loc[100:299, ["sku", "msrp"]], check_dtype=False)
+    np.testing.assert_array_equal(store.column("msrp", 130, 250), catalog["msrp"].to_numpy()[130:250])
+    np.testing.assert_array_equal(store.column("shipping_cost"), catalog["shipping_cost"].to_numpy())
+    with pytest.raises(ValueError):
+        store.read(["no_such_column"])
+
+def test_chunks_cover_every_row_once(tmp_path):
+    catalog = make_catalog(1000)
+    store, _ = _build(tmp_path, catalog)
+    chunks = list(store.iter_chunks(["sku"], chunk_rows=100))
+    assert pd.concat([chunk for chunk, _ in chunks])["sku"].tolist() == catalog["sku"].tolist()
+    assert all(len(chunk) <= 100 for chunk, _ in chunks)
+    assert chunks[-1][1] == 1.0
+
+def test_open_reuses_the_store_until_it_is_rebuilt(tmp_path):
+    store, path = _build(tmp_path, make_catalog(300))
+    assert open_catalog_store(path) is open_catalog_store(path)
+
+    CatalogStore.build([make_catalog(50)], path)
+    assert open_catalog_store(path).rows == 50
+    assert store.read(["sku"]).shape == (300, 1)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import SWEEP_COLUMNS, calculate_landed_cost_batch, sweep_catalog, sweep_scenario_skus
+from kaizenroi.tariffsight.cli import main
+
+from .conftest import INPUT_COLUMNS
+
+TARIFF_RATES = np.linspace(0, 100, 7)
+PRICE_FACTORS = np.linspace(0.7, 1.3, 9)
+
+def _brute_force(catalog):
+    inputs = {col: catalog[col].to_numpy() for col in INPUT_COLUMNS}
+    units = inputs["units_per_shipment"]
+    rows = []
+    for rate in TARIFF_RATES:
+        for factor in PRICE_FACTORS:
+            msrp = inputs["msrp"] * factor
+            result = calculate_landed_cost_batch(**dict(inputs, tariff_rate=rate, msrp=msrp))
+            profit = units * result["profit"]
+            revenue = (units * msrp).sum()
+            rows.append({
+                "tariff_rate": rate,
+                "price_factor": factor,
+                "total_revenue": revenue,
+                "total_tariff": (units * result["tariff_amount"]).sum(),
+                "total_landed_cost": (units * result["landed_cost"]).sum(),
+                "total_profit": profit.sum(),
+                "weighted_margin": profit.sum() / revenue * 100,
+                "unprofitable_skus": int((result["profit"] < 0).sum()),
+                "unprofitable_loss": -profit[result["profit"] < 0].sum(),
+            })
+    return pd.DataFrame(rows, columns=SWEEP_COLUMNS)
+
+def test_sweep_matches_brute_force(catalog):
+    swept = sweep_catalog(catalog, TARIFF_RATES, PRICE_FACTORS)
+    pd.testing.assert_frame_equal(swept, _brute_force(catalog), check_dtype=False, rtol=1e-9)
+
+def test_sweep_is_identical_for_any_worker_count(catalog):
+    single = sweep_catalog(catalog, TARIFF_RATES, PRICE_FACTORS, workers=1)
+    pooled = sweep_catalog(catalog, TARIFF_RATES, PRICE_FACTORS, workers=2)
+    pd.testing.assert_frame_equal(single, pooled, check_exact=True)
+
+def test_sweep_leaves_out_rows_without_a_price(catalog):
+    broken = catalog.copy()
+    broken.loc[:9, "msrp"] = np.nan
+    broken.loc[10:19, "msrp"] = 0.0
+    swept = sweep_catalog(broken, TARIFF_RATES, PRICE_FACTORS)
+    expected = sweep_catalog(catalog.iloc[20:], TARIFF_RATES, PRICE_FACTORS)
+    pd.testing.assert_frame_equal(swept, expected)
+
+def test_scenario_skus_add_up_to_the_sweep_row(catalog):
+    broken = catalog.copy()
+    broken.loc[:9, "msrp"] = np.nan
+    broken.loc[10:19, "msrp"] = 0.0
+    rate, factor = TARIFF_RATES[3], PRICE_FACTORS[2]
+    row = sweep_catalog(broken, [rate], [factor]).iloc[0]
+    skus = sweep_scenario_skus(broken, rate, factor)
+
+    counted = skus[skus["in_sweep"]]
+    assert len(counted) == len(catalog) - 20
+    np.testing.assert_allclose(counted["msrp"], counted["base_msrp"] * factor)
+    assert (counted["units_per_shipment"] * counted["profit"]).sum() == pytest.approx(row["total_profit"])
+    assert (counted["units_per_shipment"] * counted["tariff_amount"]).sum() == pytest.approx(row["total_tariff"])
+    assert int((counted["profit"] < 0).sum()) == row["unprofitable_skus"]
+
+def test_sweep_command_writes_the_chosen_scenario(tmp_path, catalog):
+    source, skus = tmp_path / "catalog.csv", tmp_path / "skus.csv"
+    catalog.to_csv(source, index=False)
+    args = ["sweep-catalog", str(source), "--tariff-steps", "3", "--factor-steps", "3", "--workers", "1",
+            "-o", str(tmp_path / "sweep.csv")]
+    assert main(args + ["--sku-scenario", "25", "1.1", "--sku-output", str(skus)]) == 0
+    written = pd.read_csv(skus)
+    np.testing.assert_allclose(written["landed_cost"], sweep_scenario_skus(catalog, 25, 1.1)["landed_cost"])
+    assert main(args + ["--sku-output", str(skus)]) == 1
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kaizenroi.tariffsight import TariffTimeline, apply_tariff_timeline, reprice_history
+
+def _random_timeline(rng, keys=40):
+    rows = []
+    for key in [f"SKU-{i:03d}" for i in range(keys)] + ["*"]:
+        # Consecutive intervals with gaps, some open-ended, some before 1970
+        day = np.datetime64("1965-01-01") + int(rng.integers(0, 3000))
+        for _ in range(int(rng.integers(1, 6))):
+            length = int(rng.integers(1, 4000))
+            end = day + length if rng.random() < 0.7 else None
+            rows.append({"sku": key, "effective_from": str(day), "effective_to": str(end) if end is not None else None,
+                         "tariff_rate": float(rng.integers(0, 100))})
+            if end is None:
+                break
+            day = end + int(rng.integers(0, 200))
+    return pd.DataFrame(rows).sample(frac=1, random_state=1)
+
+def _reference(timeline_df, key, date):
+    """The rate of the interval covering date by a direct scan, an open end running to the key's next start"""
+
+    def covering(k):
+        intervals = timeline_df[timeline_df["sku"] == k].sort_values("effective_from")
+        starts = pd.to_datetime(intervals["effective_from"]).tolist()
+        for i, (start, end, rate) in enumerate(zip(starts, intervals["effective_to"], intervals["tariff_rate"])):
+            end = pd.Timestamp(end) if not pd.isna(end) else (starts[i + 1] if i + 1 < len(starts) else pd.Timestamp.max)
+            if start <= date < end:
+                return rate
+        return None
+
+    rate = covering(key)
+    return covering("*") if rate is None else rate
+
+def test_rates_at_matches_a_direct_scan():
+    rng = np.random.default_rng(2)
+    timeline_df = _random_timeline(rng)
+    timeline = TariffTimeline.from_frame(timeline_df)
+
+    keys = rng.choice([f"SKU-{i:03d}" for i in range(45)], 600)
+    dates = np.datetime64("1964-06-01") + rng.integers(0, 25_000, 600)
+    rates = timeline.rates_at(keys, dates)
+    for key, date, rate in zip(keys, dates, rates):
+        expected = _reference(timeline_df, key, pd.Timestamp(date))
+        assert (np.isnan(rate) and expected is None) or rate == expected
+
+def test_overlapping_or_empty_intervals_are_rejected():
+    frame = pd.DataFrame({"sku": ["A", "A"], "effective_from": ["2024-01-01", "2024-03-01"],
+                          "effective_to": ["2024-06-01", None], "tariff_rate": [10.0, 25.0]})
+    with pytest.raises(ValueError, match="overlap"):
+        TariffTimeline.from_frame(frame)
+    with pytest.raises(ValueError, match="ends on or before"):
+        TariffTimeline.from_frame(frame.assign(effective_to=["2024-01-01", None]))
+
+def test_apply_and_reprice_use_the_rate_on_each_date():
+    timeline = TariffTimeline.from_frame(pd.DataFrame({
+        "sku": ["A", "A", "*"], "effective_from": ["2024-01-01", "2025-01-01", "2020-01-01"],
+        "tariff_rate": [10.0, 25.0, 5.0],
+    }))
+    catalog = pd.DataFrame({"sku": ["A", "A", "B", "A"], "arrival_date": ["2024-06-01", "2025-02-01", "2024-06-01", None],
+                            "tariff_rate": [np.nan, np.nan, np.nan, 7.0]})
+    assert apply_tariff_timeline(catalog, timeline)["tariff_rate"].tolist() == [10.0, 25.0, 5.0, 7.0]
+    assert np.isnan(apply_tariff_timeline(catalog, timeline, overwrite=True)["tariff_rate"].iloc[3])
+
+    history = pd.DataFrame({"sku": ["A"], "timestamp": ["2025-03-01 10:00:00"], "msrp": [100.0], "cost": [40.0],
+                            "tariff_rate": [10.0], "landed_cost": [60.0]})
+    repriced = reprice_history(history, timeline)
+    assert repriced["schedule_rate"].tolist() == [25.0]
+    assert repriced["repriced_landed_cost"].tolist() == pytest.approx([66.0])
+    assert repriced["repriced_margin"].tolist() == pytest.approx([34.0])